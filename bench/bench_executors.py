@@ -0,0 +1,74 @@
+"""Benchmark the fitness evaluation backends (``ga.executor``).
+
+Times one generation's worth of evaluations for every combination of
+executor, population size and canvas size, after a warm-up round that starts
+the workers. Run from the repository root:
+
+    python -m bench.bench_executors --pop-sizes 50 200 --canvas 100x75 300x200
+"""
+from __future__ import annotations
+
+import argparse
+import time
+from typing import List, Tuple
+
+import numpy as np
+
+from src.engine.evaluation import build_evaluator
+from src.engine.renderers import build_renderer
+from src.models.individual import Individual
+from src.models.population import PopulationArray
+from src.models.triangle import GENE_SIZE
+from src.strategies.fitness.PixelMSEFitness import PixelMSEFitness
+
+
+def _random_population(pop_size: int, num_triangles: int, rng: np.random.Generator) -> List[Individual]:
+    genes = rng.random((pop_size, num_triangles, GENE_SIZE), dtype=np.float32)
+    genes[..., 6:10] = rng.integers(0, 256, (pop_size, num_triangles, 4))
+    return PopulationArray.from_genes(genes).members
+
+
+def _canvas(value: str) -> Tuple[int, int]:
+    width, height = value.lower().split("x")
+    return int(width), int(height)
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--executors", nargs="+", default=["serial", "thread", "process"])
+    ap.add_argument("--pop-sizes", nargs="+", type=int, default=[50, 200])
+    ap.add_argument("--canvas", nargs="+", type=_canvas, default=[(100, 75), (300, 200)])
+    ap.add_argument("--triangles", type=int, default=50)
+    ap.add_argument("--backend", default="pillow")
+    ap.add_argument("--workers", type=int, default=None)
+    ap.add_argument("--rounds", type=int, default=3)
+    ap.add_argument("--seed", type=int, default=0)
+    args = ap.parse_args()
+
+    print("| executor | pop | canvas | s/generation | individuals/s | compute s | dispatch s |")
+    print("|----------|-----|--------|--------------|---------------|-----------|------------|")
+    for width, height in args.canvas:
+        rng = np.random.default_rng(args.seed)
+        renderer = build_renderer(args.backend, {"width": width, "height": height})
+        target = renderer.render(_random_population(1, args.triangles, rng)[0].genes)
+        fitness = PixelMSEFitness(renderer=renderer, target=target)
+        for pop_size in args.pop_sizes:
+            population = _random_population(pop_size, args.triangles, rng)
+            for name in args.executors:
+                params = {"fitness": fitness, "max_workers": args.workers}
+                with build_evaluator(name, params) as evaluator:
+                    evaluator.evaluate(population)  # warm-up: worker start-up, first chunk estimate
+                    evaluator.take_stats()
+                    start = time.perf_counter()
+                    for _ in range(args.rounds):
+                        evaluator.evaluate(population)
+                    per_gen = (time.perf_counter() - start) / args.rounds
+                    stats = evaluator.take_stats()
+                print(
+                    f"| {name} | {pop_size} | {width}x{height} | {per_gen:.4f} | {pop_size / per_gen:.1f} "
+                    f"| {stats.compute_time / args.rounds:.4f} | {stats.dispatch_time / args.rounds:.4f} |"
+                )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""Benchmark per-individual fitness scoring: time and bytes allocated.
+
+Renders a population once, then times ``evaluate`` with the renderer replaced
+by a lookup of those renders, so only the scoring itself is measured. Peak
+bytes allocated per evaluation are traced with ``tracemalloc`` (NumPy reports
+its buffers to it) after a warm-up call. Run from the repository root:
+
+    python -m bench.bench_fitness --canvas 300x200 600x400
+"""
+from __future__ import annotations
+
+import argparse
+import dataclasses
+import time
+import tracemalloc
+from dataclasses import dataclass
+from typing import Dict, List
+
+import numpy as np
+
+from bench.bench_executors import _canvas, _random_population
+from src.engine.renderers import build_renderer
+from src.models.individual import Individual
+from src.strategies.fitness.PixelMSEFitness import PixelMSEFitness
+from src.strategies.fitness.SSIMFitness import SSIMFitness
+
+_FITNESS = {"pixel_mse": PixelMSEFitness, "ssim": SSIMFitness}
+
+
+@dataclass
+class _PrerenderedRenderer:
+    """Serves renders computed up front, keyed by genome identity."""
+    width: int
+    height: int
+    renders: Dict[int, np.ndarray]
+
+    def render(self, triangles: np.ndarray) -> np.ndarray:
+        return self.renders[id(triangles)]
+
+
+def _bench(fitness, population: List[Individual], rounds: int) -> tuple[float, int]:
+    fitness.evaluate(population[0])  # warm-up: scratch buffers
+    tracemalloc.start()
+    fitness.evaluate(population[0])
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for ind in population:
+            fitness.evaluate(ind)
+    return (time.perf_counter() - start) / (rounds * len(population)), peak
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--fitness", nargs="+", default=list(_FITNESS))
+    ap.add_argument("--canvas", nargs="+", type=_canvas, default=[(300, 200), (600, 400)])
+    ap.add_argument("--pop-size", type=int, default=20)
+    ap.add_argument("--triangles", type=int, default=50)
+    ap.add_argument("--rounds", type=int, default=3)
+    ap.add_argument("--seed", type=int, default=0)
+    args = ap.parse_args()
+
+    print("| fitness | canvas | ms/evaluation | bytes allocated/evaluation |")
+    print("|---------|--------|---------------|----------------------------|")
+    for width, height in args.canvas:
+        rng = np.random.default_rng(args.seed)
+        renderer = build_renderer("pillow", {"width": width, "height": height})
+        target = renderer.render(_random_population(1, args.triangles, rng)[0].genes)
+        population = _random_population(args.pop_size, args.triangles, rng)
+        renders = {id(ind.genes): renderer.render(ind.genes) for ind in population}
+        for name in args.fitness:
+            fitness = _FITNESS[name](renderer=renderer, target=target)
+            fitness = dataclasses.replace(fitness, renderer=_PrerenderedRenderer(width, height, renders))
+            seconds, peak = _bench(fitness, population, args.rounds)
+            print(f"| {name} | {width}x{height} | {seconds * 1e3:.2f} | {peak} |")
+
+
+if __name__ == "__main__":
+    main()
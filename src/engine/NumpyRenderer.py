@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+import math
+import numpy as np
+from dataclasses import dataclass
+from typing import List, Sequence, Tuple
+from .Renderer import Genome, sorted_gene_rows
+
+
+@dataclass(slots=True)
+class NumpyRenderer:
+    """Pure-NumPy triangle rasterizer.
+
+    Each triangle is rasterized with vectorized edge functions evaluated at the
+    pixel centers of its bounding box, then alpha-blended ("over") into a
+    premultiplied float32 canvas. Triangle coordinates are in [0, 1] and scaled
+    to the canvas resolution.
+
+    ``dtype`` selects the output precision: ``"uint8"`` matches
+    ``PillowRenderer``'s output contract, ``"float32"`` skips the final rounding
+    and returns values in [0, 255] directly.
+
+    ``mode="rgb"`` blends onto an opaque canvas holding the background
+    composited over white, what both fitness strategies compare against the
+    target, and returns ``(height, width, 3)`` images. The alpha plane is never
+    tracked or un-premultiplied, and the RGB values equal the ``"rgba"`` render
+    composited over white.
+    """
+
+    width: int
+    height: int
+    background: Tuple[int, int, int, int] = (255, 255, 255, 255)
+    dtype: str = "uint8"  # "uint8" | "float32"
+    mode: str = "rgba"  # "rgba" | "rgb"
+
+    def __post_init__(self) -> None:
+        if self.dtype not in ("uint8", "float32"):
+            raise ValueError(f"Unknown output dtype: {self.dtype!r}")
+        if self.mode not in ("rgba", "rgb"):
+            raise ValueError(f"Unknown render mode: {self.mode!r}")
+
+    def render(self, triangles: Genome) -> np.ndarray:
+        """Render ``triangles`` and return an array of shape ``(height, width, 4)``
+        (``3`` in ``"rgb"`` mode).
+        """
+        out = np.empty((self.height, self.width, self._channels()), dtype=self._out_dtype())
+        self._render_into(triangles, out, (0, 0, self.width, self.height))
+        return out
+
+    def render_region(self, triangles: Genome, box: Tuple[int, int, int, int]) -> np.ndarray:
+        """Render only the pixel box ``(x0, y0, x1, y1)`` (exclusive end) of the full image.
+
+        Returns an array of shape ``(y1 - y0, x1 - x0, 4)`` holding exactly the pixels
+        ``render`` would produce there.
+        """
+        x0, y0, x1, y1 = box
+        out = np.empty((y1 - y0, x1 - x0, self._channels()), dtype=self._out_dtype())
+        self._render_into(triangles, out, box)
+        return out
+
+    def render_batch(self, population: Sequence[Genome]) -> np.ndarray:
+        """Render each triangle list of ``population`` into one preallocated array
+        of shape ``(N, height, width, 4)`` (``3`` in ``"rgb"`` mode).
+        """
+        out = np.empty((len(population), self.height, self.width, self._channels()), dtype=self._out_dtype())
+        for i, triangles in enumerate(population):
+            self._render_into(triangles, out[i], (0, 0, self.width, self.height))
+        return out
+
+    def _out_dtype(self) -> type:
+        return np.float32 if self.dtype == "float32" else np.uint8
+
+    def _channels(self) -> int:
+        return 3 if self.mode == "rgb" else 4
+
+    def _render_into(self, triangles: Genome, out: np.ndarray, box: Tuple[int, int, int, int]) -> None:
+        ox, oy, ex, ey = box
+        bg_alpha = self.background[3] / 255.0
+        # Planar (channel-first) premultiplied canvas: RGB in [0, 255], alpha in [0, 1].
+        # Per-channel planes keep every blend a contiguous, cache-friendly pass.
+        # In "rgb" mode the canvas starts as the background over white and stays opaque.
+        rgb = self.mode == "rgb"
+        canvas = np.empty((3 if rgb else 4, ey - oy, ex - ox), dtype=np.float32)
+        for c in range(3):
+            canvas[c] = self.background[c] * bg_alpha + (255.0 * (1.0 - bg_alpha) if rgb else 0.0)
+        if not rgb:
+            canvas[3] = bg_alpha
+        scratch = np.empty(canvas.shape[1:], dtype=np.float32)
+
+        for row in sorted_gene_rows(triangles):
+            self._draw(canvas, scratch, row, ox, oy)
+
+        # Un-premultiply into an interleaved (H, W, 4) image, one plane at a time
+        alpha = None if rgb else canvas[3]
+        opaque = rgb or bool(alpha.min() >= 1.0)
+        for c in range(3):
+            if opaque:
+                plane = canvas[c]
+            else:
+                plane = np.divide(canvas[c], alpha, out=np.zeros_like(alpha), where=alpha > 0)
+            if self.dtype == "uint8":
+                plane = np.clip(np.rint(plane, out=scratch), 0, 255, out=scratch)
+            out[..., c] = plane
+        if rgb:
+            return
+        out[..., 3] = np.rint(alpha * 255.0) if self.dtype == "uint8" else alpha * 255.0
+
+    def _draw(self, canvas: np.ndarray, scratch: np.ndarray, row: List[float], ox: int, oy: int) -> None:
+        """Blend one triangle gene row into ``canvas`` (whose origin is pixel ``(ox, oy)`` of
+        the full image) in place, touching only its bounding box.
+        """
+        height, width = canvas.shape[1:]
+        p1x, p1y, p2x, p2y, p3x, p3y, r, g, b, a, _ = row
+        xa, ya = p1x * self.width - ox, p1y * self.height - oy
+        xb, yb = p2x * self.width - ox, p2y * self.height - oy
+        xc, yc = p3x * self.width - ox, p3y * self.height - oy
+        area = (xb - xa) * (yc - ya) - (yb - ya) * (xc - xa)
+        sa = round(a) / 255.0
+        if area == 0 or sa <= 0.0:
+            return
+        x0 = max(math.floor(min(xa, xb, xc)), 0)
+        y0 = max(math.floor(min(ya, yb, yc)), 0)
+        x1 = min(math.ceil(max(xa, xb, xc)), width)
+        y1 = min(math.ceil(max(ya, yb, yc)), height)
+        if x1 <= x0 or y1 <= y0:
+            return
+
+        # Pixel centers of the bounding box
+        px = np.arange(x0, x1, dtype=np.float64) + 0.5
+        py = np.arange(y0, y1, dtype=np.float64) + 0.5
+        # Edge functions e(x, y) = A*x + B*y + C are separable: a column term plus a row term.
+        # They are oriented so the interior is non-positive for either winding.
+        sign = 1.0 if area > 0 else -1.0
+        inside = None
+        for (ax, ay), (bx, by) in (((xa, ya), (xb, yb)), ((xb, yb), (xc, yc)), ((xc, yc), (xa, ya))):
+            a_coef = sign * (by - ay)
+            b_coef = -sign * (bx - ax)
+            c_coef = -(a_coef * ax + b_coef * ay)
+            edge = (a_coef * px)[None, :] + (b_coef * py + c_coef)[:, None] <= 0
+            inside = edge if inside is None else np.logical_and(inside, edge, out=inside)
+
+        # "Over" in premultiplied space is a lerp towards (color, 1) with weight inside * alpha
+        w = scratch[: y1 - y0, : x1 - x0]
+        np.multiply(inside, np.float32(sa), out=w)
+        tmp = np.empty_like(w)
+        for c, value in enumerate((round(r), round(g), round(b), 1.0)[: len(canvas)]):
+            plane = canvas[c, y0:y1, x0:x1]
+            np.subtract(np.float32(value), plane, out=tmp)
+            tmp *= w
+            plane += tmp
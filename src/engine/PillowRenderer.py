@@ -1,42 +1,164 @@
 from __future__ import annotations
 
+import math
 import numpy as np
 from dataclasses import dataclass
-from typing import Iterable, Tuple
+from typing import Sequence, Tuple
 from PIL import Image, ImageDraw
-from ..models.triangle import Triangle
+from .Renderer import Genome, sorted_gene_rows
 
 
 @dataclass(slots=True)
 class PillowRenderer:
-    """Render a list of `Triangle` objects onto an RGBA canvas.
+    """Render a list of `Triangle` objects (or a gene array) onto an RGBA canvas.
 
     This renderer uses Pillow's ``ImageDraw`` with alpha compositing to draw
     semi-transparent triangles. Triangle coordinates are in [0, 1]
     and scaled to the canvas resolution.
+
+    Two compositing modes are available:
+
+    - ``"bbox"`` (default): each triangle is drawn on an overlay the size of its
+      bounding box and composited in place into a single canvas, so the work per
+      triangle is proportional to its area instead of the full canvas.
+    - ``"overlay"``: the original full-canvas overlay per triangle, kept as the
+      reference implementation.
+
+    Both modes apply the same "over" operator. For vertices inside the canvas
+    (normalized [0, 1]) outputs are identical except for isolated edge pixels
+    where Pillow's scanline rounding differs after the integer shift into bbox
+    coordinates: fewer than 0.1% of pixels may differ (see
+    ``test_PillowRenderer.py``).
+
+    ``mode="rgb"`` renders straight onto an opaque RGB canvas holding the
+    background composited over white, which is what both fitness strategies
+    compare against the target. Triangles are blended into it in place by
+    ``ImageDraw`` on a tile spanning their bounding box, with no overlays, and
+    the output has shape ``(height, width, 3)``. With an opaque background it
+    matches the RGB of the ``"bbox"`` render exactly; ``compositing`` does not
+    apply. ``render_region`` returns exactly the pixels of ``render`` in its box.
     """
 
     width: int
     height: int
     background: Tuple[int, int, int, int] = (255, 255, 255, 255)
+    compositing: str = "bbox"  # "bbox" | "overlay"
+    mode: str = "rgba"  # "rgba" | "rgb"
+
+    def __post_init__(self) -> None:
+        if self.compositing not in ("bbox", "overlay"):
+            raise ValueError(f"Unknown compositing mode: {self.compositing!r}")
+        if self.mode not in ("rgba", "rgb"):
+            raise ValueError(f"Unknown render mode: {self.mode!r}")
 
-    def render(self, triangles: Iterable[Triangle]) -> np.ndarray:
+    def render(self, triangles: Genome) -> np.ndarray:
         """Render ``triangles`` and return the resulting image as ``numpy.ndarray``
-        of shape ``(height, width, 4)`` with dtype ``uint8``.
+        of shape ``(height, width, 4)`` (``3`` in ``"rgb"`` mode) with dtype ``uint8``.
         """
-        canvas = Image.new("RGBA", (self.width, self.height), self.background)
+        if self.mode == "rgb":
+            return self._render_rgb(triangles, (0, 0, self.width, self.height))
+        if self.compositing == "overlay":
+            return self._render_overlay(triangles)
+        return self.render_region(triangles, (0, 0, self.width, self.height))
+
+    def render_region(self, triangles: Genome, box: Tuple[int, int, int, int]) -> np.ndarray:
+        """Render only the pixel box ``(x0, y0, x1, y1)`` (exclusive end) of the full image.
+
+        Returns an array of shape ``(y1 - y0, x1 - x0, 4)``, the same pixels ``render``
+        would produce there (up to the edge rounding documented above).
+        """
+        if self.mode == "rgb":
+            return self._render_rgb(triangles, box)
+        ox, oy, ex, ey = box
+        if self.compositing == "overlay":
+            return self._render_overlay(triangles)[oy:ey, ox:ex]
+
+        region_w, region_h = ex - ox, ey - oy
+        canvas = Image.new("RGBA", (region_w, region_h), self.background)
 
         # Step 1: Sort by z_index (ascending → lower z first)
-        sorted_triangles = sorted(triangles, key=lambda t: t.z_index)
+        for xa, ya, xb, yb, xc, yc, r, g, b, a, _ in sorted_gene_rows(triangles):
+            pts = [
+                (xa * self.width - ox, ya * self.height - oy),
+                (xb * self.width - ox, yb * self.height - oy),
+                (xc * self.width - ox, yc * self.height - oy),
+            ]
+            color = (round(r), round(g), round(b), round(a))
+            x0, y0, x1, y1 = self._bbox(pts)
+            cx0, cy0 = max(x0, 0), max(y0, 0)
+            cx1, cy1 = min(x1, region_w), min(y1, region_h)
+            if cx1 <= cx0 or cy1 <= cy0:
+                continue
+            # Draw in bbox-local coordinates; integer offsets keep rasterization identical as
+            # long as no vertex is clipped, so the overlay spans the whole unclipped bbox
+            overlay = Image.new("RGBA", (x1 - x0, y1 - y0), (0, 0, 0, 0))
+            draw = ImageDraw.Draw(overlay, "RGBA")
+            draw.polygon([(x - x0, y - y0) for x, y in pts], fill=color)
+            if (cx0, cy0, cx1, cy1) != (x0, y0, x1, y1):
+                overlay = overlay.crop((cx0 - x0, cy0 - y0, cx1 - x0, cy1 - y0))
+            canvas.alpha_composite(overlay, dest=(cx0, cy0))
+        return np.asarray(canvas, dtype=np.uint8)
+
+    def _render_overlay(self, triangles: Genome) -> np.ndarray:
+        canvas = Image.new("RGBA", (self.width, self.height), self.background)
 
-        for tri in sorted_triangles:
+        # Step 1: Sort by z_index (ascending → lower z first)
+        for xa, ya, xb, yb, xc, yc, r, g, b, a, _ in sorted_gene_rows(triangles):
             overlay = Image.new("RGBA", (self.width, self.height), (0, 0, 0, 0))
             draw = ImageDraw.Draw(overlay, "RGBA")
             pts = [
-                (tri.p1[0] * self.width, tri.p1[1] * self.height),
-                (tri.p2[0] * self.width, tri.p2[1] * self.height),
-                (tri.p3[0] * self.width, tri.p3[1] * self.height),
+                (xa * self.width, ya * self.height),
+                (xb * self.width, yb * self.height),
+                (xc * self.width, yc * self.height),
             ]
-            draw.polygon(pts, fill=tri.color)
+            draw.polygon(pts, fill=(round(r), round(g), round(b), round(a)))
             canvas = Image.alpha_composite(canvas, overlay)
-        return np.asarray(canvas, dtype=np.uint8)
\ No newline at end of file
+        return np.asarray(canvas, dtype=np.uint8)
+
+    def _render_rgb(self, triangles: Genome, box: Tuple[int, int, int, int]) -> np.ndarray:
+        ox, oy, ex, ey = box
+        canvas = Image.new("RGB", (ex - ox, ey - oy), self._background_over_white())
+        for xa, ya, xb, yb, xc, yc, r, g, b, a, _ in sorted_gene_rows(triangles):
+            pts = [
+                (xa * self.width - ox, ya * self.height - oy),
+                (xb * self.width - ox, yb * self.height - oy),
+                (xc * self.width - ox, yc * self.height - oy),
+            ]
+            x0, y0, x1, y1 = self._bbox(pts)
+            if x1 <= 0 or y1 <= 0 or x0 >= ex - ox or y0 >= ey - oy:
+                continue
+            # As in the bbox compositing, draw on the whole unclipped bbox in bbox-local coordinates,
+            # so a triangle rasterizes the same whatever region is rendered. Drawing RGBA ink into
+            # the RGB tile blends the polygon over the canvas in place; paste clips the tile back.
+            tile = canvas.crop((x0, y0, x1, y1))
+            ImageDraw.Draw(tile, "RGBA").polygon([(x - x0, y - y0) for x, y in pts], fill=(round(r), round(g), round(b), round(a)))
+            canvas.paste(tile, (x0, y0))
+        return np.asarray(canvas, dtype=np.uint8)
+
+    def _background_over_white(self) -> Tuple[int, int, int]:
+        alpha = self.background[3] / 255.0
+        return tuple(round(c * alpha + 255 * (1 - alpha)) for c in self.background[:3])
+
+    def render_batch(self, population: Sequence[Genome]) -> np.ndarray:
+        """Render each triangle list of ``population`` into one preallocated array
+        of shape ``(N, height, width, 4)`` (``3`` in ``"rgb"`` mode) with dtype ``uint8``.
+        """
+        channels = 3 if self.mode == "rgb" else 4
+        out = np.empty((len(population), self.height, self.width, channels), dtype=np.uint8)
+        for i, triangles in enumerate(population):
+            out[i] = self.render(triangles)
+        return out
+
+    @staticmethod
+    def _bbox(pts: list[tuple[float, float]]) -> tuple[int, int, int, int]:
+        """Return the pixel box ``(x0, y0, x1, y1)`` covering ``pts`` (exclusive end),
+        padded by one pixel for Pillow's edge rounding.
+        """
+        xs = [p[0] for p in pts]
+        ys = [p[1] for p in pts]
+        return (
+            math.floor(min(xs)) - 1,
+            math.floor(min(ys)) - 1,
+            math.ceil(max(xs)) + 2,
+            math.ceil(max(ys)) + 2,
+        )
@@ -0,0 +1,36 @@
+from __future__ import annotations
+from typing import Iterable, List, Protocol, Sequence, Tuple, Union
+import numpy as np
+from src.models.triangle import Triangle, Z_INDEX
+
+# A genome to draw: ``Triangle`` objects or a ``(num_triangles, GENE_SIZE)`` gene array
+Genome = Union[Iterable[Triangle], np.ndarray]
+
+
+class Renderer(Protocol):
+    width: int
+    height: int
+
+    def render(self, triangles: Genome) -> np.ndarray:
+        """Return the rendered image as an array of shape ``(height, width, 4)``, values in 0..255.
+
+        Renderers built with ``mode="rgb"`` return ``(height, width, 3)`` instead: the opaque
+        render over white, ready to compare with the target without an alpha blend.
+        """
+        ...
+
+    def render_batch(self, population: Sequence[Genome]) -> np.ndarray:
+        """Render every genome into one array of shape ``(N, height, width, channels)``."""
+        ...
+
+    def render_region(self, triangles: Genome, box: Tuple[int, int, int, int]) -> np.ndarray:
+        """Render only the pixel box ``(x0, y0, x1, y1)`` (exclusive end) of the full image."""
+        ...
+
+
+def sorted_gene_rows(triangles: Genome) -> List[List[float]]:
+    """Return the genome as plain gene rows sorted by z_index (ascending → lower z first, stable)."""
+    if isinstance(triangles, np.ndarray):
+        order = np.argsort(triangles[:, Z_INDEX], kind="stable")
+        return triangles[order].tolist()
+    return [list(Triangle.to_gene(t)) for t in sorted(triangles, key=lambda t: t.z_index)]
@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, List
+
+import numpy as np
+
+from src.models.population import PopulationArray
+from src.utils.metrics import GAMetrics
+
+if TYPE_CHECKING:
+    from src.engine.engine import GAEngine
+
+
+class Callback:
+    """Hooks into ``GAEngine.run``; subclasses override the events they need.
+
+    ``gen`` counts generations as the console does: 0 is the initial population,
+    ``n`` the n-th bred generation. The population and fitness arrays are the engine's
+    own, not copies: read them during the call, but do not modify or keep them.
+    With a surrogate, only the entries of ``verified`` are full-resolution scores.
+    """
+
+    def on_generation_start(self, engine: GAEngine, gen: int, pop: PopulationArray, fitness: np.ndarray) -> None:
+        """Generation ``gen`` is about to be bred from ``pop`` (the previous generation)."""
+
+    def on_evaluated(
+            self, engine: GAEngine, gen: int, pop: PopulationArray, fitness: np.ndarray, verified: np.ndarray
+    ) -> None:
+        """Generation ``gen`` has been scored (after migration, in island mode)."""
+
+    def on_improvement(self, engine: GAEngine, gen: int, pop: PopulationArray, fitness: np.ndarray, best: int) -> None:
+        """Generation ``gen`` beat the best score so far; ``pop[best]`` is its best individual."""
+
+    def on_generation_end(
+            self, engine: GAEngine, gen: int, pop: PopulationArray, fitness: np.ndarray, metrics: GAMetrics
+    ) -> None:
+        """Generation ``gen`` is complete and recorded in ``metrics``."""
+
+    def on_stop(self, engine: GAEngine, gen: int, reason: str) -> None:
+        """The run stops early after generation ``gen``, before recording it."""
+
+
+class ConsoleLogger(Callback):
+    """Prints a line of statistics per generation, resolution changes and early stops."""
+
+    def on_generation_end(
+            self, engine: GAEngine, gen: int, pop: PopulationArray, fitness: np.ndarray, metrics: GAMetrics
+    ) -> None:
+        if gen == 0:
+            return
+        scales = metrics.resolution_scales
+        if len(scales) > 1 and scales[-1] != scales[-2]:
+            print(f"{engine.label}Generation {gen}: evaluating at {scales[-1]:g}x resolution")
+        print(
+            f"{engine.label}Generation {gen}/{engine.generations}: max={metrics.max_fitnesses[-1]:.6g} min={metrics.min_fitnesses[-1]:.6g} "
+            f"mean={metrics.mean_fitnesses[-1]:.6g} std={metrics.std_fitnesses[-1]:.6g} "
+            f"eval: compute={metrics.eval_compute_times[-1]:.3f}s dispatch={metrics.eval_dispatch_times[-1]:.3f}s "
+            f"ipc={metrics.ipc_bytes[-1] / 1024:.1f}KiB"
+        )
+
+    def on_stop(self, engine: GAEngine, gen: int, reason: str) -> None:
+        print(f"{engine.label}Early stopping at generation {gen}: {reason}")
+
+
+class MutationSchedule(Callback):
+    """Tells mutation strategies with a ``set_generation(gen_idx, max_generations)`` schedule
+    (e.g. ``NonUniform``) which generation they are breeding.
+    """
+
+    def on_generation_start(self, engine: GAEngine, gen: int, pop: PopulationArray, fitness: np.ndarray) -> None:
+        if hasattr(engine.mutation, "set_generation"):
+            engine.mutation.set_generation(gen - 1, engine.generations)
+
+
+def default_callbacks() -> List[Callback]:
+    """The callbacks every engine gets unless told otherwise; extend this list to add your own."""
+    return [MutationSchedule(), ConsoleLogger()]
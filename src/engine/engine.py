@@ -1,18 +1,39 @@
 from __future__ import annotations
+import copy
+import cProfile
 import random
-from itertools import islice
+import time
+import warnings
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+from contextlib import ExitStack
+from collections import OrderedDict
 from dataclasses import dataclass, field
-from typing import List, Sequence
+from typing import Any, List, Mapping, Sequence
+from src.engine.callbacks import Callback, default_callbacks
+from src.engine.evaluation import EvaluationStats, Evaluator, build_evaluator
+from src.engine.islands import Migration
+from src.engine.resolution import ResolutionStage, scale_fitness
 from src.models.individual import Individual
+from src.models.population import PopulationArray
 from src.strategies.selection.SelectionStrategy import SelectionStrategy
 from src.strategies.crossover.CrossoverStrategy import CrossoverStrategy
 from src.strategies.mutation.MutationStrategy import MutationStrategy
 from src.strategies.fitness.FitnessStrategy import FitnessStrategy
-from src.utils.diversity import population_diversity
-from src.utils.metrics import GAMetrics
-from concurrent.futures import ProcessPoolExecutor
+from src.utils.checkpoint import Checkpoint, CheckpointWriter
+from src.utils.diversity import DIVERSITY_METHODS, population_diversity
+from src.utils.metrics import GAMetrics, MetricsLogWriter
+from src.utils.profiling import PhaseTimer, dump_profile
 import numpy as np
 
+def _rank_correlation(a: np.ndarray, b: np.ndarray) -> float:
+    """Spearman rank correlation of ``a`` and ``b`` (NaN for fewer than two values)."""
+    if len(a) < 2:
+        return float("nan")
+    rank_a = np.argsort(np.argsort(a, kind="stable"), kind="stable")
+    rank_b = np.argsort(np.argsort(b, kind="stable"), kind="stable")
+    return float(np.corrcoef(rank_a, rank_b)[0, 1])
+
+
 @dataclass
 class GAEngine:
     """Simple genetic algorithm engine"""
@@ -28,11 +49,51 @@ class GAEngine:
     survivor_selection: SelectionStrategy | None = None
     # Generation gap (youth bias): fraction of population replaced by offspring each generation
     rho: float = 0.5
-    max_workers: int | None = None # thread-pool size for fitness evaluation
+    max_workers: int | None = None # worker pool size for fitness evaluation
+    executor: str = "process"  # fitness evaluation backend: "process" | "thread" | "serial" | "remote"
+    executor_params: Mapping[str, Any] = field(default_factory=dict)  # extra evaluator options, e.g. remote workers
+    eval_chunksize: int | str = "auto"  # individuals per evaluation task, or "auto" to size from measured latency
+    # Coarse-to-fine evaluation: stages scored at a fraction of the canvas size, then full resolution
+    resolution_schedule: Sequence[ResolutionStage] = ()
     # Early stopping options
     early_stopping_patience: int = 0  # Number of stagnant generations before stopping
     error_threshold: float | None = None  # Stop if min_fitness drops below this (for minimization)
-
+    # LRU memo of fitness by genome content hash; elites, survivors and duplicates skip re-rendering (0 disables)
+    fitness_cache_size: int = 0
+    # Island mode: this engine evolves one island and exchanges migrants through ``migration``
+    # (set by ``IslandModel.run``); ``label`` prefixes its console output
+    migration: Migration | None = None
+    label: str = ""
+    # Every ``checkpoint_every`` generations (0 disables) the full state is saved to ``checkpoint_path``
+    # in the background; ``resume`` continues from it
+    checkpoint_every: int = 0
+    checkpoint_path: str | None = None
+    # Run generation ``profile_generation`` (1-based) under cProfile and dump its stats to ``profile_path``
+    profile_generation: int | None = None
+    profile_path: str | None = None
+    # Population diversity statistic (see ``population_diversity``), computed every ``diversity_every``
+    # generations (NaN is recorded in between); ``diversity_samples`` pairs for the sampled method
+    diversity: str = "exact"
+    diversity_every: int = 1
+    diversity_samples: int = 2048
+    # Each generation's metrics are appended to the NDJSON log ``metrics_log_path`` as the run goes,
+    # in batches (see ``MetricsLogWriter``)
+    metrics_log_path: str | None = None
+    metrics_log_flush_every: int = 10
+    metrics_log_flush_seconds: float = 5.0
+    # Hooks called at each generation event (see ``Callback``); the defaults print progress and drive
+    # mutation schedules
+    callbacks: List[Callback] = field(default_factory=default_callbacks)
+    # Steady-state mode: children are bred and scored one at a time, each replacing the worst individual
+    # as soon as its score arrives, with up to one evaluation per worker in flight (see ``_run_steady_state``)
+    steady_state: bool = False
+    _fitness_cache: OrderedDict = field(default_factory=OrderedDict, init=False, repr=False)
+    _cache_hits: int = field(default=0, init=False, repr=False)
+    _cache_misses: int = field(default=0, init=False, repr=False)
+    # NumPy generator for vectorized operators (``mutate_batch``), seeded from ``rng``
+    np_rng: np.random.Generator = field(init=False, repr=False)
+    # Pair sampling for the sampled diversity, apart from ``np_rng`` so the metric never changes the run
+    _diversity_rng: np.random.Generator = field(init=False, repr=False)
 
     def __post_init__(self) -> None:
         # Provide separate RNGs for strategies to avoid shared-state contention
@@ -44,10 +105,321 @@ class GAEngine:
             self.mutation.rng = random.Random(self.rng.random())
         if self.survivor_selection is not None and hasattr(self.survivor_selection, "rng"):
             self.survivor_selection.rng = random.Random(self.rng.random())
+        seed = self.rng.getrandbits(64)
+        self.np_rng = np.random.default_rng(seed)
+        self._diversity_rng = np.random.default_rng([seed, 1])
+        if self.diversity not in DIVERSITY_METHODS:
+            raise ValueError(f"Unknown diversity method: {self.diversity!r}")
+        if self.diversity_every < 1:
+            raise ValueError(f"diversity_every must be at least 1, got {self.diversity_every}")
+
+    def _crossover(self, pop: PopulationArray, pairs: np.ndarray) -> np.ndarray:
+        """Recombine the parent index ``pairs`` of shape ``(num_pairs, 2)`` and return the
+        children's genes, the two children of each pair adjacent. Uses ``crossover_batch``
+        when the strategy provides it.
+        """
+        if hasattr(self.crossover, "crossover_batch"):
+            c1, c2 = self.crossover.crossover_batch(pop.genes[pairs[:, 0]], pop.genes[pairs[:, 1]], self.np_rng)
+            return np.stack((c1, c2), axis=1).reshape(-1, *pop.genes.shape[1:])
+        children = [c for i, j in pairs for c in self.crossover.crossover(pop[i], pop[j])]
+        return np.stack([c.genes for c in children]) if children else pop.genes[:0]
+
+    def _mutate(self, genes: np.ndarray) -> np.ndarray:
+        """Mutate the children ``genes``, all at once when the strategy provides ``mutate_batch``."""
+        if self.mutation is None or len(genes) == 0:
+            return genes
+        if hasattr(self.mutation, "mutate_batch"):
+            return self.mutation.mutate_batch(genes, self.np_rng)
+        return np.stack([self.mutation.mutate(Individual(genes=row)).genes for row in genes])
+
+    def _evaluate(self, population: Sequence[Individual], evaluator: Evaluator) -> List[float]:
+        """Return fitness scores for each individual in ``population``, serving value-equal
+        genomes from the fitness cache and evaluating each distinct remaining genome once.
+        """
+        if self.fitness_cache_size <= 0:
+            return self._evaluate_uncached(population, evaluator)
+
+        keys = [Individual.genome_key(ind) for ind in population]
+        pending: dict[bytes, Individual] = {}
+        for key, ind in zip(keys, population):
+            if key in self._fitness_cache:
+                self._fitness_cache.move_to_end(key)
+                self._cache_hits += 1
+            elif key in pending:
+                self._cache_hits += 1
+            else:
+                pending[key] = ind
+                self._cache_misses += 1
+
+        scores = dict(zip(pending, self._evaluate_uncached(list(pending.values()), evaluator)))
+        for key, score in scores.items():
+            self._fitness_cache[key] = score
+        result = [scores[key] if key in scores else self._fitness_cache[key] for key in keys]
+        while len(self._fitness_cache) > self.fitness_cache_size:
+            self._fitness_cache.popitem(last=False)
+        return result
+
+    def _evaluate_uncached(self, population: Sequence[Individual], evaluator: Evaluator) -> List[float]:
+        """Return fitness scores for each individual in ``population``.
+
+        Scoring runs on the worker pool of ``evaluator`` (see ``ga.executor``).
+
+        Incremental fitness strategies keep a per-process cache of parent renders, so
+        they are evaluated in this process where the cache persists across generations;
+        ``_build_evaluator`` then starts no worker pool.
+        """
+        if not population:
+            return []
+        if getattr(evaluator.fitness, "incremental", False):
+            return [evaluator.fitness.evaluate(ind) for ind in population]
+        return evaluator.evaluate(population)
+
+    def _build_evaluator(self, fitness: FitnessStrategy) -> Evaluator:
+        executor = self.executor
+        if getattr(fitness, "incremental", False) and executor != "serial":
+            # Scored in this process (see _evaluate_uncached): a pool would only sit idle
+            warnings.warn(
+                f"Incremental fitness is evaluated in the main process; ignoring executor {executor!r}",
+                RuntimeWarning, stacklevel=3,
+            )
+            executor = "serial"
+        return build_evaluator(
+            executor,
+            {**self.executor_params, "fitness": fitness, "max_workers": self.max_workers, "chunksize": self.eval_chunksize},
+        )
+
+    def _stage_at(self, gen: int) -> int:
+        """Index of the resolution stage generation ``gen`` belongs to; ``len(schedule)`` is full resolution."""
+        end = 0
+        for i, stage in enumerate(self.resolution_schedule):
+            end += stage.generations
+            if gen < end:
+                return i
+        return len(self.resolution_schedule)
 
-    def _evaluate(self, population: Sequence[Individual], executor: ProcessPoolExecutor) -> List[float]:
-        """Return fitness scores for each individual in ``population``."""
-        return list(executor.map(self.fitness.evaluate, population))
+    def _open_evaluators(self, stack: ExitStack, fitness: FitnessStrategy) -> tuple[Evaluator, Evaluator | None]:
+        """Start the evaluator for ``fitness`` and, if it has a surrogate mode, one for its surrogate."""
+        evaluator = stack.enter_context(self._build_evaluator(fitness))
+        surrogate = fitness.surrogate() if hasattr(fitness, "surrogate") else None
+        if surrogate is None:
+            return evaluator, None
+        return evaluator, stack.enter_context(self._build_evaluator(surrogate))
+
+    def _score(
+            self,
+            population: Sequence[Individual],
+            evaluator: Evaluator,
+            surrogate: Evaluator | None,
+            verify: Sequence[int],
+    ) -> tuple[np.ndarray, np.ndarray, float | None]:
+        """Score ``population``; returns the scores, a mask of those at full resolution, and
+        the surrogate-vs-true rank correlation.
+
+        Without a surrogate every individual is scored by ``evaluator``. Otherwise all are
+        pre-screened at low resolution by ``surrogate``, then the ``surrogate_top_k`` best
+        and the indices in ``verify`` (the elites) are re-scored by ``evaluator``; their true
+        scores replace the surrogate ones.
+        """
+        if surrogate is None:
+            scores = np.array(self._evaluate(population, evaluator), dtype=np.float64)
+            return scores, np.ones(len(scores), dtype=bool), None
+        scores = np.array(self._evaluate_uncached(population, surrogate), dtype=np.float64)
+        order = np.argsort(-scores if self.maximize else scores, kind="stable")
+        top_k = evaluator.fitness.surrogate_top_k
+        idx = np.union1d(order[:top_k], np.asarray(verify, dtype=np.intp))
+        true = np.array(self._evaluate([population[i] for i in idx], evaluator), dtype=np.float64)
+        correlation = _rank_correlation(scores[idx], true)
+        scores[idx] = true
+        verified = np.zeros(len(scores), dtype=bool)
+        verified[idx] = True
+        return scores, verified, correlation
+
+    def _ranking(self, fitness: Sequence[float], verified: Sequence[bool]) -> List[int]:
+        """Population indices from best to worst.
+
+        Full-resolution ("verified") scores rank first, so elites are chosen by true fitness
+        when a surrogate pre-screens the population.
+        """
+        return sorted(range(len(fitness)), key=lambda i: (not verified[i], -fitness[i] if self.maximize else fitness[i]))
+
+    def _migrate(
+            self, gen: int, pop: PopulationArray, fitness: np.ndarray, verified: np.ndarray, evaluator: Evaluator
+    ) -> tuple[PopulationArray, np.ndarray, np.ndarray]:
+        """Send copies of the best individuals to the neighbouring island and replace the
+        worst with the migrants received, scored by ``evaluator``.
+        """
+        order = self._ranking(fitness.tolist(), verified)
+        immigrants = self.migration.exchange(gen, pop.genes[order[: self.migration.size]].copy())
+        if immigrants is None or len(immigrants) == 0:
+            return pop, fitness, verified
+        worst = order[len(order) - len(immigrants):]
+        members = list(pop.members)
+        for i, genes in zip(worst, immigrants):
+            members[i] = Individual(genes=genes)
+        fitness, verified = fitness.copy(), verified.copy()
+        fitness[worst] = self._evaluate([members[i] for i in worst], evaluator)
+        verified[worst] = True
+        return PopulationArray.from_individuals(members), fitness, verified
+
+    def _best(self, fitness: np.ndarray, verified: np.ndarray) -> float:
+        """Best full-resolution score."""
+        return float(fitness[verified].max() if self.maximize else fitness[verified].min())
+
+    def _best_index(self, fitness: np.ndarray, verified: np.ndarray) -> int:
+        """Index of the best full-resolution score."""
+        candidates = np.where(verified, fitness, -np.inf if self.maximize else np.inf)
+        return int(candidates.argmax()) if self.maximize else int(candidates.argmin())
+
+    def _worst_index(self, fitness: np.ndarray, verified: np.ndarray) -> int:
+        """Index of the last individual in ``_ranking``: the worst unverified score, if any, else the worst."""
+        pool = ~verified if not verified.all() else verified
+        candidates = np.where(pool, fitness, np.inf if self.maximize else -np.inf)
+        return int(candidates.argmin()) if self.maximize else int(candidates.argmax())
+
+    def _emit(self, event: str, *args: Any) -> None:
+        for callback in self.callbacks:
+            getattr(callback, event)(self, *args)
+
+    def _diversity(self, gen: int, pop: PopulationArray) -> float:
+        """Diversity of ``pop`` after generation ``gen`` (0 is the initial population), or NaN if not due."""
+        if gen % self.diversity_every:
+            return float("nan")
+        return population_diversity(pop, self.diversity, self.diversity_samples, self._diversity_rng)
+
+    def _track_progress(
+            self,
+            gen: int,
+            pop: PopulationArray,
+            fitness: np.ndarray,
+            verified: np.ndarray,
+            best_fitness: float,
+            stagnant_epochs: int,
+            full_resolution: bool = True,
+    ) -> tuple[float, int, bool]:
+        """Early stopping after generation ``gen`` (1-based): returns the best score so far, the
+        number of generations without improvement, and whether to stop.
+
+        Stopping only applies at full resolution: coarse stages end on schedule.
+        """
+        current_best = self._best(fitness, verified)
+        if full_resolution and not self.maximize and self.error_threshold is not None:
+            if current_best <= self.error_threshold:
+                self._emit("on_stop", gen, f"error_threshold reached ({current_best:.6f} ≤ {self.error_threshold})")
+                return best_fitness, stagnant_epochs, True
+
+        if (self.maximize and current_best > best_fitness) or (not self.maximize and current_best < best_fitness):
+            best_fitness = current_best
+            stagnant_epochs = 0
+            self._emit("on_improvement", gen, pop, fitness, self._best_index(fitness, verified))
+        else:
+            stagnant_epochs += 1
+
+        if full_resolution and self.early_stopping_patience > 0 and stagnant_epochs >= self.early_stopping_patience:
+            self._emit("on_stop", gen, f"no improvement for {self.early_stopping_patience} generations.")
+            return best_fitness, stagnant_epochs, True
+        return best_fitness, stagnant_epochs, False
+
+    def _record_generation(
+            self, metrics: GAMetrics, fitness: np.ndarray, best: float, diversity: float, correlation: float | None
+    ) -> None:
+        # With a surrogate, unverified scores are low-resolution estimates; the best end of the
+        # range always reports the best full-resolution score
+        metrics.max_fitnesses.append(best if self.maximize else float(fitness.max()))
+        metrics.min_fitnesses.append(float(fitness.min()) if self.maximize else best)
+        metrics.mean_fitnesses.append(float(fitness.mean()))
+        metrics.std_fitnesses.append(float(fitness.std()))
+        metrics.population_diversities.append(diversity)
+        if correlation is not None:
+            metrics.surrogate_rank_correlations.append(correlation)
+
+    @staticmethod
+    def _take_stats(*evaluators: Evaluator | None) -> EvaluationStats:
+        total = EvaluationStats()
+        for evaluator in evaluators:
+            if evaluator is not None:
+                stats = evaluator.take_stats()
+                total.ipc_bytes += stats.ipc_bytes
+                total.compute_time += stats.compute_time
+                total.dispatch_time += stats.dispatch_time
+        return total
+
+    @staticmethod
+    def _record_evaluation(metrics: GAMetrics, stats: EvaluationStats) -> None:
+        metrics.ipc_bytes.append(stats.ipc_bytes)
+        metrics.eval_compute_times.append(stats.compute_time)
+        metrics.eval_dispatch_times.append(stats.dispatch_time)
+
+    def _toggle_profiler(self, profiler: cProfile.Profile | None, gen: int | None) -> cProfile.Profile | None:
+        """Stop and dump ``profiler`` if running; start a new one if generation ``gen`` is to be profiled."""
+        if profiler is not None:
+            profiler.disable()
+            dump_profile(profiler, self.profile_path or f"profile_gen{self.profile_generation}.pstats")
+        if gen is not None and self.profile_generation == gen + 1:
+            profiler = cProfile.Profile()
+            profiler.enable()
+            return profiler
+        return None
+
+    def _operators(self) -> dict:
+        return {
+            "selection": self.selection,
+            "survivor_selection": self.survivor_selection,
+            "crossover": self.crossover,
+            "mutation": self.mutation,
+        }
+
+    def _checkpoint(
+            self,
+            gen: int,
+            pop: PopulationArray,
+            fitness: np.ndarray,
+            verified: np.ndarray,
+            best_fitness: float,
+            stagnant_epochs: int,
+            stage: int,
+            metrics: GAMetrics,
+            pending: np.ndarray | None = None,
+    ) -> Checkpoint:
+        """Snapshot the state at the end of generation ``gen``, copied so the run can go on.
+
+        ``pending`` holds the genes of children submitted but not yet scored (steady-state mode).
+        """
+        state = {
+            "best_fitness": best_fitness,
+            "stagnant_epochs": stagnant_epochs,
+            "stage": stage,
+            "metrics": metrics,
+            "fitness_cache": self._fitness_cache,
+            "cache_hits": self._cache_hits,
+            "cache_misses": self._cache_misses,
+            "rng": self.rng.getstate(),
+            "np_rng": self.np_rng.bit_generator.state,
+            "diversity_rng": self._diversity_rng.bit_generator.state,
+            # Operator fields hold their RNGs and any schedule counters (e.g. Boltzmann temperature)
+            "operators": {name: vars(op) for name, op in self._operators().items() if op is not None},
+            "pending": pending if pending is not None else np.empty((0,) + pop.genes.shape[1:], dtype=np.float32),
+        }
+        return Checkpoint(gen, pop.genes.copy(), fitness.copy(), verified.copy(), copy.deepcopy(state))
+
+    def _restore(self, checkpoint: Checkpoint) -> dict:
+        """Load the RNG, operator and cache state of ``checkpoint``; returns its ``state``."""
+        state = copy.deepcopy(checkpoint.state)
+        self.rng.setstate(state["rng"])
+        self.np_rng.bit_generator.state = state["np_rng"]
+        self._diversity_rng.bit_generator.state = state["diversity_rng"]
+        for name, fields in state["operators"].items():
+            vars(self._operators()[name]).update(fields)
+        self._fitness_cache = state["fitness_cache"]
+        self._cache_hits, self._cache_misses = state["cache_hits"], state["cache_misses"]
+        return state
+
+    def resume(self, checkpoint: Checkpoint) -> tuple[Individual, GAMetrics]:
+        """Continue a run from ``checkpoint``, as if it had never stopped.
+
+        The engine must be configured as the one that wrote it. Incremental fitness
+        caches are not saved: they are rebuilt on the way.
+        """
+        return self.run(PopulationArray.from_genes(checkpoint.genes), checkpoint)
 
     def _selection_scores(self, fitness: Sequence[float]) -> List[float]:
         """Transform fitness into selection scores where higher is better and non-negative when possible.
@@ -64,32 +436,248 @@ class GAEngine:
             return [1.0 for _ in fitness]
         return scores
 
-    def run(self, population: Sequence[Individual]) -> tuple[Individual, GAMetrics]:
-        """Run the genetic algorithm and return the best individual and its fitness value"""
+    def _select_pairs(self, members: List[Individual], fitness: np.ndarray, num_children: int) -> List[List[Individual]]:
+        """Parent pairs for ``num_children`` children, drawn in one ``select`` call as in ``run``."""
+        num_pairs = (num_children + 1) // 2
+        parents = np.array(self.selection.select(self._selection_scores(fitness.tolist()), 2 * num_pairs), dtype=np.intp)
+        pairs = self.np_rng.permutation(parents).reshape(num_pairs, 2)
+        return [[members[i], members[j]] for i, j in pairs]
+
+    def _breed(self, parents: List[Individual], timer: PhaseTimer) -> List[Individual]:
+        """The two children of ``parents``, crossed over and mutated."""
+        pair = PopulationArray(np.stack([ind.genes for ind in parents]), parents)
+        child_genes = self._crossover(pair, np.array([[0, 1]]))
+        timer.lap("crossover")
+        child_genes = self._mutate(child_genes)
+        children = [Individual.derive(Individual(genes=genes), parent) for genes, parent in zip(child_genes, parents)]
+        timer.lap("mutation")
+        return children
+
+    def _run_steady_state(
+            self, pop: PopulationArray, checkpoint: Checkpoint | None = None
+    ) -> tuple[Individual, GAMetrics]:
+        """``run`` without generational barriers.
+
+        Children are submitted to the evaluator one by one, keeping one evaluation per
+        worker in flight. Whenever a score arrives, the child replaces the worst individual
+        (never an elite, short of ties) and the next child is bred and submitted right away,
+        so a slow individual holds up only its own worker.
+
+        Every ``pop_size`` scores make a "virtual generation": metrics, callbacks, early
+        stopping, migration and checkpoints work on those as on generations. Parents are
+        selected once per virtual generation, from the population at its start, so
+        selection schedules (e.g. Boltzmann temperature) advance per generation too. A
+        checkpoint also holds the children still being scored, which a resumed run
+        submits first. With several workers the order in which scores arrive, and so the
+        run, is not reproducible. Resolution schedules, surrogates, incremental fitness
+        and the fitness cache are not used.
+        """
+        if self.resolution_schedule or getattr(self.fitness, "incremental", False) or (
+                hasattr(self.fitness, "surrogate") and self.fitness.surrogate() is not None):
+            raise ValueError("Steady-state mode does not support resolution schedules, surrogates or incremental fitness")
+        state = self._restore(checkpoint) if checkpoint is not None else None
+        with ExitStack() as stack:
+            writer = None
+            if self.checkpoint_every > 0 and self.checkpoint_path:
+                writer = stack.enter_context(CheckpointWriter(self.checkpoint_path))
+            log = None
+            if self.metrics_log_path:
+                log = stack.enter_context(MetricsLogWriter(
+                    self.metrics_log_path, self.metrics_log_flush_every, self.metrics_log_flush_seconds
+                ))
+            timer = PhaseTimer()
+            timer.start()
+            evaluator = stack.enter_context(self._build_evaluator(self.fitness))
+            in_flight: dict[Future, Individual] = {}
+            if state is None:
+                fitness_arr = np.array(self._evaluate_uncached(pop.members, evaluator), dtype=np.float64)
+                verified = np.ones(len(fitness_arr), dtype=bool)
+                timer.lap("evaluation")
+                self._emit("on_evaluated", 0, pop, fitness_arr, verified)
+                timer.lap("bookkeeping")
+                metrics = GAMetrics(diversity_method=self.diversity)
+                best_fitness = self._best(fitness_arr, verified)
+                diversity = self._diversity(0, pop)
+                timer.lap("diversity")
+                self._record_generation(metrics, fitness_arr, best_fitness, diversity, None)
+                self._record_evaluation(metrics, self._take_stats(evaluator))
+                metrics.resolution_scales.append(1.0)
+                self._emit("on_generation_end", 0, pop, fitness_arr, metrics)
+                timer.lap("bookkeeping")
+                timer.record(metrics)
+                if log is not None:
+                    log.append(metrics.generation_record(0))
+                stagnant_epochs = 0
+                start = 0
+            else:
+                fitness_arr, verified = checkpoint.fitness.copy(), checkpoint.verified
+                metrics, best_fitness = state["metrics"], state["best_fitness"]
+                stagnant_epochs = state["stagnant_epochs"]
+                start = checkpoint.generation + 1
+                for genes in state["pending"]:
+                    child = Individual(genes=genes)
+                    in_flight[evaluator.submit(child.genes[None])] = child
+                timer.lap("evaluation")
+
+            members = list(pop.members)
+            profiler = None
+            for gen in range(start, self.generations):
+                profiler = self._toggle_profiler(profiler, gen)
+                self._emit("on_generation_start", gen + 1, pop, fitness_arr)
+                timer.lap("bookkeeping")
+                started = time.perf_counter()
+                # Enough parents for this generation's children plus those in flight at its end
+                pairs = self._select_pairs(members, fitness_arr, self.pop_size + evaluator.max_workers)
+                timer.lap("selection")
+                bred: List[Individual] = []
+                for _ in range(self.pop_size):
+                    while len(in_flight) < evaluator.max_workers:
+                        if not bred:
+                            bred = self._breed(pairs.pop(), timer)
+                        child = bred.pop(0)
+                        in_flight[evaluator.submit(child.genes[None])] = child
+                        timer.lap("evaluation")
+                    done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                    future = next(iter(done))
+                    score = float(evaluator.collect(future)[0])
+                    timer.lap("evaluation")
+                    worst = self._worst_index(fitness_arr, verified)
+                    members[worst] = in_flight.pop(future)
+                    fitness_arr[worst] = score
+                    timer.lap("replacement")
+
+                pop = PopulationArray.from_individuals(members)
+                if self.migration is not None and self.migration.due(gen) and gen + 1 < self.generations:
+                    pop, fitness_arr, verified = self._migrate(gen, pop, fitness_arr, verified, evaluator)
+                    members = list(pop.members)
+                    timer.lap("migration")
+                self._emit("on_evaluated", gen + 1, pop, fitness_arr, verified)
+                stats = self._take_stats(evaluator)
+                # Idle worker time: the part of the wall time the workers did not spend scoring
+                wall = time.perf_counter() - started
+                stats.dispatch_time = max(wall - stats.compute_time / evaluator.max_workers, 0.0)
+                best_fitness, stagnant_epochs, stop = self._track_progress(
+                    gen + 1, pop, fitness_arr, verified, best_fitness, stagnant_epochs
+                )
+                if stop:
+                    break
+
+                timer.lap("bookkeeping")
+                diversity = self._diversity(gen + 1, pop)
+                timer.lap("diversity")
+                self._record_generation(metrics, fitness_arr, self._best(fitness_arr, verified), diversity, None)
+                self._record_evaluation(metrics, stats)
+                metrics.resolution_scales.append(1.0)
+                self._emit("on_generation_end", gen + 1, pop, fitness_arr, metrics)
+                timer.lap("bookkeeping")
+                timer.record(metrics)
+                if log is not None:
+                    log.append(metrics.generation_record(gen + 1))
+                if writer is not None and (gen + 1) % self.checkpoint_every == 0:
+                    pending = np.array([child.genes for child in in_flight.values()], dtype=np.float32)
+                    writer.submit(self._checkpoint(
+                        gen, pop, fitness_arr, verified, best_fitness, stagnant_epochs, 0, metrics, pending
+                    ))
+                    if log is not None:
+                        # A resume continues after the checkpoint: the log must not end before it
+                        log.flush(wait=True)
+                    timer.lap("checkpoint")
+            self._toggle_profiler(profiler, None)
+            # Children still being scored are dropped
+            for future in in_flight:
+                future.cancel()
+            wait(in_flight)
+
+        return pop[self._best_index(fitness_arr, verified)], metrics
+
+    def run(
+            self, population: Sequence[Individual] | PopulationArray, checkpoint: Checkpoint | None = None
+    ) -> tuple[Individual, GAMetrics]:
+        """Run the genetic algorithm and return the best individual and its fitness value.
+
+        With ``checkpoint`` (see ``resume``) the run continues after its generation instead
+        of scoring ``population`` from scratch.
+        """
         if len(population) != self.pop_size:
             raise ValueError(
                 f"Population size {len(population)} != expected {self.pop_size}"
             )
 
-        pop: List[Individual] = list(population)
-        with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
-            fitness = self._evaluate(pop, executor)
-            #Instantiate metrics storage
-            metrics = GAMetrics()
-            #Store metrics for initial population
-            fitness_arr = np.array(fitness)
-            metrics.max_fitnesses.append(fitness_arr.max())
-            metrics.min_fitnesses.append(fitness_arr.min())
-            metrics.mean_fitnesses.append(fitness_arr.mean())
-            metrics.std_fitnesses.append(fitness_arr.std())
-            metrics.population_diversities.append(population_diversity(pop))
-
-            #for early stopping if convergence tracking variables:
-            best_fitness = fitness_arr.max() if self.maximize else fitness_arr.min()
-            stagnant_epochs = 0
+        # Genomes live in one contiguous array; individuals are row views (see PopulationArray)
+        pop = population if isinstance(population, PopulationArray) else PopulationArray.from_individuals(population)
+        if self.steady_state:
+            return self._run_steady_state(pop, checkpoint)
+        # Target pyramid: one scaled fitness per stage, built once; the last entry is full resolution
+        stage_fitness = [scale_fitness(self.fitness, s.scale) for s in self.resolution_schedule] + [self.fitness]
+        stage_scales = [s.scale for s in self.resolution_schedule] + [1.0]
+        state = self._restore(checkpoint) if checkpoint is not None else None
+        stage = self._stage_at(0) if state is None else state["stage"]
+        with ExitStack() as stack:
+            writer = None
+            if self.checkpoint_every > 0 and self.checkpoint_path:
+                writer = stack.enter_context(CheckpointWriter(self.checkpoint_path))
+            log = None
+            if self.metrics_log_path:
+                log = stack.enter_context(MetricsLogWriter(
+                    self.metrics_log_path, self.metrics_log_flush_every, self.metrics_log_flush_seconds
+                ))
+            timer = PhaseTimer()
+            timer.start()
+            evaluator, surrogate = self._open_evaluators(stack, stage_fitness[stage])
+            if state is None:
+                fitness_arr, verified, correlation = self._score(pop.members, evaluator, surrogate, ())
+                timer.lap("evaluation")
+                self._emit("on_evaluated", 0, pop, fitness_arr, verified)
+                timer.lap("bookkeeping")
+                #Instantiate metrics storage
+                metrics = GAMetrics(diversity_method=self.diversity)
+                #Store metrics for initial population
+                best_fitness = self._best(fitness_arr, verified)
+                diversity = self._diversity(0, pop)
+                timer.lap("diversity")
+                self._record_generation(metrics, fitness_arr, best_fitness, diversity, correlation)
+                self._record_evaluation(metrics, self._take_stats(evaluator, surrogate))
+                metrics.resolution_scales.append(stage_scales[stage])
+                self._emit("on_generation_end", 0, pop, fitness_arr, metrics)
+                timer.lap("bookkeeping")
+                timer.record(metrics)
+                if log is not None:
+                    log.append(metrics.generation_record(0))
 
-            for gen in range(self.generations):
-                ranked = sorted(zip(fitness, pop), key=lambda t: t[0], reverse=self.maximize)
+                #for early stopping if convergence tracking variables:
+                stagnant_epochs = 0
+                start = 0
+            else:
+                fitness_arr, verified = checkpoint.fitness, checkpoint.verified
+                metrics, best_fitness = state["metrics"], state["best_fitness"]
+                stagnant_epochs = state["stagnant_epochs"]
+                start = checkpoint.generation + 1
+                timer.lap("evaluation")  # evaluator start-up
+            fitness = fitness_arr.tolist()
+
+            profiler = None
+            for gen in range(start, self.generations):
+                profiler = self._toggle_profiler(profiler, gen)
+                timer.lap("bookkeeping")
+                if self._stage_at(gen) != stage:
+                    # Scores from different resolutions are not comparable: re-score the population
+                    # and restart the early-stopping baseline
+                    stage = self._stage_at(gen)
+                    for ev in (evaluator, surrogate):
+                        if ev is not None:
+                            ev.close()
+                    evaluator, surrogate = self._open_evaluators(stack, stage_fitness[stage])
+                    self._fitness_cache.clear()
+                    fitness_arr, verified, _ = self._score(pop.members, evaluator, surrogate, ())
+                    fitness = fitness_arr.tolist()
+                    best_fitness = self._best(fitness_arr, verified)
+                    stagnant_epochs = 0
+                    timer.lap("evaluation")
+                self._emit("on_generation_start", gen + 1, pop, fitness_arr)
+                timer.lap("bookkeeping")
+
+                order = self._ranking(fitness, verified)
+                ranked = [(fitness[i], pop[i]) for i in order]
                 elite = [ind for _, ind in ranked[: self.elitism]]
 
                 max_children = max(0, self.pop_size - self.elitism)
@@ -98,21 +686,21 @@ class GAEngine:
 
                 sel_scores = self._selection_scores(fitness)
 
-                def make_child():
-                    i, j = self.selection.select(sel_scores, 2)
-                    p1, p2 = pop[i], pop[j]
-                    c1, c2 = self.crossover.crossover(p1, p2)
-                    if self.mutation is not None:
-                        c1 = self.mutation.mutate(c1)
-                        c2 = self.mutation.mutate(c2)
-                    return c1, c2
-
-                children: List[Individual] = []
                 num_pairs = (num_children + 1) // 2
-                for _ in range(num_pairs):
-                    c1, c2 = make_child()
-                    children.extend((c1, c2))
-                children = list(islice(children, num_children))
+                # All parents of the generation in one draw. Shuffled before pairing, since
+                # strategies such as universal sampling return indices in wheel order
+                parents = np.array(self.selection.select(sel_scores, 2 * num_pairs), dtype=np.intp)
+                pairs = self.np_rng.permutation(parents).reshape(num_pairs, 2)
+                timer.lap("selection")
+                child_genes = self._crossover(pop, pairs)[:num_children]
+                timer.lap("crossover")
+                child_genes = self._mutate(child_genes)
+                # Lineage lets incremental fitness strategies redraw only changed triangles
+                children = [
+                    Individual.derive(Individual(genes=genes), pop[i])
+                    for genes, i in zip(child_genes, pairs.ravel())
+                ]
+                timer.lap("mutation")
 
                 survivors_needed = self.pop_size - self.elitism - len(children)
                 if survivors_needed > 0:
@@ -144,43 +732,57 @@ class GAEngine:
                     best_ind = elite[0] if elite else ranked[0][1]
                     new_pop.extend([best_ind] * fill)
 
-                pop = new_pop
-                fitness = self._evaluate(pop, executor)
-                #Store metrics for current population
-                fitness_arr = np.array(fitness)
-                max_f = float(fitness_arr.max())
-                min_f = float(fitness_arr.min())
-
-                # --- Early Stopping Logic ---
-                current_best = max_f if self.maximize else min_f
-
-                if not self.maximize and self.error_threshold is not None:
-                    if min_f <= self.error_threshold:
-                        print(
-                            f"Early stopping at generation {gen + 1}: error_threshold reached ({min_f:.6f} ≤ {self.error_threshold})")
-                        break
-
-                if (self.maximize and current_best > best_fitness) or (
-                        not self.maximize and current_best < best_fitness):
-                    best_fitness = current_best
-                    stagnant_epochs = 0
-                else:
-                    stagnant_epochs += 1
+                pop = PopulationArray.from_individuals(new_pop)
+                timer.lap("replacement")
+                fitness_arr, verified, correlation = self._score(pop.members, evaluator, surrogate, range(len(elite)))
+                timer.lap("evaluation")
+                if self.migration is not None and self.migration.due(gen) and gen + 1 < self.generations:
+                    pop, fitness_arr, verified = self._migrate(gen, pop, fitness_arr, verified, evaluator)
+                    timer.lap("migration")
+                self._emit("on_evaluated", gen + 1, pop, fitness_arr, verified)
+                fitness = fitness_arr.tolist()
+                stats = self._take_stats(evaluator, surrogate)
 
-                if self.early_stopping_patience > 0 and stagnant_epochs >= self.early_stopping_patience:
-                    print(
-                        f"Early stopping at generation {gen + 1}: no improvement for {self.early_stopping_patience} generations.")
+                best_fitness, stagnant_epochs, stop = self._track_progress(
+                    gen + 1, pop, fitness_arr, verified, best_fitness, stagnant_epochs,
+                    full_resolution=stage == len(self.resolution_schedule),
+                )
+                if stop:
                     break
 
                 # --- Continue with metrics ---
-                mean_f = float(fitness_arr.mean())
-                std_f = float(fitness_arr.std())
-                metrics.max_fitnesses.append(max_f)
-                metrics.min_fitnesses.append(min_f)
-                metrics.mean_fitnesses.append(mean_f)
-                metrics.std_fitnesses.append(std_f)
-                metrics.population_diversities.append(population_diversity(pop))
-                print(f"Generation {gen+1}/{self.generations}: max={max_f:.6g} min={min_f:.6g} mean={mean_f:.6g} std={std_f:.6g}")
-
-        best_idx = int(fitness_arr.argmax()) if self.maximize else int(fitness_arr.argmin())
-        return pop[best_idx], metrics
+                timer.lap("bookkeeping")
+                diversity = self._diversity(gen + 1, pop)
+                timer.lap("diversity")
+                self._record_generation(metrics, fitness_arr, self._best(fitness_arr, verified), diversity, correlation)
+                self._record_evaluation(metrics, stats)
+                metrics.resolution_scales.append(stage_scales[stage])
+                self._emit("on_generation_end", gen + 1, pop, fitness_arr, metrics)
+                timer.lap("bookkeeping")
+                timer.record(metrics)
+                if log is not None:
+                    log.append(metrics.generation_record(gen + 1))
+                if writer is not None and (gen + 1) % self.checkpoint_every == 0:
+                    writer.submit(self._checkpoint(
+                        gen, pop, fitness_arr, verified, best_fitness, stagnant_epochs, stage, metrics
+                    ))
+                    if log is not None:
+                        # A resume continues after the checkpoint: the log must not end before it
+                        log.flush(wait=True)
+                    timer.lap("checkpoint")
+            self._toggle_profiler(profiler, None)
+
+            if stage != len(self.resolution_schedule):
+                # The schedule outlasted the run: pick the best individual by full-resolution fitness
+                for ev in (evaluator, surrogate):
+                    if ev is not None:
+                        ev.close()
+                evaluator = stack.enter_context(self._build_evaluator(self.fitness))
+                self._fitness_cache.clear()
+                fitness_arr = np.array(self._evaluate(pop.members, evaluator))
+                verified = np.ones(len(fitness_arr), dtype=bool)
+
+        metrics.fitness_cache_hits = self._cache_hits
+        metrics.fitness_cache_misses = self._cache_misses
+        # Best among the full-resolution scores
+        return pop[self._best_index(fitness_arr, verified)], metrics
@@ -0,0 +1,274 @@
+from __future__ import annotations
+
+import copy
+import math
+import os
+import pickle
+import time
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import partial
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, Dict, List, Sequence, Tuple, Type
+
+import numpy as np
+
+from src.models.individual import Individual
+from src.strategies.fitness.FitnessStrategy import FitnessStrategy
+
+# Per-worker state, set once by ``_init_worker``
+_worker_fitness: FitnessStrategy | None = None
+_worker_blocks: List[SharedMemory] = []
+
+
+def _init_worker(fitness: FitnessStrategy, arrays: Dict[str, Tuple[str, tuple, str]]) -> None:
+    """Attach the shared arrays (target image and friends) and install the worker's fitness."""
+    global _worker_fitness
+    for name, (shm_name, shape, dtype) in arrays.items():
+        shm = SharedMemory(name=shm_name)
+        _worker_blocks.append(shm)  # keep the mapping alive for the worker's lifetime
+        arr = np.ndarray(shape, dtype=np.dtype(dtype), buffer=shm.buf)
+        arr.flags.writeable = False
+        setattr(fitness, name, arr)
+    _worker_fitness = fitness
+
+
+def _score_genes(fitness: FitnessStrategy, genes: np.ndarray) -> Tuple[np.ndarray, float]:
+    """Score a ``(count, num_triangles, GENE_SIZE)`` gene array through the batch path when
+    available. Returns the float64 scores and the seconds spent scoring.
+    """
+    start = time.perf_counter()
+    population = [Individual(genes=row) for row in genes]
+    if hasattr(fitness, "evaluate_batch"):
+        scores = fitness.evaluate_batch(population)
+    else:
+        scores = [fitness.evaluate(ind) for ind in population]
+    return np.asarray(scores, dtype=np.float64), time.perf_counter() - start
+
+
+def _evaluate_chunk(payload: bytes) -> bytes:
+    """Worker task: ``_score_genes`` on a pickled gene array, with a pickled result."""
+    result = _score_genes(_worker_fitness, pickle.loads(payload))
+    return pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+@dataclass
+class EvaluationStats:
+    """Accumulated cost of the evaluations since the last ``take_stats``."""
+    ipc_bytes: int = 0  # pickled genomes sent plus scores received
+    compute_time: float = 0.0  # seconds spent scoring inside the workers, summed over tasks
+    dispatch_time: float = 0.0  # wall-clock seconds not explained by compute: pickling, queues, idle workers
+
+
+class Evaluator:
+    """Scores populations in chunks of genomes on some kind of worker pool.
+
+    Individuals are grouped into chunks, each scored through the fitness batch
+    path by one worker. ``chunksize`` fixes the chunk length; ``"auto"`` sizes
+    chunks from the measured per-individual compute time and per-task overhead,
+    keeping the overhead near ``AUTO_OVERHEAD`` of the compute while leaving at
+    least one chunk per worker. Subclasses implement ``_map``.
+
+    ``submit`` and ``collect`` score single gene arrays asynchronously instead, for
+    callers that keep the workers busy themselves (see ``GAEngine.steady_state``).
+
+    Use as a context manager so the workers are released.
+    """
+
+    AUTO_OVERHEAD = 0.05  # target ratio of per-task overhead to per-task compute
+
+    def __init__(
+            self, fitness: FitnessStrategy, max_workers: int | None = None, chunksize: int | str = "auto"
+    ) -> None:
+        if chunksize != "auto" and (not isinstance(chunksize, int) or chunksize < 1):
+            raise ValueError(f"chunksize must be 'auto' or a positive integer, got {chunksize!r}")
+        self.fitness = fitness
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.chunksize = chunksize
+        self.stats = EvaluationStats()
+        # Running estimates for ``chunksize="auto"``, in seconds
+        self._time_per_individual: float | None = None
+        self._time_per_task: float | None = None
+
+    def evaluate(self, population: Sequence[Individual]) -> List[float]:
+        """Return fitness scores for ``population``, scored in chunks across the workers."""
+        if not population:
+            return []
+        start = time.perf_counter()
+        genes = np.stack([ind.genes for ind in population])
+        size = self._chunk_length(len(genes))
+        results = self._map([genes[i : i + size] for i in range(0, len(genes), size)])
+        wall = time.perf_counter() - start
+
+        compute = sum(seconds for _, seconds in results)
+        # Chunks run ``max_workers`` at a time; the rest of the wall time is dispatch overhead
+        rounds = math.ceil(len(results) / self.max_workers)
+        dispatch = max(wall - compute / min(len(results), self.max_workers), 0.0)
+        self._update_estimates(compute / len(genes), dispatch / rounds)
+        self.stats.compute_time += compute
+        self.stats.dispatch_time += dispatch
+        return [float(f) for scores, _ in results for f in scores]
+
+    def submit(self, genes: np.ndarray) -> Future:
+        """Start scoring the gene array ``genes`` as one task, whatever ``chunksize``, and
+        return a future to pass to ``collect``. Pools run it in the background, so up
+        to ``max_workers`` of them run at once; this base version scores it on the spot.
+        """
+        future: Future = Future()
+        future.set_result(self._map([genes])[0])
+        return future
+
+    def collect(self, future: Future) -> np.ndarray:
+        """Scores of a ``submit``-ted gene array, waiting for them if needed; their compute
+        time goes into the stats (dispatch time is left to the caller, which knows the
+        wall time its tasks overlapped in).
+        """
+        scores, seconds = self._unpack(future.result())
+        self.stats.compute_time += seconds
+        return scores
+
+    def _unpack(self, result: Any) -> Tuple[np.ndarray, float]:
+        """Turn the result of a ``submit`` future into a ``_score_genes`` result."""
+        return result
+
+    def take_stats(self) -> EvaluationStats:
+        """Return the stats accumulated since the previous call and reset them."""
+        stats, self.stats = self.stats, EvaluationStats()
+        return stats
+
+    def close(self) -> None:
+        pass
+
+    def _map(self, chunks: List[np.ndarray]) -> List[Tuple[np.ndarray, float]]:
+        """Score each gene chunk, returning ``_score_genes`` results in order."""
+        raise NotImplementedError
+
+    def _chunk_length(self, count: int) -> int:
+        one_per_worker = math.ceil(count / self.max_workers)
+        if self.chunksize != "auto":
+            return self.chunksize
+        if not self._time_per_individual:
+            return one_per_worker
+        wanted = math.ceil(self._time_per_task / (self.AUTO_OVERHEAD * self._time_per_individual))
+        return max(1, min(wanted, one_per_worker))
+
+    def _update_estimates(self, per_individual: float, per_task: float) -> None:
+        # Exponential moving averages smooth out generation-to-generation noise
+        if self._time_per_individual is None:
+            self._time_per_individual, self._time_per_task = per_individual, per_task
+        else:
+            self._time_per_individual = 0.5 * self._time_per_individual + 0.5 * per_individual
+            self._time_per_task = 0.5 * self._time_per_task + 0.5 * per_task
+
+    def __enter__(self) -> Evaluator:
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+class ProcessEvaluator(Evaluator):
+    """Persistent process pool for fitness evaluation.
+
+    The fitness strategy is shipped to each worker once, at pool start-up. Its
+    ndarray attributes (the target image and any precomputed versions of it) are
+    placed in ``multiprocessing.shared_memory`` instead and mapped read-only by
+    every worker. Tasks carry only compact gene arrays and return float64
+    scores; their pickled size is counted in ``EvaluationStats.ipc_bytes``.
+    """
+
+    def __init__(
+            self, fitness: FitnessStrategy, max_workers: int | None = None, chunksize: int | str = "auto"
+    ) -> None:
+        super().__init__(fitness, max_workers, chunksize)
+        self._blocks: List[SharedMemory] = []
+        shipped = copy.copy(fitness)
+        arrays: Dict[str, Tuple[str, tuple, str]] = {}
+        for name, value in vars(fitness).items():
+            if not isinstance(value, np.ndarray):
+                continue
+            shm = SharedMemory(create=True, size=max(value.nbytes, 1))
+            self._blocks.append(shm)
+            np.ndarray(value.shape, dtype=value.dtype, buffer=shm.buf)[...] = value
+            arrays[name] = (shm.name, value.shape, value.dtype.str)
+            setattr(shipped, name, None)
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.max_workers, initializer=_init_worker, initargs=(shipped, arrays)
+        )
+
+    def _map(self, chunks: List[np.ndarray]) -> List[Tuple[np.ndarray, float]]:
+        payloads = [pickle.dumps(chunk, protocol=pickle.HIGHEST_PROTOCOL) for chunk in chunks]
+        results = list(self._executor.map(_evaluate_chunk, payloads))
+        self.stats.ipc_bytes += sum(map(len, payloads)) + sum(map(len, results))
+        return [pickle.loads(result) for result in results]
+
+    def submit(self, genes: np.ndarray) -> Future:
+        payload = pickle.dumps(genes, protocol=pickle.HIGHEST_PROTOCOL)
+        self.stats.ipc_bytes += len(payload)
+        return self._executor.submit(_evaluate_chunk, payload)
+
+    def _unpack(self, result: bytes) -> Tuple[np.ndarray, float]:
+        self.stats.ipc_bytes += len(result)
+        return pickle.loads(result)
+
+    def close(self) -> None:
+        self._executor.shutdown()
+        for shm in self._blocks:
+            shm.close()
+            shm.unlink()
+        self._blocks.clear()
+
+
+class ThreadEvaluator(Evaluator):
+    """Thread pool sharing the fitness strategy, and its target, with the caller.
+
+    No spawning or pickling and a single copy of the target in memory. Threads
+    scale with cores as far as rendering and scoring run inside NumPy and Pillow
+    calls, which release the GIL on large arrays.
+    """
+
+    def __init__(
+            self, fitness: FitnessStrategy, max_workers: int | None = None, chunksize: int | str = "auto"
+    ) -> None:
+        super().__init__(fitness, max_workers, chunksize)
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers)
+
+    def _map(self, chunks: List[np.ndarray]) -> List[Tuple[np.ndarray, float]]:
+        return list(self._executor.map(partial(_score_genes, self.fitness), chunks))
+
+    def submit(self, genes: np.ndarray) -> Future:
+        return self._executor.submit(_score_genes, self.fitness, genes)
+
+    def close(self) -> None:
+        self._executor.shutdown()
+
+
+class SerialEvaluator(Evaluator):
+    """Scores everything in the calling thread; the baseline and the easiest to debug."""
+
+    def __init__(
+            self, fitness: FitnessStrategy, max_workers: int | None = None, chunksize: int | str = "auto"
+    ) -> None:
+        super().__init__(fitness, 1, chunksize)
+
+    def _map(self, chunks: List[np.ndarray]) -> List[Tuple[np.ndarray, float]]:
+        return [_score_genes(self.fitness, chunk) for chunk in chunks]
+
+    def _chunk_length(self, count: int) -> int:
+        # Nothing to dispatch: one batch unless a chunk size is configured
+        return count if self.chunksize == "auto" else self.chunksize
+
+
+_EVALUATORS: Dict[str, Type[Evaluator]] = {
+    "process": ProcessEvaluator,
+    "thread": ThreadEvaluator,
+    "serial": SerialEvaluator,
+}
+
+
+def build_evaluator(name: str, params: Dict) -> Evaluator:
+    if name == "remote":
+        # Imported on demand: the remote module builds on this one
+        from src.engine.remote import RemoteEvaluator
+        return RemoteEvaluator(**params)
+    return _EVALUATORS[name](**params)
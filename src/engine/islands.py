@@ -0,0 +1,231 @@
+from __future__ import annotations
+
+import dataclasses
+import multiprocessing as mp
+import queue
+import random
+from pathlib import Path
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Dict, List, Mapping, Sequence, Set, Tuple
+
+import numpy as np
+
+from src.models.individual import Individual
+from src.utils.metrics import GAMetrics
+
+if TYPE_CHECKING:
+    from src.engine.engine import GAEngine
+
+_TOPOLOGIES = ("ring", "random")
+
+
+@dataclass(frozen=True)
+class IslandModel:
+    """Evolve ``count`` sub-populations in separate processes, each with its own ``GAEngine``.
+
+    Every ``migration_interval`` generations each island sends copies of its
+    ``migration_size`` best individuals to one neighbour, which replace that
+    neighbour's worst. ``topology`` picks the neighbour: ``"ring"`` always sends
+    to the next island, ``"random"`` to the next island of a random cycle drawn
+    anew each round (the same on every island).
+    """
+    count: int = 1
+    migration_interval: int = 10
+    migration_size: int = 1
+    topology: str = "ring"  # "ring" | "random"
+
+    def __post_init__(self) -> None:
+        if self.count < 1:
+            raise ValueError(f"Island count must be at least 1, got {self.count}")
+        if self.migration_interval < 1:
+            raise ValueError(f"Migration interval must be at least 1, got {self.migration_interval}")
+        if self.migration_size < 0:
+            raise ValueError(f"Migration size must be non-negative, got {self.migration_size}")
+        if self.topology not in _TOPOLOGIES:
+            raise ValueError(f"Unknown island topology: {self.topology!r}")
+
+    def run(self, engine: GAEngine, populations: Sequence[Sequence[Individual]]) -> Tuple[Individual, GAMetrics]:
+        """Run ``engine`` on each of ``populations`` (one per island) and return the best
+        individual over all islands with the merged metrics (see ``merge_metrics``).
+
+        Each island runs a copy of ``engine`` reseeded from its ``rng``, so results are
+        reproducible for a given seed. The engine's evaluator runs inside each island:
+        ``max_workers`` is per island. Island runs are not checkpointed.
+        """
+        if len(populations) != self.count:
+            raise ValueError(f"Expected {self.count} populations, got {len(populations)}")
+        if engine.checkpoint_every > 0:
+            raise ValueError("Island runs are not checkpointed; set checkpoint_every to 0")
+        seeds = [engine.rng.getrandbits(64) for _ in range(self.count)]
+        topology_seed = engine.rng.getrandbits(64)
+        inboxes = [mp.Queue() for _ in range(self.count)]
+        results: mp.Queue = mp.Queue()
+        processes = [
+            mp.Process(
+                target=_run_island,
+                args=(engine, populations[i], Migration(i, self, inboxes, topology_seed), seeds[i], results),
+                name=f"island-{i}",
+            )
+            for i in range(self.count)
+        ]
+        for p in processes:
+            p.start()
+        try:
+            outcomes: Dict[int, Tuple[Individual, float, GAMetrics]] = {}
+            while len(outcomes) < self.count:
+                try:
+                    island, outcome = results.get(timeout=1.0)
+                except queue.Empty:
+                    dead = [p.name for p in processes if p.exitcode not in (None, 0)]
+                    if dead:
+                        raise RuntimeError(f"Island process failed: {', '.join(dead)}")
+                    continue
+                if isinstance(outcome, BaseException):
+                    raise RuntimeError(f"Island {island} failed") from outcome
+                outcomes[island] = outcome
+        finally:
+            # Migrants sent to islands that had already finished are never read; drain them so
+            # their senders can flush their queues and exit
+            for inbox in inboxes:
+                _drain(inbox)
+            for p in processes:
+                p.join(timeout=5.0)
+                if p.is_alive():
+                    p.terminate()
+
+        island_metrics = [outcomes[i][2] for i in range(self.count)]
+        scores = np.array([outcomes[i][1] for i in range(self.count)])
+        best = int(scores.argmax() if engine.maximize else scores.argmin())
+        return outcomes[best][0], merge_metrics(island_metrics)
+
+
+@dataclass
+class Migration:
+    """One island's end of the migration channels: every island has an inbox queue, and
+    messages carry ``(sender, round, genes)``, ``genes=None`` meaning the sender finished.
+    """
+    island: int
+    model: IslandModel
+    inboxes: Sequence[mp.Queue]
+    topology_seed: int
+    _received: Dict[int, np.ndarray] = field(default_factory=dict, init=False, repr=False)
+    _finished: Set[int] = field(default_factory=set, init=False, repr=False)
+
+    @property
+    def size(self) -> int:
+        return self.model.migration_size
+
+    def due(self, gen: int) -> bool:
+        """Whether migration takes place after generation ``gen`` (0-based)."""
+        return self.model.count > 1 and (gen + 1) % self.model.migration_interval == 0
+
+    def exchange(self, gen: int, emigrants: np.ndarray) -> np.ndarray | None:
+        """Send ``emigrants`` (a gene array) to this round's destination and return the genes
+        received from this round's source, or None if the source has already finished.
+        """
+        round_ = (gen + 1) // self.model.migration_interval
+        dest, source = self._neighbours(round_)
+        self.inboxes[dest].put((self.island, round_, emigrants))
+        inbox = self.inboxes[self.island]
+        while round_ not in self._received and source not in self._finished:
+            sender, r, genes = inbox.get()
+            if genes is None:
+                self._finished.add(sender)
+            else:
+                self._received[r] = genes
+        return self._received.pop(round_, None)
+
+    def close(self) -> None:
+        """Tell every other island not to wait for migrants from this one any more."""
+        for i, inbox in enumerate(self.inboxes):
+            if i != self.island:
+                inbox.put((self.island, -1, None))
+
+    def _neighbours(self, round_: int) -> Tuple[int, int]:
+        """Destination and source islands of round ``round_``."""
+        n = self.model.count
+        if self.model.topology == "ring":
+            return (self.island + 1) % n, (self.island - 1) % n
+        cycle = np.random.default_rng([self.topology_seed, round_]).permutation(n)
+        pos = int(np.flatnonzero(cycle == self.island)[0])
+        return int(cycle[(pos + 1) % n]), int(cycle[pos - 1])
+
+
+def _run_island(
+        engine: GAEngine, population: Sequence[Individual], migration: Migration, seed: int, results: mp.Queue
+) -> None:
+    try:
+        island = dataclasses.replace(
+            engine,
+            rng=random.Random(seed),
+            migration=migration,
+            label=f"[island {migration.island}] ",
+            metrics_log_path=_island_path(engine.metrics_log_path, migration.island),
+        )
+        best, metrics = island.run(population)
+        results.put((migration.island, (best, island.fitness.evaluate(best), metrics)))
+    except BaseException as exc:
+        results.put((migration.island, exc))
+        raise
+    finally:
+        migration.close()
+
+
+def _island_path(path: str | None, island: int) -> str | None:
+    """``metrics.ndjson`` becomes ``metrics_island<island>.ndjson``."""
+    if not path:
+        return path
+    path = Path(path)
+    return str(path.with_name(f"{path.stem}_island{island}{path.suffix}"))
+
+
+def _drain(q: mp.Queue) -> None:
+    try:
+        while True:
+            q.get_nowait()
+    except (queue.Empty, OSError, ValueError):
+        pass
+
+
+def merge_metrics(islands: Sequence[GAMetrics]) -> GAMetrics:
+    """Combine per-island metrics into one ``GAMetrics`` over all islands.
+
+    Per generation, the overall best, worst, mean and standard deviation are those
+    of the union of the islands' (equal-sized) populations, diversity is the mean of
+    the islands', and evaluation costs and phase times are summed. Islands that stopped early only
+    contribute to the generations they ran. Each island's own metrics are kept in
+    ``islands``.
+    """
+    merged = GAMetrics(
+        diversity_method=islands[0].diversity_method if islands else "exact",
+        islands=[dataclasses.asdict(m) for m in islands],
+    )
+    generations = max((len(m.mean_fitnesses) for m in islands), default=0)
+    for gen in range(generations):
+        alive = [m for m in islands if gen < len(m.mean_fitnesses)]
+        means = np.array([m.mean_fitnesses[gen] for m in alive])
+        stds = np.array([m.std_fitnesses[gen] for m in alive])
+        mean = float(means.mean())
+        merged.mean_fitnesses.append(mean)
+        merged.std_fitnesses.append(float(np.sqrt(max(np.mean(stds ** 2 + means ** 2) - mean ** 2, 0.0))))
+        merged.max_fitnesses.append(max(m.max_fitnesses[gen] for m in alive))
+        merged.min_fitnesses.append(min(m.min_fitnesses[gen] for m in alive))
+        merged.population_diversities.append(float(np.mean([m.population_diversities[gen] for m in alive])))
+        merged.ipc_bytes.append(sum(m.ipc_bytes[gen] for m in alive))
+        merged.eval_compute_times.append(sum(m.eval_compute_times[gen] for m in alive))
+        merged.eval_dispatch_times.append(sum(m.eval_dispatch_times[gen] for m in alive))
+        merged.resolution_scales.append(alive[0].resolution_scales[gen])
+        for phase in alive[0].phase_wall_times:
+            merged.phase_wall_times.setdefault(phase, []).append(sum(m.phase_wall_times[phase][gen] for m in alive))
+            merged.phase_cpu_times.setdefault(phase, []).append(sum(m.phase_cpu_times[phase][gen] for m in alive))
+    correlations: List[List[float]] = [m.surrogate_rank_correlations for m in islands if m.surrogate_rank_correlations]
+    for gen in range(max(map(len, correlations), default=0)):
+        merged.surrogate_rank_correlations.append(float(np.mean([c[gen] for c in correlations if gen < len(c)])))
+    merged.fitness_cache_hits = sum(m.fitness_cache_hits for m in islands)
+    merged.fitness_cache_misses = sum(m.fitness_cache_misses for m in islands)
+    return merged
+
+
+def build_island_model(entry: Mapping | None) -> IslandModel:
+    """Parse ``ga.islands``, e.g. ``{count: 4, migration_interval: 10, migration_size: 2, topology: ring}``."""
+    return IslandModel(**(entry or {}))
@@ -0,0 +1,357 @@
+"""Fitness evaluation on remote worker servers over TCP.
+
+Run a server on each machine (or several on one box)::
+
+    python -m src.engine.remote --host 10.0.0.2 --port 5000
+
+binding it to the machine's address on the private network, and point
+``ga.executor: remote`` at them through ``ga.executor_params.workers``
+(``host:port`` strings). The fitness strategy is described to each server once,
+at handshake: its registry name and constructor parameters as JSON, including
+its renderer's, with its ndarray parameters (the target image) sent as raw bytes
+after them. The server only builds registered fitness strategies and renderers
+from that, and never unpickles anything. Generations then only carry packed
+float32 gene arrays one way and float64 scores the other. There is no
+authentication: anyone who reaches a server can use its CPU, so keep it off
+public interfaces.
+
+Wire format: every frame is a ``!BQ`` header (kind, payload length) followed by
+the payload.
+
+- ``HELLO``: ``!I`` metadata length, UTF-8 JSON ``{"fitness": spec, "arrays": [[shape, dtype], ...]}``,
+  then each array's bytes in order. A spec is ``{"type": name, "params": {...}}``, where a
+  parameter is a JSON value, a nested spec, or ``{"array": index}``. Answered by ``READY``.
+- ``EVAL``: ``!III`` gene array shape, then the genes as little-endian float32.
+  Answered by ``SCORES``: ``!d`` seconds spent scoring, then little-endian float64 scores.
+- ``ERROR``: UTF-8 message, sent instead of a reply when the server fails.
+"""
+from __future__ import annotations
+
+import argparse
+import dataclasses
+import json
+import queue
+import socket
+import socketserver
+import struct
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Dict, List, Sequence, Tuple
+
+import numpy as np
+
+from src.engine.evaluation import Evaluator, _score_genes
+from src.engine.fitness import _FITNESS_STRATEGIES
+from src.engine.renderers import _RENDERERS
+from src.strategies.fitness.FitnessStrategy import FitnessStrategy
+
+HELLO, READY, EVAL, SCORES, ERROR = range(1, 6)
+_FRAME = struct.Struct("!BQ")
+_META = struct.Struct("!I")
+_SHAPE = struct.Struct("!III")
+_SECONDS = struct.Struct("!d")
+# What a handshake may build: registered fitness strategies and renderers, by name
+_SHIPPABLE: Dict[str, type] = {**_FITNESS_STRATEGIES, **_RENDERERS}
+
+
+def _send_frame(sock: socket.socket, kind: int, *parts: bytes) -> int:
+    """Send one frame made of ``parts``; returns the bytes written."""
+    length = sum(len(p) for p in parts)
+    sock.sendall(_FRAME.pack(kind, length) + b"".join(parts))
+    return _FRAME.size + length
+
+
+def _recv_exact(sock: socket.socket, n: int) -> bytearray:
+    buf = bytearray(n)
+    view = memoryview(buf)
+    while view:
+        got = sock.recv_into(view)
+        if not got:
+            raise ConnectionError("Connection closed by peer")
+        view = view[got:]
+    return buf
+
+
+def _recv_frame(sock: socket.socket) -> Tuple[int, bytearray]:
+    kind, length = _FRAME.unpack(_recv_exact(sock, _FRAME.size))
+    return kind, _recv_exact(sock, length)
+
+
+def _hello_payload(fitness: FitnessStrategy) -> List[bytes]:
+    """Describe ``fitness`` as JSON, its ndarray parameters following as raw bytes."""
+    arrays: List[np.ndarray] = []
+    meta = json.dumps({
+        "fitness": _spec(fitness, arrays),
+        "arrays": [[list(a.shape), a.dtype.str] for a in arrays],
+    }).encode()
+    return [_META.pack(len(meta)), meta, *(a.tobytes() for a in arrays)]
+
+
+def _spec(obj: Any, arrays: List[np.ndarray]) -> Dict[str, Any]:
+    """``{"type", "params"}`` of a registered dataclass, appending its ndarray parameters to ``arrays``."""
+    names = [name for name, cls in _SHIPPABLE.items() if type(obj) is cls]
+    if not names or not dataclasses.is_dataclass(obj):
+        raise TypeError(f"{type(obj).__name__} is not a registered fitness strategy or renderer")
+    params = {}
+    for f in dataclasses.fields(obj):
+        if not f.init:
+            continue
+        value = getattr(obj, f.name)
+        if isinstance(value, np.ndarray):
+            arrays.append(np.ascontiguousarray(value))
+            params[f.name] = {"array": len(arrays) - 1}
+        elif dataclasses.is_dataclass(value):
+            params[f.name] = _spec(value, arrays)
+        else:
+            params[f.name] = value
+    return {"type": names[0], "params": params}
+
+
+def _load_hello(payload: bytearray) -> FitnessStrategy:
+    (size,) = _META.unpack_from(payload)
+    offset = _META.size + size
+    meta = json.loads(payload[_META.size : offset].decode())
+    arrays = []
+    for shape, dtype in meta["arrays"]:
+        dtype = np.dtype(dtype)
+        if dtype.hasobject:
+            raise ValueError(f"Unsupported array dtype {dtype}")
+        arr = np.frombuffer(payload, dtype=dtype, count=int(np.prod(shape)), offset=offset)
+        arrays.append(arr.reshape(shape))
+        offset += arr.nbytes
+    return _build(meta["fitness"], arrays)
+
+
+def _build(spec: Dict[str, Any], arrays: List[np.ndarray]) -> Any:
+    """The object described by ``spec`` (see ``_spec``)."""
+    cls = _SHIPPABLE.get(spec["type"])
+    if cls is None:
+        raise ValueError(f"Unknown fitness strategy or renderer: {spec['type']!r}")
+    params = {}
+    for name, value in spec["params"].items():
+        if isinstance(value, dict) and "array" in value:
+            value = arrays[value["array"]]
+        elif isinstance(value, dict):
+            value = _build(value, arrays)
+        elif isinstance(value, list):
+            value = tuple(value)  # JSON has no tuples: e.g. a renderer's background colour
+        params[name] = value
+    return cls(**params)
+
+
+class _Handler(socketserver.BaseRequestHandler):
+    """One client connection: a handshake, then ``EVAL`` requests until the client hangs up."""
+
+    def handle(self) -> None:
+        sock: socket.socket = self.request
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        fitness = None
+        try:
+            while True:
+                kind, payload = _recv_frame(sock)
+                try:
+                    if kind == HELLO:
+                        fitness = _load_hello(payload)
+                        _send_frame(sock, READY)
+                    elif kind == EVAL and fitness is not None:
+                        shape = _SHAPE.unpack_from(payload)
+                        genes = np.frombuffer(payload, dtype="<f4", offset=_SHAPE.size).reshape(shape)
+                        scores, seconds = _score_genes(fitness, genes.astype(np.float32))
+                        _send_frame(sock, SCORES, _SECONDS.pack(seconds), scores.astype("<f8").tobytes())
+                    else:
+                        _send_frame(sock, ERROR, f"Unexpected frame kind {kind}".encode())
+                except Exception as exc:
+                    _send_frame(sock, ERROR, f"{type(exc).__name__}: {exc}".encode())
+        except (ConnectionError, OSError):
+            pass
+
+
+class FitnessServer(socketserver.ThreadingTCPServer):
+    """Scores gene batches for ``RemoteEvaluator`` clients, one thread per connection."""
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, address: Tuple[str, int]) -> None:
+        super().__init__(address, _Handler)
+
+
+class RemoteError(RuntimeError):
+    """The server failed to score a batch; retrying elsewhere would fail the same way."""
+
+
+class _Worker:
+    """Client side of one server connection."""
+
+    def __init__(self, address: str, timeout: float) -> None:
+        host, port = address.rsplit(":", 1)
+        self.address = (host, int(port))
+        self.timeout = timeout
+        self.sock: socket.socket | None = None
+        self.failures = 0
+
+    def connect(self, hello: Sequence[bytes]) -> int:
+        self.close()
+        sock = socket.create_connection(self.address, timeout=self.timeout)
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        try:
+            sent = _send_frame(sock, HELLO, *hello)
+            self._expect(sock, READY)
+        except BaseException:
+            sock.close()
+            raise
+        self.sock = sock
+        return sent
+
+    def evaluate(self, genes: np.ndarray) -> Tuple[Tuple[np.ndarray, float], int]:
+        """Score ``genes`` remotely; returns the ``_score_genes`` result and the bytes exchanged."""
+        sent = _send_frame(self.sock, EVAL, _SHAPE.pack(*genes.shape), genes.astype("<f4", copy=False).tobytes())
+        payload = self._expect(self.sock, SCORES)
+        (seconds,) = _SECONDS.unpack_from(payload)
+        scores = np.frombuffer(payload, dtype="<f8", offset=_SECONDS.size).astype(np.float64)
+        return (scores, seconds), sent + _FRAME.size + len(payload)
+
+    def close(self) -> None:
+        if self.sock is not None:
+            self.sock.close()
+            self.sock = None
+
+    @staticmethod
+    def _expect(sock: socket.socket, kind: int) -> bytearray:
+        got, payload = _recv_frame(sock)
+        if got == ERROR:
+            raise RemoteError(payload.decode(errors="replace"))
+        if got != kind:
+            raise ConnectionError(f"Unexpected frame kind {got}")
+        return payload
+
+
+class RemoteEvaluator(Evaluator):
+    """Pool of ``FitnessServer`` processes reached over TCP, one connection per server.
+
+    Every chunk, from ``evaluate`` or ``submit``, runs on a client thread that takes
+    whichever server is idle, so up to one chunk per server is in flight. A server
+    that times out or drops its connection is reconnected (with a new handshake) up
+    to ``retries`` times in a row while its chunk goes to the next idle server; a
+    server that exhausts its retries is dropped for the rest of the run. Evaluation
+    fails only when no server is left, or with the server's error when it fails to
+    score a chunk.
+    """
+
+    def __init__(
+            self,
+            fitness: FitnessStrategy,
+            max_workers: int | None = None,
+            chunksize: int | str = "auto",
+            workers: Sequence[str] = (),
+            timeout: float = 60.0,
+            retries: int = 2,
+    ) -> None:
+        if not workers:
+            raise ValueError("The remote executor needs at least one worker address (host:port)")
+        super().__init__(fitness, len(workers), chunksize)
+        self.retries = retries
+        self._hello = _hello_payload(fitness)
+        self._workers = [_Worker(address, timeout) for address in workers]
+        self._idle: queue.Queue[_Worker] = queue.Queue()
+        self._live = len(self._workers)
+        self._lock = threading.Lock()
+        for worker in self._workers:
+            if not self._reconnect(worker):
+                self.close()
+                raise ConnectionError(f"Cannot reach fitness server {worker.address[0]}:{worker.address[1]}")
+            self._idle.put(worker)
+        self._executor = ThreadPoolExecutor(max_workers=len(self._workers), thread_name_prefix="remote")
+
+    def submit(self, genes: np.ndarray) -> Future:
+        return self._executor.submit(self._score_chunk, genes)
+
+    def _map(self, chunks: List[np.ndarray]) -> List[Tuple[np.ndarray, float]]:
+        futures = [self.submit(chunk) for chunk in chunks]
+        return [future.result() for future in futures]
+
+    def _score_chunk(self, chunk: np.ndarray) -> Tuple[np.ndarray, float]:
+        while True:
+            worker = self._checkout()
+            try:
+                result, nbytes = worker.evaluate(chunk)
+            except OSError:
+                # Lost connection: retry the chunk on the next idle server
+                worker.failures += 1
+                self._release(worker, self._reconnect(worker))
+                continue
+            except RemoteError:
+                self._release(worker, True)
+                raise
+            except Exception:
+                # A reply that could not be parsed leaves the stream out of step: start it afresh
+                self._release(worker, self._reconnect(worker))
+                raise
+            worker.failures = 0
+            self._release(worker, True)
+            with self._lock:
+                self.stats.ipc_bytes += nbytes
+            return result
+
+    def _checkout(self) -> _Worker:
+        """Wait for an idle server; ConnectionError once none is left."""
+        while True:
+            try:
+                return self._idle.get(timeout=0.1)
+            except queue.Empty:
+                with self._lock:
+                    if self._live == 0:
+                        raise ConnectionError("All remote fitness servers were lost") from None
+
+    def _release(self, worker: _Worker, alive: bool) -> None:
+        if alive:
+            self._idle.put(worker)
+        else:
+            with self._lock:
+                self._live -= 1
+
+    def _reconnect(self, worker: _Worker) -> bool:
+        """Reconnect ``worker``; False once it has failed more than ``retries`` times in a row,
+        or at once if the server rejects the handshake.
+        """
+        while worker.failures <= self.retries:
+            if worker.failures:
+                time.sleep(min(0.1 * 2 ** worker.failures, 2.0))
+            try:
+                sent = worker.connect(self._hello)
+                with self._lock:
+                    self.stats.ipc_bytes += sent
+                return True
+            except OSError:
+                worker.failures += 1
+            except Exception:
+                # The server rejected the handshake (or answered nonsense): retrying would fail the same way
+                break
+        worker.close()
+        return False
+
+    def close(self) -> None:
+        if hasattr(self, "_executor"):
+            self._executor.shutdown()
+        for worker in self._workers:
+            worker.close()
+
+
+def serve(host: str = "127.0.0.1", port: int = 0) -> FitnessServer:
+    """Bind a ``FitnessServer`` (``port=0`` picks a free port); call ``serve_forever`` on it."""
+    return FitnessServer((host, port))
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description="Serve fitness evaluations for ga.executor: remote")
+    ap.add_argument("--host", default="127.0.0.1")
+    ap.add_argument("--port", type=int, default=5000)
+    args = ap.parse_args()
+    with serve(args.host, args.port) as server:
+        host, port = server.server_address[:2]
+        print(f"Fitness server listening on {host}:{port}")
+        server.serve_forever()
+
+
+if __name__ == "__main__":
+    main()
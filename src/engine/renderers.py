@@ -0,0 +1,27 @@
+from __future__ import annotations
+from typing import Any, Dict, Mapping
+
+from src.engine.Renderer import Renderer
+from src.engine.PillowRenderer import PillowRenderer
+from src.engine.NumpyRenderer import NumpyRenderer
+
+_RENDERERS: Dict[str, type] = {
+    "pillow": PillowRenderer,
+    "numpy": NumpyRenderer,
+}
+
+def build_renderer(name: str, params: Dict) -> Renderer:
+    return _RENDERERS[name](**params)  # type: ignore[call-arg]
+
+
+def build_renderer_from_config(entry: Mapping[str, Any], width: int, height: int) -> Renderer:
+    """Build the ``renderer`` config section: ``params`` shared by every backend, merged with
+    the options under the chosen backend's own key, e.g. ``{backend: pillow, params: {mode: rgb},
+    pillow: {compositing: bbox}, numpy: {dtype: uint8}}``. Other backends' options are ignored.
+    """
+    name = entry["backend"]
+    if name not in _RENDERERS:
+        raise ValueError(f"Unknown renderer backend: {name!r}")
+    return build_renderer(
+        name, {**(entry.get("params") or {}), **(entry.get(name) or {}), "width": width, "height": height}
+    )
@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+import dataclasses
+from dataclasses import dataclass
+from typing import Iterable, List, Mapping
+
+import numpy as np
+from PIL import Image
+
+from src.strategies.fitness.FitnessStrategy import FitnessStrategy
+
+
+@dataclass(frozen=True)
+class ResolutionStage:
+    """Evaluate at ``scale`` times the canvas size for ``generations`` generations."""
+    scale: float
+    generations: int
+
+    def __post_init__(self) -> None:
+        if not 0.0 < self.scale <= 1.0:
+            raise ValueError(f"Resolution scale must be in (0, 1], got {self.scale}")
+        if self.generations < 0:
+            raise ValueError(f"Stage generations must be non-negative, got {self.generations}")
+
+
+def build_resolution_schedule(entries: Iterable[Mapping] | None) -> List[ResolutionStage]:
+    """Parse ``ga.resolution_schedule`` entries such as ``{scale: 0.25, generations: 40}``."""
+    return [ResolutionStage(float(e["scale"]), int(e["generations"])) for e in entries or []]
+
+
+def scale_fitness(fitness: FitnessStrategy, scale: float) -> FitnessStrategy:
+    """Return a copy of ``fitness`` whose renderer and target are ``scale`` times smaller.
+
+    The target is box-filtered down from the full-resolution one, so each level
+    of the pyramid is the area average of the canvas it approximates. Genomes
+    use normalized coordinates and need no change.
+    """
+    if scale == 1.0:
+        return fitness
+    renderer = fitness.renderer
+    width = max(1, round(renderer.width * scale))
+    height = max(1, round(renderer.height * scale))
+    target = np.asarray(Image.fromarray(fitness.target).resize((width, height), Image.BOX))
+    return dataclasses.replace(
+        fitness,
+        renderer=dataclasses.replace(renderer, width=width, height=height),
+        target=target,
+    )
@@ -6,18 +6,22 @@ from typing import Tuple, List
 import numpy as np
 from PIL import Image
 from pathlib import Path
-from src.engine.PillowRenderer import PillowRenderer
+from src.engine.renderers import build_renderer_from_config
 from src.engine.crossover import build_crossover
 from src.engine.engine import GAEngine
+from src.engine.islands import build_island_model
+from src.engine.resolution import build_resolution_schedule
 from src.engine.selection import build_selection
 from src.engine.mutation import build_mutation
 from src.engine.fitness import build_fitness
 from src.models.individual import Individual
 from src.models.triangle import Triangle
+from src.utils.checkpoint import load_checkpoint
 from src.utils.config import load_config
 from time import perf_counter #For profiling time
 
 from src.utils.metrics import write_metrics, plot_metrics
+from src.utils.profiling import phase_summary
 
 
 def _init_population(pop_size: int, num_triangles: int, canvas_size: Tuple[int, int]) -> List[Individual]:
@@ -54,17 +58,36 @@ def _init_population(pop_size: int, num_triangles: int, canvas_size: Tuple[int,
 
 def main():
     ap = argparse.ArgumentParser()
-    ap.add_argument("--config", required=True)
+    ap.add_argument("--config")
     ap.add_argument("--profile", default=None)
     ap.add_argument("--set", dest="overrides", action="append", default=[])
+    ap.add_argument("--resume", default=None, metavar="DIR",
+                    help="continue the run in output directory DIR from its last checkpoint (ga.checkpoint_every)")
+    ap.add_argument("--profile-hot", type=int, nargs="?", const=2, default=None, metavar="GEN",
+                    help="run generation GEN (default 2) under cProfile and dump its stats to the output directory")
     args = ap.parse_args()
 
-    cfg = load_config(args.config, args.profile, args.overrides)
-    out = Path(cfg["experiment"]["output_dir"])  # timestamped in load_config
-    out.mkdir(parents=True, exist_ok=True)
+    if args.resume:
+        out = Path(args.resume)
+        cfg = json.loads((out / "config.json").read_text())
+    else:
+        if not args.config:
+            ap.error("--config is required unless --resume is given")
+        cfg = load_config(args.config, args.profile, args.overrides)
+        out = Path(cfg["experiment"]["output_dir"])  # timestamped in load_config
+    islands = build_island_model(cfg["ga"].get("islands"))
+    if islands.count > 1 and (args.resume or int(cfg["ga"].get("checkpoint_every", 0)) > 0):
+        ap.error("island runs (ga.islands.count > 1) are not checkpointed: set ga.checkpoint_every to 0, "
+                 "and they cannot be resumed")
+    if not args.resume:
+        out.mkdir(parents=True, exist_ok=True)
+        # The resolved config, so the run can be resumed with the same settings
+        (out / "config.json").write_text(json.dumps(cfg, indent=2))
+    checkpoint = load_checkpoint(out / "checkpoint.npz") if args.resume else None
 
     target = np.array(Image.open(cfg["data"]["image_path"]).convert("RGBA").resize(tuple(cfg["data"]["canvas_size"])) )
-    renderer = PillowRenderer(*cfg["data"]["canvas_size"]) if cfg["renderer"]["backend"] == "pillow" else None  # Other renderers TBD
+    width, height = cfg["data"]["canvas_size"]
+    renderer = build_renderer_from_config(cfg["renderer"], width, height)
     fit = build_fitness(cfg["fitness"]["name"], {**(cfg["fitness"].get("params") or {}), "renderer": renderer, "target": target})
     select = build_selection(cfg["selection"]["name"], cfg["selection"].get("params") or {})
     survivor_select = (build_selection(cfg["survivor_selection"]["name"], cfg["survivor_selection"].get("params") or {}) if "survivor_selection" in cfg else None)
@@ -84,12 +107,35 @@ def main():
         rng=random.Random(cfg["seed"]),
         rho=float(cfg["ga"].get("rho", 0.5)),
         max_workers=cfg["ga"].get("max_workers"),
+        eval_chunksize=cfg["ga"].get("eval_chunksize", "auto"),
+        executor=cfg["ga"].get("executor", "process"),
+        executor_params=cfg["ga"].get("executor_params") or {},
+        resolution_schedule=build_resolution_schedule(cfg["ga"].get("resolution_schedule")),
+        fitness_cache_size=int(cfg["ga"].get("fitness_cache_size", 0)),
+        steady_state=bool(cfg["ga"].get("steady_state", False)),
+        checkpoint_every=int(cfg["ga"].get("checkpoint_every", 0)),
+        checkpoint_path=str(out / "checkpoint.npz"),
+        profile_generation=args.profile_hot,
+        profile_path=str(out / f"profile_gen{args.profile_hot}.pstats"),
+        diversity=cfg.get("metrics", {}).get("diversity", "exact"),
+        diversity_every=int(cfg.get("metrics", {}).get("diversity_every", 1)),
+        diversity_samples=int(cfg.get("metrics", {}).get("diversity_samples", 2048)),
+        metrics_log_path=str(out / "metrics.ndjson"),
+        metrics_log_flush_every=int(cfg.get("metrics", {}).get("log_flush_every", 10)),
+        metrics_log_flush_seconds=float(cfg.get("metrics", {}).get("log_flush_seconds", 5.0)),
     )
 
-    pop = _init_population(cfg["ga"]["pop_size"], cfg["genome"]["num_triangles"], tuple(cfg["data"]["canvas_size"]))
     s_time = perf_counter()
-    best, metrics = eng.run(pop)
+    if checkpoint is not None:
+        best, metrics = eng.resume(checkpoint)
+    else:
+        pops = [
+            _init_population(cfg["ga"]["pop_size"], cfg["genome"]["num_triangles"], tuple(cfg["data"]["canvas_size"]))
+            for _ in range(islands.count)
+        ]
+        best, metrics = islands.run(eng, pops) if islands.count > 1 else eng.run(pops[0])
     e_time = perf_counter()
+    print(phase_summary(metrics))
     write_output(cfg, best, metrics, e_time - s_time, out, renderer)
     plot_metrics(metrics, out)
 
@@ -97,7 +143,10 @@ def main():
 def write_output(cfg, best, metrics, elapsed_time, out, renderer):
     print(f"GA completed in {elapsed_time:.3f} seconds.")
     (out / "best.json").write_text(json.dumps(Individual.individual_to_dict(best), indent=2))
-    img = renderer.render(best.triangles)
+    img = renderer.render(best.genes)
+    if img.dtype != np.uint8:
+        # float32 renders (numpy backend) hold 0-255 values that Pillow cannot save as they are
+        img = np.clip(np.rint(img), 0, 255).astype(np.uint8)
     Image.fromarray(img).save(out / "best.png")
     best_fitness = metrics.max_fitnesses[-1] if cfg["ga"]["maximize"] else metrics.min_fitnesses[-1]
     write_metrics(
@@ -1,13 +1,94 @@
 from __future__ import annotations
-from dataclasses import dataclass
-from typing import List
-from src.models.triangle import Triangle
+import hashlib
+import itertools
+import os
+from typing import FrozenSet, List, Sequence
+import numpy as np
+from src.models.triangle import GENE_SIZE, Triangle
+
+_uid_counter = itertools.count()
+
+
+def _next_uid() -> int:
+    # Process id in the high bits keeps ids unique across worker/island processes
+    return (os.getpid() << 32) | next(_uid_counter)
 
 
-@dataclass(slots=True)
 class Individual:
-    triangles: List[Triangle]  # índice = z-order
+    """Genome of a fixed number of triangle genes (índice = z-order).
+
+    The genome is stored as one ``(num_triangles, GENE_SIZE)`` float32 array,
+    usually a row view into a ``PopulationArray``. ``triangles`` materializes
+    ``Triangle`` objects on first access, so strategies written gene by gene keep
+    working; constructing an ``Individual`` from triangles packs them into an array.
+    """
+
+    __slots__ = ("genes", "uid", "parent_uid", "changed", "_triangles")
+
+    def __init__(
+            self,
+            triangles: Sequence[Triangle] | None = None,
+            *,
+            genes: np.ndarray | None = None,
+            uid: int | None = None,
+            parent_uid: int | None = None,
+            changed: FrozenSet[int] | None = None,
+    ) -> None:
+        if genes is None:
+            tris = list(triangles or [])
+            genes = np.array([Triangle.to_gene(t) for t in tris], dtype=np.float32).reshape(len(tris), GENE_SIZE)
+            self._triangles: List[Triangle] | None = tris
+        else:
+            self._triangles = None
+        self.genes: np.ndarray = genes
+        self.uid: int = _next_uid() if uid is None else uid
+        # Lineage: ``parent_uid`` is the scored individual this genome derives from and
+        # ``changed`` the triangle indices that differ from it (None when unknown)
+        self.parent_uid = parent_uid
+        self.changed = changed
+
+    @property
+    def triangles(self) -> List[Triangle]:
+        if self._triangles is None:
+            self._triangles = [Triangle.from_gene(row) for row in self.genes.tolist()]
+        return self._triangles
+
+    def __len__(self) -> int:
+        return len(self.genes)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Individual):
+            return NotImplemented
+        return np.array_equal(self.genes, other.genes)
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"Individual(uid={self.uid}, num_triangles={len(self.genes)})"
+
+    def __getstate__(self) -> tuple:
+        # Materialized triangles are a cache; only the compact gene array travels
+        return self.genes, self.uid, self.parent_uid, self.changed
+
+    def __setstate__(self, state: tuple) -> None:
+        self.genes, self.uid, self.parent_uid, self.changed = state
+        self._triangles = None
 
     @staticmethod
     def individual_to_dict(ind: Individual) -> dict:
-        return {"triangles": [Triangle.triangle_to_dict(t) for t in ind.triangles]}
\ No newline at end of file
+        return {"triangles": [Triangle.triangle_to_dict(t) for t in ind.triangles]}
+
+    @staticmethod
+    def genome_key(ind: Individual) -> bytes:
+        """Content hash of the genome: equal for value-equal individuals, whatever their identity."""
+        return hashlib.blake2b(np.ascontiguousarray(ind.genes).tobytes(), digest_size=16).digest()
+
+    @staticmethod
+    def derive(child: Individual, parent: Individual) -> Individual:
+        """Record ``parent`` as the lineage of ``child`` and which triangle indices changed."""
+        child.parent_uid = parent.uid
+        if child.genes.shape == parent.genes.shape:
+            child.changed = frozenset(np.flatnonzero((child.genes != parent.genes).any(axis=1)).tolist())
+        else:
+            child.changed = None
+        return child
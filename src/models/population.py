@@ -0,0 +1,52 @@
+from __future__ import annotations
+from dataclasses import dataclass
+from typing import Iterator, List, Sequence
+import numpy as np
+from src.models.individual import Individual
+from src.models.triangle import GENE_SIZE
+
+
+@dataclass
+class PopulationArray:
+    """Whole population stored as one contiguous ``(pop_size, num_triangles, GENE_SIZE)`` float32 array.
+
+    ``members`` are the ``Individual`` objects of the population; each one's ``genes``
+    is a view on its row of ``genes``, so per-individual strategies (through
+    ``Individual.triangles``) and vectorized operators see the same data.
+    """
+    genes: np.ndarray
+    members: List[Individual]
+
+    @staticmethod
+    def from_individuals(population: Sequence[Individual]) -> PopulationArray:
+        """Pack ``population`` into one contiguous array and re-point each member at its row.
+
+        Members keep their identity and lineage; an individual listed several times
+        simply ends up viewing the last of its (identical) rows.
+        """
+        if not population:
+            return PopulationArray(np.empty((0, 0, GENE_SIZE), dtype=np.float32), [])
+        genes = np.stack([ind.genes for ind in population]).astype(np.float32, copy=False)
+        members = list(population)
+        for ind, row in zip(members, genes):
+            ind.genes = row
+        return PopulationArray(genes, members)
+
+    @staticmethod
+    def from_genes(genes: np.ndarray) -> PopulationArray:
+        """Wrap a ``(pop_size, num_triangles, GENE_SIZE)`` array, creating fresh individuals for its rows."""
+        genes = np.ascontiguousarray(genes, dtype=np.float32)
+        return PopulationArray(genes, [Individual(genes=row) for row in genes])
+
+    @property
+    def num_triangles(self) -> int:
+        return self.genes.shape[1]
+
+    def __len__(self) -> int:
+        return len(self.members)
+
+    def __getitem__(self, i: int) -> Individual:
+        return self.members[i]
+
+    def __iter__(self) -> Iterator[Individual]:
+        return iter(self.members)
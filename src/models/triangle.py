@@ -2,9 +2,28 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Tuple
 
+import numpy as np
+
 Point = Tuple[float, float]           # [0,1]
 RGBA  = Tuple[int, int, int, int]     # 0..255
 
+# Gene layout as a flat row: (p1x, p1y, p2x, p2y, p3x, p3y, R, G, B, A, z_index)
+GENE_SIZE = 11
+POINTS = slice(0, 6)
+COLOR = slice(6, 10)
+ALPHA = 9
+Z_INDEX = 10
+
+
+def clip_genes(genes: np.ndarray) -> np.ndarray:
+    """Clamp a gene array in place to the valid domain: points and z_index to [0, 1],
+    colors rounded to integers in [0, 255]. Returns ``genes``.
+    """
+    np.clip(genes[..., POINTS], 0.0, 1.0, out=genes[..., POINTS])
+    np.clip(np.rint(genes[..., COLOR]), 0, 255, out=genes[..., COLOR])
+    np.clip(genes[..., Z_INDEX], 0.0, 1.0, out=genes[..., Z_INDEX])
+    return genes
+
 @dataclass(slots=True)
 class Triangle:
     p1: Point; p2: Point; p3: Point
@@ -25,3 +44,14 @@ class Triangle:
     def clone(t: Triangle) -> Triangle:
         """Create a value-equal copy of the triangle (no shared object reference)."""
         return Triangle(t.p1, t.p2, t.p3, t.color, t.z_index)
+
+    @staticmethod
+    def to_gene(t: Triangle) -> Tuple[float, ...]:
+        """Flatten the triangle into its ``GENE_SIZE`` gene row."""
+        return (*t.p1, *t.p2, *t.p3, *t.color, t.z_index)
+
+    @staticmethod
+    def from_gene(row) -> Triangle:
+        """Inverse of ``to_gene``: build a triangle from a gene row (colors rounded to ints)."""
+        x1, y1, x2, y2, x3, y3, r, g, b, a, z = (float(v) for v in row)
+        return Triangle((x1, y1), (x2, y2), (x3, y3), (round(r), round(g), round(b), round(a)), z)
@@ -3,6 +3,8 @@ import random
 from dataclasses import dataclass, field
 from typing import Tuple, List
 
+import numpy as np
+
 from src.models.individual import Individual
 from src.models.triangle import Triangle
 from src.strategies.crossover.CrossoverStrategy import CrossoverStrategy
@@ -14,6 +16,10 @@ class AnnularCrossover(CrossoverStrategy):
     - Picks a random segment (ring) of triangles from parent1.
     - Inserts it into the child.
     - Fills the rest from parent2 (preserving order and allowing duplicates).
+
+    Since the child is truncated to ``n`` triangles, a ring that wraps past the end
+    contributes only up to index ``n - 1``: position ``j`` comes from parent1 exactly
+    when ``start <= j < min(start + length, n)``, which ``crossover_batch`` uses as a mask.
     """
     rng: random.Random = field(default_factory=random.Random)
 
@@ -32,4 +38,17 @@ class AnnularCrossover(CrossoverStrategy):
             # Clone to avoid sharing references
             return Individual([Triangle.clone(t) for t in new_triangles[:n]])
 
-        return crossover_one(p1, p2), crossover_one(p2, p1)
\ No newline at end of file
+        return crossover_one(p1, p2), crossover_one(p2, p1)
+
+    def crossover_batch(
+            self, parents1: np.ndarray, parents2: np.ndarray, rng: np.random.Generator
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Vectorized ``crossover`` over paired ``(num_pairs, num_triangles, GENE_SIZE)`` parents."""
+        num_pairs, n = parents1.shape[:2]
+        if n == 0:
+            return parents1.copy(), parents2.copy()
+        start = rng.integers(0, n, size=num_pairs)
+        length = rng.integers(1, n + 1, size=num_pairs)
+        pos = np.arange(n)
+        ring = ((pos >= start[:, None]) & (pos < np.minimum(start + length, n)[:, None]))[..., None]
+        return np.where(ring, parents1, parents2), np.where(ring, parents2, parents1)
@@ -3,5 +3,11 @@ from typing import Tuple
 from src.models.individual import Individual
 
 class CrossoverStrategy:
+    """Subclasses may also provide ``crossover_batch(parents1, parents2, rng)``, which
+    recombines two ``(num_pairs, num_triangles, GENE_SIZE)`` gene arrays of paired
+    parents with a ``numpy.random.Generator`` and returns the two children arrays;
+    the engine uses it to produce all offspring of a generation at once.
+    """
+
     def crossover(self, parent1: Individual, parent2: Individual) -> Tuple[Individual, Individual]:
         raise NotImplementedError
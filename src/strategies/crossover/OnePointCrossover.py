@@ -1,6 +1,7 @@
 import random
 from dataclasses import dataclass, field
 from typing import Tuple
+import numpy as np
 from src.strategies.crossover.CrossoverStrategy import CrossoverStrategy
 from src.models.individual import Individual
 from src.models.triangle import Triangle
@@ -22,4 +23,17 @@ class OnePointCrossover(CrossoverStrategy):
         point = self.rng.randrange(1, n)
         child1_tris = [Triangle.clone(t) for t in (parent1.triangles[:point] + parent2.triangles[point:])]
         child2_tris = [Triangle.clone(t) for t in (parent2.triangles[:point] + parent1.triangles[point:])]
-        return Individual(child1_tris), Individual(child2_tris)
\ No newline at end of file
+        return Individual(child1_tris), Individual(child2_tris)
+
+    def crossover_batch(
+            self, parents1: np.ndarray, parents2: np.ndarray, rng: np.random.Generator
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Vectorized ``crossover`` over paired ``(num_pairs, num_triangles, GENE_SIZE)`` parents."""
+        if parents1.shape != parents2.shape:
+            raise ValueError("Parents must have the same number of triangles")
+        num_pairs, n = parents1.shape[:2]
+        if n < 2:
+            return parents1.copy(), parents2.copy()
+        point = rng.integers(1, n, size=num_pairs)
+        from_first = (np.arange(n) < point[:, None])[..., None]
+        return np.where(from_first, parents1, parents2), np.where(from_first, parents2, parents1)
@@ -1,6 +1,7 @@
 import random
 from dataclasses import dataclass, field
 from typing import Tuple
+import numpy as np
 from src.strategies.crossover.CrossoverStrategy import CrossoverStrategy
 from src.models.individual import Individual
 from src.models.triangle import Triangle
@@ -32,4 +33,19 @@ class TwoPointCrossover(CrossoverStrategy):
                 parent2.triangles[:point1] + parent1.triangles[point1:point2] + parent2.triangles[point2:]
         )]
 
-        return Individual(child1_tris), Individual(child2_tris)
\ No newline at end of file
+        return Individual(child1_tris), Individual(child2_tris)
+
+    def crossover_batch(
+            self, parents1: np.ndarray, parents2: np.ndarray, rng: np.random.Generator
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Vectorized ``crossover`` over paired ``(num_pairs, num_triangles, GENE_SIZE)`` parents."""
+        if parents1.shape != parents2.shape:
+            raise ValueError("Parents must have the same number of triangles")
+        num_pairs, n = parents1.shape[:2]
+        if n < 3:
+            return parents1.copy(), parents2.copy()
+        point1 = rng.integers(1, n - 1, size=num_pairs)
+        point2 = rng.integers(point1 + 1, n)
+        pos = np.arange(n)
+        middle = ((pos >= point1[:, None]) & (pos < point2[:, None]))[..., None]
+        return np.where(middle, parents2, parents1), np.where(middle, parents1, parents2)
@@ -1,6 +1,7 @@
 import random
 from dataclasses import dataclass, field
 from typing import Tuple
+import numpy as np
 
 from src.strategies.crossover.CrossoverStrategy import CrossoverStrategy
 from src.models.individual import Individual
@@ -35,4 +36,13 @@ class UniformCrossover(CrossoverStrategy):
                 child1_tris.append(Triangle.clone(t2))
                 child2_tris.append(Triangle.clone(t1))
 
-        return Individual(child1_tris), Individual(child2_tris)
\ No newline at end of file
+        return Individual(child1_tris), Individual(child2_tris)
+
+    def crossover_batch(
+            self, parents1: np.ndarray, parents2: np.ndarray, rng: np.random.Generator
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Vectorized ``crossover`` over paired ``(num_pairs, num_triangles, GENE_SIZE)`` parents."""
+        if parents1.shape != parents2.shape:
+            raise ValueError("Parents must have the same number of triangles")
+        keep = (rng.random(parents1.shape[:2]) < self.p)[..., None]
+        return np.where(keep, parents1, parents2), np.where(keep, parents2, parents1)
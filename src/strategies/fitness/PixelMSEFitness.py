@@ -1,30 +1,174 @@
 from __future__ import annotations
-from dataclasses import dataclass
+import dataclasses
+import math
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Sequence, Tuple
 import numpy as np
-from src.engine.PillowRenderer import PillowRenderer
+from src.engine.Renderer import Renderer
+from src.engine.resolution import scale_fitness
 from src.models.individual import Individual
+from src.models.triangle import ALPHA, POINTS
 from src.strategies.fitness.FitnessStrategy import FitnessStrategy
 
 
 @dataclass
 class PixelMSEFitness(FitnessStrategy):
-    renderer: PillowRenderer
+    renderer: Renderer
     target: np.ndarray  # shape (H, W, 4), dtype uint8
     alpha_reg_lambda: float = 1.0  # Regularization strength
+    # Incremental re-evaluation: a child with lineage (see ``Individual.derive``) whose parent
+    # render is cached only re-renders the bounding box of its changed triangles and updates
+    # the squared error by the delta inside that box
+    incremental: bool = False
+    incremental_cache_size: int = 128  # cached renders (one full image each), LRU evicted
+    incremental_max_area: float = 0.5  # dirty-box fraction of the canvas above which to fully re-render
+    # Surrogate mode (surrogate_scale < 1): the engine pre-screens every individual with a render at
+    # surrogate_scale x the canvas size and re-scores only the surrogate_top_k best, plus the elites,
+    # at full resolution; those true scores drive elitism and early stopping
+    surrogate_scale: float = 1.0
+    surrogate_top_k: int = 5
+    _cache: OrderedDict = field(default_factory=OrderedDict, init=False, repr=False, compare=False)
+    # 255 - target RGB in float32: with it, blended - target = alpha * (img - 255) + (255 - target)
+    _target_offset: np.ndarray = field(init=False, repr=False, compare=False)
+    # Per-thread float32 scratch buffers, grown on demand and reused across evaluations
+    _scratch: threading.local = field(default_factory=threading.local, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self._target_offset = np.float32(255) - self.target[..., :3].astype(np.float32)
+
+    def __getstate__(self) -> dict:
+        # Cached renders and scratch buffers are process-local; never pickle them into worker tasks
+        state = self.__dict__.copy()
+        state["_cache"] = OrderedDict()
+        del state["_scratch"]
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._scratch = threading.local()
+
+    def surrogate(self) -> PixelMSEFitness | None:
+        """Low-resolution copy of this fitness used for pre-screening, or None if surrogate mode is off."""
+        if self.surrogate_scale >= 1.0:
+            return None
+        return dataclasses.replace(scale_fitness(self, self.surrogate_scale), surrogate_scale=1.0)
 
     def evaluate(self, ind: Individual) -> float:
+        if self.incremental:
+            h, w = self.target.shape[:2]
+            alphas = ind.genes[:, ALPHA] / 255.0
+            return float(self._incremental_sse(ind) / (h * w * 3) + self.alpha_reg_lambda * np.mean(alphas))
+
         # RGBA MSE on white background
-        # Blend rendered image over white background using alpha
-        img = self.renderer.render(ind.triangles)
-        white_bg = np.ones_like(img, dtype=np.float32) * 255
-        alpha = img[..., 3:4].astype(np.float32) / 255.0
-        blended = img[..., :3].astype(np.float32) * alpha + white_bg[..., :3] * (1 - alpha)
-        target_rgb = self.target[..., :3].astype(np.float32)
-        mse_rgb = np.mean((blended - target_rgb) ** 2)
+        img = self.renderer.render(ind.genes)
+        h, w = img.shape[:2]
+        mse_rgb = self._sse(img, (0, 0, w, h)) / (h * w * 3)
 
         # Alpha regularization: promote transparency (lower alpha) in early layers
         # Normalize alpha to [0,1]
-        alphas = np.array([t.color[3] / 255.0 for t in ind.triangles])
+        alphas = ind.genes[:, ALPHA].astype(np.float64) / 255.0
         alpha_reg = self.alpha_reg_lambda * np.mean(alphas)
 
         return float(mse_rgb + alpha_reg)
+
+    def evaluate_batch(self, population: Sequence[Individual]) -> np.ndarray:
+        """Score all of ``population`` from one batched render. Returns the same values as
+        ``evaluate`` per individual.
+
+        The error is reduced image by image in the per-thread scratch buffers: a single
+        vectorized pass would need an ``(N, H, W, 3)`` float32 temporary and measures no
+        faster. Incremental fitness scores each individual through ``evaluate``, which uses
+        its lineage and render cache.
+        """
+        if self.incremental:
+            return np.array([self.evaluate(ind) for ind in population], dtype=np.float64)
+        imgs = self.renderer.render_batch([ind.genes for ind in population])
+        h, w = imgs.shape[1:3]
+        mse_rgb = np.array([self._sse(img, (0, 0, w, h)) for img in imgs]) / (h * w * 3)
+
+        alphas = np.array([ind.genes[:, ALPHA] for ind in population], dtype=np.float64) / 255.0
+        alpha_reg = self.alpha_reg_lambda * np.mean(alphas, axis=1)
+
+        return (mse_rgb + alpha_reg).astype(np.float64)
+
+    def _incremental_sse(self, ind: Individual) -> float:
+        """Return the RGB sum of squared errors of ``ind``, reusing the cached parent render."""
+        cached = self._cache.get(ind.uid)
+        if cached is not None:
+            self._cache.move_to_end(ind.uid)
+            return cached[2]
+
+        parent = self._cache.get(ind.parent_uid) if ind.parent_uid is not None else None
+        if parent is None or ind.changed is None or parent[0].shape != ind.genes.shape:
+            img = self.renderer.render(ind.genes)
+            sse = self._sse(img, (0, 0, img.shape[1], img.shape[0]))
+        else:
+            parent_genes, parent_img, parent_sse = parent
+            dirty = sorted(ind.changed)
+            box = self._dirty_box(np.concatenate([parent_genes[dirty], ind.genes[dirty]]))
+            h, w = parent_img.shape[:2]
+            if box is None:
+                # Nothing visible changed
+                img, sse = parent_img, parent_sse
+            elif (box[2] - box[0]) * (box[3] - box[1]) > self.incremental_max_area * w * h:
+                img = self.renderer.render(ind.genes)
+                sse = self._sse(img, (0, 0, w, h))
+            else:
+                x0, y0, x1, y1 = box
+                region = self.renderer.render_region(ind.genes, box)
+                img = parent_img.copy()
+                old_sse = self._sse(parent_img[y0:y1, x0:x1], box)
+                img[y0:y1, x0:x1] = region
+                sse = parent_sse - old_sse + self._sse(region, box)
+
+        self._cache[ind.uid] = (ind.genes, img, sse)
+        while len(self._cache) > self.incremental_cache_size:
+            self._cache.popitem(last=False)
+        return sse
+
+    def _sse(self, img: np.ndarray, box: Tuple[int, int, int, int]) -> float:
+        """Sum of squared RGB errors of ``img`` blended over white against the target within ``box``.
+
+        ``img`` is an RGBA render, or an RGB one from a renderer in ``"rgb"`` mode.
+        """
+        x0, y0, x1, y1 = box
+        alpha, diff = self._buffers(img.shape[:2])
+        np.subtract(img[..., :3], np.float32(255), out=diff, dtype=np.float32)
+        if img.shape[2] == 4:
+            # Blend over white and subtract the target in place: alpha * (img - 255) + (255 - target).
+            # Renderers in "rgb" mode already return the render over white.
+            np.divide(img[..., 3:4], np.float32(255), out=alpha, dtype=np.float32)
+            diff *= alpha
+        diff += self._target_offset[y0:y1, x0:x1]
+        np.square(diff, out=diff)
+        return float(np.sum(diff, dtype=np.float64))
+
+    def _buffers(self, shape: Tuple[int, int]) -> Tuple[np.ndarray, np.ndarray]:
+        """Alpha ``(h, w, 1)`` and RGB ``(h, w, 3)`` float32 scratch views for the calling thread.
+
+        Each thread keeps one flat buffer, sized for the largest region it has scored, so
+        evaluations allocate nothing full-frame beyond the render itself.
+        """
+        h, w = shape
+        size = h * w * 4
+        buf = getattr(self._scratch, "buf", None)
+        if buf is None or buf.size < size:
+            buf = self._scratch.buf = np.empty(size, dtype=np.float32)
+        return buf[: h * w].reshape(h, w, 1), buf[h * w : size].reshape(h, w, 3)
+
+    def _dirty_box(self, genes: np.ndarray) -> Tuple[int, int, int, int] | None:
+        """Pixel box covering the triangle gene rows ``genes`` (padded for edge rounding),
+        clipped to the canvas.
+        """
+        if not len(genes):
+            return None
+        w, h = self.renderer.width, self.renderer.height
+        points = genes[:, POINTS]
+        xs, ys = points[:, 0::2] * w, points[:, 1::2] * h
+        x0, y0 = max(math.floor(xs.min()) - 1, 0), max(math.floor(ys.min()) - 1, 0)
+        x1, y1 = min(math.ceil(xs.max()) + 2, w), min(math.ceil(ys.max()) + 2, h)
+        if x1 <= x0 or y1 <= y0:
+            return None
+        return x0, y0, x1, y1
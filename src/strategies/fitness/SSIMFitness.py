@@ -1,24 +1,133 @@
 from __future__ import annotations
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from typing import Sequence
 import numpy as np
-from src.engine.PillowRenderer import PillowRenderer
+from src.engine.Renderer import Renderer
 from src.models.individual import Individual
 from src.strategies.fitness.FitnessStrategy import FitnessStrategy
-from skimage.metrics import structural_similarity as ssim
+
+_K1, _K2 = 0.01, 0.03
+_DATA_RANGE = 255.0
+_C1 = (_K1 * _DATA_RANGE) ** 2
+_C2 = (_K2 * _DATA_RANGE) ** 2
+_UNIFORM_SIZE = 7
+_GAUSSIAN_SIGMA, _GAUSSIAN_TRUNCATE = 1.5, 3.5
+
+
+def _window(kind: str) -> np.ndarray:
+    """1-D weights of the separable SSIM window, as skimage builds it."""
+    if kind == "uniform":
+        return np.full(_UNIFORM_SIZE, 1.0 / _UNIFORM_SIZE, dtype=np.float32)
+    radius = int(_GAUSSIAN_TRUNCATE * _GAUSSIAN_SIGMA + 0.5)
+    x = np.arange(-radius, radius + 1, dtype=np.float64)
+    weights = np.exp(-0.5 * (x / _GAUSSIAN_SIGMA) ** 2)
+    return (weights / weights.sum()).astype(np.float32)
 
 
 @dataclass
 class SSIMFitness(FitnessStrategy):
-    renderer: PillowRenderer
+    """Mean SSIM of the render (over white) against the target, per RGB channel.
+
+    Computes the same value as ``skimage.metrics.structural_similarity`` with
+    ``channel_axis=2`` on uint8 images (sample covariance, K1=0.01, K2=0.03) in
+    float32. The target's planes, local means and variances are computed once
+    at construction; each candidate only needs its own moments and the cross
+    term. The window is applied as a separable filter over the interior pixels
+    only, which are the ones skimage averages, one cache-sized plane at a time.
+
+    ``window`` selects the local window: ``"uniform"`` (7x7 box, skimage's
+    default) or ``"gaussian"`` (sigma 1.5, 11 taps, skimage's
+    ``gaussian_weights=True``).
+    """
+    renderer: Renderer
     target: np.ndarray  # shape (H, W, 4), dtype uint8
     alpha_reg_lambda: float = 1.0  # Regularization strength
+    window: str = "uniform"  # "uniform" | "gaussian"
+    _weights: np.ndarray = field(init=False, repr=False, compare=False)
+    _target_planes: np.ndarray = field(init=False, repr=False, compare=False)  # (3, H, W)
+    _target_mean: np.ndarray = field(init=False, repr=False, compare=False)  # (3, H - 2 pad, W - 2 pad)
+    _target_luminance: np.ndarray = field(init=False, repr=False, compare=False)  # mean ** 2 + C1
+    _target_contrast: np.ndarray = field(init=False, repr=False, compare=False)  # variance + C2
+
+    def __post_init__(self) -> None:
+        if self.window not in ("uniform", "gaussian"):
+            raise ValueError(f"Unknown SSIM window: {self.window!r}")
+        self._weights = _window(self.window)
+        if min(self.target.shape[:2]) < len(self._weights):
+            raise ValueError(f"Target {self.target.shape[:2]} is smaller than the {len(self._weights)}-pixel SSIM window")
+        self._target_planes = np.ascontiguousarray(
+            np.moveaxis(self.target[..., :3], -1, 0).round(), dtype=np.float32
+        )
+        mean = np.stack([self._filter(y) for y in self._target_planes])
+        sq = np.stack([self._filter(y * y) for y in self._target_planes])
+        self._target_mean = mean
+        self._target_luminance = mean * mean + np.float32(_C1)
+        self._target_contrast = self._cov_norm() * (sq - mean * mean) + np.float32(_C2)
 
     def evaluate(self, ind: Individual) -> float:
-        # RGBA MSE on white background
-        # Blend rendered image over white background using alpha
-        img = self.renderer.render(ind.triangles)
-        white_bg = np.ones_like(img, dtype=np.float32) * 255
-        alpha = img[..., 3:4].astype(np.float32) / 255.0
-        blended = img[..., :3].astype(np.float32) * alpha + white_bg[..., :3] * (1 - alpha)
-        target_rgb = self.target[..., :3].round().astype(np.uint8)
-        return ssim(blended.round().astype(np.uint8), target_rgb, multichannel=True, channel_axis=2)
\ No newline at end of file
+        return self._ssim(self.renderer.render(ind.genes))
+
+    def evaluate_batch(self, population: Sequence[Individual]) -> np.ndarray:
+        """Score all of ``population`` from one batched render."""
+        imgs = self.renderer.render_batch([ind.genes for ind in population])
+        return np.array([self._ssim(img) for img in imgs], dtype=np.float64)
+
+    def _ssim(self, img: np.ndarray) -> float:
+        """Mean SSIM of one ``(H, W, 4)`` render, or ``(H, W, 3)`` from an ``"rgb"`` mode
+        renderer, against the target.
+        """
+        opaque = img.shape[2] == 3
+        if not opaque:
+            # RGBA blended over a white background, rounded to 8-bit like the image that gets saved
+            alpha = img[..., 3].astype(np.float32) / 255.0
+            white = np.float32(255) * (1 - alpha)
+        cov_norm = self._cov_norm()
+        total = 0.0
+        for c, y in enumerate(self._target_planes):
+            if opaque:
+                x = img[..., c].astype(np.float32)
+            else:
+                x = img[..., c].astype(np.float32) * alpha
+                x += white
+                np.rint(x, out=x)
+            mean_x = self._filter(x)
+            mean_y = self._target_mean[c]
+            mean_xy = mean_x * mean_y
+            var_x = self._filter(x * x)
+            var_x -= mean_x * mean_x
+            var_x *= cov_norm
+            cov = self._filter(x * y)
+            cov -= mean_xy
+            cov *= 2 * cov_norm
+            cov += np.float32(_C2)
+            mean_xy *= 2
+            mean_xy += np.float32(_C1)
+            var_x += self._target_contrast[c]
+            mean_x *= mean_x
+            mean_x += self._target_luminance[c]
+            # ((2 mx my + C1) (2 cov + C2)) / ((mx^2 + my^2 + C1) (vx + vy + C2))
+            mean_xy *= cov
+            mean_x *= var_x
+            mean_xy /= mean_x
+            total += float(mean_xy.mean(dtype=np.float64))
+        return total / 3
+
+    def _filter(self, plane: np.ndarray) -> np.ndarray:
+        """Separable windowed mean of an ``(H, W)`` plane at the pixels where the window fits."""
+        k = len(self._weights)
+        h, w = plane.shape
+        uniform = self.window == "uniform"
+        rows = plane[: h - k + 1].copy() if uniform else plane[: h - k + 1] * self._weights[0]
+        for i in range(1, k):
+            rows += plane[i : h - k + 1 + i] if uniform else plane[i : h - k + 1 + i] * self._weights[i]
+        out = rows[:, : w - k + 1].copy() if uniform else rows[:, : w - k + 1] * self._weights[0]
+        for i in range(1, k):
+            out += rows[:, i : w - k + 1 + i] if uniform else rows[:, i : w - k + 1 + i] * self._weights[i]
+        if uniform:
+            out *= np.float32(1.0 / (k * k))
+        return out
+
+    def _cov_norm(self) -> np.float32:
+        # Sample covariance over the window, as skimage does by default
+        n = len(self._weights) ** 2
+        return np.float32(n / (n - 1))
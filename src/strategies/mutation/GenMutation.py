@@ -3,7 +3,9 @@ import random
 from dataclasses import dataclass, field
 from typing import List, Tuple
 
-from src.models.triangle import Triangle
+import numpy as np
+
+from src.models.triangle import COLOR, POINTS, Triangle, Z_INDEX, clip_genes
 from src.models.individual import Individual
 from src.strategies.mutation.MutationStrategy import MutationStrategy
 
@@ -23,6 +25,8 @@ class GenMutation(MutationStrategy):
     - Adds small Gaussian noise to each vertex coordinate (normalized [0,1]).
     - Adds Gaussian noise to each RGBA channel (0..255), with clamping.
     - No in-place mutation; returns a new Individual.
+
+    ``mutate_batch`` applies the same perturbation to a whole stack of genomes at once.
     """
     point_sigma: float = 0.01   # small spatial jitter
     color_sigma: float = 5.0    # subtle color jitter (in intensity units)
@@ -52,3 +56,13 @@ class GenMutation(MutationStrategy):
             new_tris.append(Triangle(p1, p2, p3, color, z))
         return Individual(new_tris)
 
+    def mutate_batch(self, genomes: np.ndarray, rng: np.random.Generator) -> np.ndarray:
+        """Vectorized ``mutate`` over ``genomes`` of shape ``(count, num_triangles, GENE_SIZE)``.
+        Returns a new array; the input is left untouched.
+        """
+        out = genomes.astype(np.float32, copy=True)
+        lead = out.shape[:-1]
+        out[..., POINTS] += rng.normal(0.0, self.point_sigma, (*lead, 6))
+        out[..., COLOR] += rng.normal(0.0, self.color_sigma, (*lead, 4))
+        out[..., Z_INDEX] += rng.normal(0.0, self.point_sigma, lead)
+        return clip_genes(out)
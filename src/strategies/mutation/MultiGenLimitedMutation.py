@@ -2,7 +2,10 @@ from __future__ import annotations
 import random
 from dataclasses import dataclass, field
 from typing import List, Tuple, Set
-from src.models.triangle import Triangle
+
+import numpy as np
+
+from src.models.triangle import COLOR, Triangle, clip_genes
 from src.models.individual import Individual
 from src.strategies.mutation.MutationStrategy import MutationStrategy
 
@@ -80,4 +83,24 @@ class MultiGenLimitedMutation(MutationStrategy):
                 # Keep original triangle unchanged
                 new_triangles.append(Triangle(triangle.p1, triangle.p2, triangle.p3, triangle.color, triangle.z_index))
 
-        return Individual(new_triangles)
\ No newline at end of file
+        return Individual(new_triangles)
+
+    def mutate_batch(self, genomes: np.ndarray, rng: np.random.Generator) -> np.ndarray:
+        """Vectorized ``mutate`` over ``genomes`` of shape ``(count, num_triangles, GENE_SIZE)``.
+        Returns a new array; the input is left untouched.
+        """
+        out = genomes.astype(np.float32, copy=True)
+        count, n_triangles = out.shape[:2]
+        if n_triangles == 0:
+            return out
+        max_mutate = min(self.max_genes, n_triangles)
+        min_mutate = min(self.min_genes, max_mutate)
+        n_mutate = rng.integers(min_mutate, max_mutate + 1, size=count)
+        # Ranking random keys draws a uniform subset of distinct triangles per genome
+        ranks = rng.random((count, n_triangles)).argsort(axis=1).argsort(axis=1)
+        selected = ranks < n_mutate[:, None]
+
+        sigma = np.full(out.shape[-1], self.point_sigma, dtype=np.float32)
+        sigma[COLOR] = self.color_sigma
+        out += selected[..., None] * rng.normal(0.0, 1.0, out.shape) * sigma
+        return clip_genes(out)
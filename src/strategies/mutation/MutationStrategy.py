@@ -3,6 +3,11 @@ from typing import Protocol
 from src.models.individual import Individual
 
 class MutationStrategy(Protocol):
+    """Strategies may also provide ``mutate_batch(genomes, rng)``, which mutates a
+    ``(count, num_triangles, GENE_SIZE)`` gene array with a ``numpy.random.Generator``
+    and returns a new array; the engine uses it to mutate all children at once.
+    """
+
     def mutate(self, ind: Individual) -> Individual:
         """Return a mutated copy of the given individual (must not modify in place)."""
         ...
@@ -2,7 +2,9 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 import random
 
-from src.models.triangle import Triangle
+import numpy as np
+
+from src.models.triangle import COLOR, GENE_SIZE, Triangle, clip_genes
 from src.models.individual import Individual
 
 def _clamp(value: float, low: float, high: float) -> float:
@@ -77,3 +79,32 @@ class NonUniform:
             tris[idx] = Triangle(t.p1, t.p2, t.p3, mutated_color, t.z_index)  # type: ignore[arg-type]
 
         return Individual(tris)
+
+    def mutate_batch(self, genomes: np.ndarray, rng: np.random.Generator) -> np.ndarray:
+        """Vectorized ``mutate`` over ``genomes`` of shape ``(count, num_triangles, GENE_SIZE)``:
+        one random triangle per genome gets its vertices and z_index, or its color,
+        mutated non-uniformly. Returns a new array; the input is left untouched.
+        """
+        out = genomes.astype(np.float32, copy=True)
+        count, n_triangles = out.shape[:2]
+        if n_triangles == 0:
+            return out
+        rows = np.arange(count)
+        idx = rng.integers(n_triangles, size=count)
+        genes = out[rows, idx].astype(np.float64)
+
+        is_color = np.zeros(GENE_SIZE, dtype=bool)
+        is_color[COLOR] = True
+        high = np.where(is_color, 255.0, 1.0)
+        vertices = rng.random(count) < self.p_mutate_vertices
+        p = np.where(is_color, self.p_color_component, self.p_vertex_component)
+        mask = (rng.random(genes.shape) < p) & (vertices[:, None] != is_color)
+
+        # Same delta as ``_delta_non_uniform``, towards a randomly chosen bound
+        to_high = rng.random(genes.shape) < 0.5
+        dist = np.maximum(np.where(to_high, high - genes, genes), 0.0)
+        factor = (1.0 - _clamp(self.progress, 0.0, 1.0)) ** max(self.b, 1.0)
+        delta = dist * (1.0 - rng.random(genes.shape) ** factor)
+        genes += mask * np.where(to_high, delta, -delta)
+        out[rows, idx] = genes
+        return clip_genes(out)
@@ -2,7 +2,10 @@ from __future__ import annotations
 import random
 from dataclasses import dataclass, field
 from typing import Tuple, List
-from src.models.triangle import Triangle
+
+import numpy as np
+
+from src.models.triangle import COLOR, POINTS, Triangle, Z_INDEX, clip_genes
 from src.models.individual import Individual
 from src.strategies.mutation.MutationStrategy import MutationStrategy
 
@@ -75,3 +78,28 @@ class UniformMutation(MutationStrategy):
 
         return Individual(new_tris)
 
+    def mutate_batch(self, genomes: np.ndarray, rng: np.random.Generator) -> np.ndarray:
+        """Vectorized ``mutate`` over ``genomes`` of shape ``(count, num_triangles, GENE_SIZE)``.
+
+        Every allele is perturbed independently with its rate, as in ``mutate``; each
+        genome then swaps two random triangles with probability ``swap_rate``.
+        Returns a new array; the input is left untouched.
+        """
+        out = genomes.astype(np.float32, copy=True)
+        lead = out.shape[:-1]
+        point_mask = rng.random((*lead, 6)) < self.point_rate
+        out[..., POINTS] += point_mask * rng.normal(0.0, self.point_sigma, (*lead, 6))
+        color_mask = rng.random((*lead, 4)) < self.color_rate
+        out[..., COLOR] += color_mask * rng.normal(0.0, self.color_sigma, (*lead, 4))
+        z_mask = rng.random(lead) < self.point_rate
+        out[..., Z_INDEX] += z_mask * rng.normal(0.0, self.point_sigma, lead)
+        clip_genes(out)
+
+        count, n = lead
+        if n >= 2:
+            rows = np.flatnonzero(rng.random(count) < self.swap_rate)
+            i = rng.integers(n, size=len(rows))
+            j = rng.integers(n, size=len(rows))
+            # Fancy indexing copies, so the right-hand side is read before either write
+            out[rows, i], out[rows, j] = out[rows, j], out[rows, i]
+        return out
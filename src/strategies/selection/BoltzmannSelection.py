@@ -1,7 +1,7 @@
 from dataclasses import dataclass
 from typing import Sequence, List
 from src.strategies.selection.SelectionStrategy import SelectionStrategy
-from src.strategies.selection.RouletteSelection import RouletteSelection
+from src.strategies.selection.RouletteSelection import weighted_choice
 import numpy as np
 
 
@@ -32,4 +32,4 @@ class BoltzmannSelection(SelectionStrategy):
             raise OverflowError("Overflow in exp(fitness/t). Try increasing t_initial or t_final")
         pseudo_fit = exp_fitness / exp_fitness.mean()
         self.generation_count += 1
-        return RouletteSelection(rng=self.rng).select(pseudo_fit, k)
+        return weighted_choice(pseudo_fit, k, self._generator()).tolist()
@@ -1,10 +1,14 @@
 from dataclasses import dataclass
 from typing import Sequence, List
+
+import numpy as np
+
 from src.strategies.selection.SelectionStrategy import SelectionStrategy
 
 
 @dataclass
 class EliteSelection(SelectionStrategy):
     def select(self, fitness: Sequence[float], k: int) -> List[int]:
-        order = sorted(range(len(fitness)), key=lambda i: fitness[i], reverse=True)
-        return order[:k]
+        # Stable sort on negated fitness keeps ties in population order
+        order = np.argsort(-np.asarray(fitness, dtype=np.float64), kind="stable")
+        return order[:k].tolist()
@@ -1,5 +1,8 @@
 from dataclasses import dataclass
 from typing import Sequence, List
+
+import numpy as np
+
 from src.strategies.selection.SelectionStrategy import SelectionStrategy
 
 @dataclass
@@ -17,12 +20,16 @@ class ProbTournamentSelection(SelectionStrategy):
         Returns:
             List[int]: list of indices of the selected individuals
         """
-        selected = []
-        for _ in range(k):
-            indices = self.rng.sample(range(len(fitness)), 2)
-            indices.sort(key=lambda idx: fitness[idx], reverse=True)
-            if self.rng.random() < self.threshold:
-                selected.append(indices[0])  # Selects the best
-            else:
-                selected.append(indices[1])  # Selects the worst
-        return selected
+        fit = np.asarray(fitness, dtype=np.float64)
+        n = len(fit)
+        if n < 2:
+            raise ValueError("probabilistic tournament needs at least 2 individuals")
+        rng = self._generator()
+        # Two distinct contestants per draw: the second is offset by 1..n-1 positions
+        first = rng.integers(n, size=k)
+        second = (first + rng.integers(1, n, size=k)) % n
+        first_wins = fit[first] >= fit[second]
+        best = np.where(first_wins, first, second)
+        worst = np.where(first_wins, second, first)
+        # Selects the best with probability ``threshold``, otherwise the worst
+        return np.where(rng.random(k) < self.threshold, best, worst).tolist()
@@ -1,15 +1,18 @@
 from dataclasses import dataclass
 from typing import Sequence, List
+
+import numpy as np
+
 from src.strategies.selection.SelectionStrategy import SelectionStrategy
-from src.strategies.selection.RouletteSelection import RouletteSelection
+from src.strategies.selection.RouletteSelection import weighted_choice
 
 @dataclass
 class RankingSelection(SelectionStrategy):
     def select(self, fitness: Sequence[float], k: int) -> List[int]:
+        n = len(fitness)
         # Get sorted indices (highest fitness first)
-        sorted_indices = sorted(range(len(fitness)), key=lambda i: fitness[i], reverse=True)
+        sorted_indices = np.argsort(-np.asarray(fitness, dtype=np.float64), kind="stable")
         # Assign ranks: highest fitness gets 1, lowest gets len(fitness)
-        pseudo_fit = [0.0] * len(fitness)
-        for rank, idx in enumerate(sorted_indices, start=1):
-            pseudo_fit[idx] = (len(fitness)-rank)/len(fitness)  # Normalize ranks to [0, 1]
-        return RouletteSelection().select(pseudo_fit, k)
\ No newline at end of file
+        pseudo_fit = np.empty(n, dtype=np.float64)
+        pseudo_fit[sorted_indices] = (n - np.arange(1, n + 1)) / n  # Normalize ranks to [0, 1]
+        return weighted_choice(pseudo_fit, k, self._generator()).tolist()
\ No newline at end of file
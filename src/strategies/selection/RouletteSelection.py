@@ -1,22 +1,25 @@
-import random
 from dataclasses import dataclass
 from typing import Sequence, List
+
+import numpy as np
+
 from src.strategies.selection.SelectionStrategy import SelectionStrategy
 
 
+def weighted_choice(weights: Sequence[float], k: int, rng: np.random.Generator) -> np.ndarray:
+    """Draw ``k`` indices with probability proportional to ``weights``.
+
+    One cumulative sum plus a binary search per draw: O(n + k log n).
+    """
+    cumulative = np.cumsum(np.asarray(weights, dtype=np.float64))
+    if len(cumulative) == 0 or cumulative[-1] <= 0:
+        raise ValueError("fitness must be non-negative with positive sum")
+    r = rng.random(k) * cumulative[-1]
+    # First index whose running total reaches r
+    return np.minimum(np.searchsorted(cumulative, r, side="left"), len(cumulative) - 1)
+
+
 @dataclass
 class RouletteSelection(SelectionStrategy):
     def select(self, fitness: Sequence[float], k: int) -> List[int]:
-        return [self._weighted_choice(fitness) for _ in range(k)]
-
-    def _weighted_choice(self, weights: Sequence[float]) -> int:
-        total = sum(weights)
-        if total <= 0:
-            raise ValueError("fitness must be non-negative with positive sum")
-        r = self.rng.random() * total
-        upto = 0.0
-        for i, w in enumerate(weights):
-            upto += w
-            if upto >= r:
-                return i
-        return len(weights) - 1
+        return weighted_choice(fitness, k, self._generator()).tolist()
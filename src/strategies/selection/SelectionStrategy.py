@@ -3,10 +3,19 @@ from typing import List, Sequence
 import random
 from dataclasses import dataclass, field
 
+import numpy as np
+
 
 @dataclass
 class SelectionStrategy:
     rng: random.Random = field(default_factory=random.Random)
+    # NumPy generator for the vectorized draws; seeded from ``rng`` on first use
+    np_rng: np.random.Generator | None = field(default=None, repr=False, compare=False, kw_only=True)
 
     def select(self, fitness: Sequence[float], k: int) -> List[int]:
-        raise NotImplementedError
\ No newline at end of file
+        raise NotImplementedError
+
+    def _generator(self) -> np.random.Generator:
+        if self.np_rng is None:
+            self.np_rng = np.random.default_rng(self.rng.getrandbits(64))
+        return self.np_rng
@@ -1,6 +1,8 @@
 from dataclasses import dataclass
 from typing import Sequence, List
 
+import numpy as np
+
 from src.strategies.selection.SelectionStrategy import SelectionStrategy
 
 
@@ -18,9 +20,21 @@ class TournamentSelection(SelectionStrategy):
         Returns:
             List[int]: Returns the indices of the selected individuals
         """
-        selected: List[int] = []
-        for _ in range(k):
-            indices = self.rng.sample(range(len(fitness)), self.tournament_size)
-            best = max(indices, key=lambda idx: fitness[idx])
-            selected.append(best)
-        return selected
\ No newline at end of file
+        fit = np.asarray(fitness, dtype=np.float64)
+        n = len(fit)
+        if not 0 < self.tournament_size <= n:
+            raise ValueError("tournament_size must be between 1 and the population size")
+        if k <= 0:
+            return []
+        # Each row draws a tournament of distinct contestants, one column at a time: a rank among
+        # the individuals not yet drawn, mapped to an index by skipping those drawn (in ascending
+        # order). O(k * tournament_size^2), independent of the population size
+        rng = self._generator()
+        contestants = np.empty((k, self.tournament_size), dtype=np.intp)
+        for j in range(self.tournament_size):
+            pick = rng.integers(n - j, size=k)
+            for taken in np.sort(contestants[:, :j], axis=1).T:
+                pick += pick >= taken
+            contestants[:, j] = pick
+        best = fit[contestants].argmax(axis=1)
+        return contestants[np.arange(k), best].tolist()
@@ -1,6 +1,8 @@
 from dataclasses import dataclass
 from typing import Sequence, List
 
+import numpy as np
+
 from src.strategies.selection.SelectionStrategy import SelectionStrategy
 
 @dataclass
@@ -12,22 +14,13 @@ class UniversalSelection(SelectionStrategy):
         equally spaced pointers across the fitness wheel. This method ensures a
         lower variance than simple roulette selection.
         """
-        total = sum(fitness)
-        if total <= 0:
+        cumulative = np.cumsum(np.asarray(fitness, dtype=np.float64))
+        if len(cumulative) == 0 or cumulative[-1] <= 0:
             raise ValueError("fitness must be non-negative with positive sum")
+        if k <= 0:
+            return []
 
-        step = total / k
-        start = self.rng.random() * step
-        points = [start + i * step for i in range(k)]
-
-        selected: List[int] = []
-        cumulative = 0.0
-        idx = 0
-
-        for p in points:
-            while cumulative + fitness[idx] < p and idx < len(fitness) - 1:
-                cumulative += fitness[idx]
-                idx += 1
-            selected.append(idx)
-
-        return selected
\ No newline at end of file
+        step = cumulative[-1] / k
+        points = (self._generator().random() + np.arange(k)) * step
+        selected = np.searchsorted(cumulative, points, side="left")
+        return np.minimum(selected, len(cumulative) - 1).tolist()
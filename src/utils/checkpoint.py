@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import os
+import pickle
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict
+
+import numpy as np
+
+
+@dataclass
+class Checkpoint:
+    """GA state at the end of a generation, enough to continue the run bit for bit."""
+    generation: int  # last completed generation (0-based)
+    genes: np.ndarray  # (pop_size, num_triangles, GENE_SIZE) float32
+    fitness: np.ndarray  # (pop_size,) float64
+    verified: np.ndarray  # (pop_size,) bool, scores at full resolution (see surrogate mode)
+    state: Dict[str, Any]  # engine loop variables, GAMetrics, fitness cache, RNG and operator states
+
+
+def save_checkpoint(path: str | Path, checkpoint: Checkpoint) -> None:
+    """Write ``checkpoint`` to ``path`` as one ``.npz`` file, atomically.
+
+    The arrays are stored as such; ``state`` is pickled into a byte array alongside
+    them. The file is written next to ``path`` and renamed over it once synced, so a
+    crash mid-write leaves the previous checkpoint intact.
+    """
+    path = Path(path)
+    tmp = path.with_name(path.name + ".tmp")
+    with open(tmp, "wb") as f:
+        np.savez(
+            f,
+            generation=np.int64(checkpoint.generation),
+            genes=checkpoint.genes,
+            fitness=checkpoint.fitness,
+            verified=checkpoint.verified,
+            state=np.frombuffer(pickle.dumps(checkpoint.state, protocol=pickle.HIGHEST_PROTOCOL), dtype=np.uint8),
+        )
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+
+def load_checkpoint(path: str | Path) -> Checkpoint:
+    with np.load(path) as data:
+        return Checkpoint(
+            generation=int(data["generation"]),
+            genes=data["genes"],
+            fitness=data["fitness"],
+            verified=data["verified"],
+            state=pickle.loads(data["state"].tobytes()),
+        )
+
+
+class CheckpointWriter:
+    """Saves checkpoints to ``path`` on a background thread, in submission order.
+
+    The caller hands over a snapshot it no longer mutates, so the generation loop
+    only pays for taking it. Use as a context manager: leaving waits for pending
+    writes and re-raises a failed one.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="checkpoint")
+        self._last: Future | None = None
+
+    def submit(self, checkpoint: Checkpoint) -> None:
+        if self._last is not None and self._last.done():
+            self._last.result()  # surface a failed write early
+        self._last = self._executor.submit(save_checkpoint, self.path, checkpoint)
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=True)
+        if self._last is not None:
+            self._last.result()
+
+    def __enter__(self) -> CheckpointWriter:
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
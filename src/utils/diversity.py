@@ -5,50 +5,73 @@ from typing import Sequence
 import numpy as np
 
 from src.models.individual import Individual
+from src.models.population import PopulationArray
 
+DIVERSITY_METHODS = ("exact", "variance", "sampled")
+_BLOCK_BYTES = 64 * 2 ** 20  # bound on the pairwise difference block of the exact method
 
-def population_diversity(pop: Sequence[Individual]) -> float:
-    """Compute mean pairwise Euclidean distance between individuals.
+
+def population_diversity(
+        pop: Sequence[Individual] | PopulationArray,
+        method: str = "exact",
+        samples: int = 2048,
+        rng: np.random.Generator | None = None,
+) -> float:
+    """Compute the spread of the population's genomes.
 
     The individual's genome is flattened into a numeric vector containing all
-    triangle parameters. The result is the average distance across all unique
-    pairs in the population. Returns ``0.0`` for populations with fewer than
-    two individuals.
+    triangle parameters. Returns ``0.0`` for populations with fewer than two
+    individuals.
 
     To avoid any parameter family (e.g., coordinates vs. colors vs. z-index)
     dominating due to differing numeric ranges, each genome dimension is
     min-max normalized across the current population before distance is computed.
+
+    ``method`` selects the statistic:
+
+    - ``"exact"``: mean pairwise Euclidean distance over all unique pairs,
+      O(n^2 d) time, computed in row blocks of bounded memory.
+    - ``"variance"``: root mean pairwise *squared* distance, from the identity
+      ``mean_{i<j} |x_i - x_j|^2 = 2n / (n - 1) * sum_f var_f``; O(n d). It bounds
+      the exact mean from above and tracks it closely while the population spreads
+      or converges.
+    - ``"sampled"``: the exact statistic estimated from ``samples`` random pairs
+      drawn with ``rng``; O(samples d).
     """
+    if method not in DIVERSITY_METHODS:
+        raise ValueError(f"Unknown diversity method: {method!r}")
     n = len(pop)
     if n < 2:
         return 0.0
+    arr = _normalized(pop)
+
+    if method == "variance":
+        return float(np.sqrt(2 * n / (n - 1) * arr.var(axis=0).sum()))
+    if method == "sampled":
+        rng = rng if rng is not None else np.random.default_rng()
+        i = rng.integers(0, n, samples)
+        j = (i + rng.integers(1, n, samples)) % n  # uniform over the other individuals
+        return float(np.linalg.norm(arr[i] - arr[j], axis=1).mean())
 
-    # Flatten individuals into arrays
-    genomes: list[list[float]] = []
-    for ind in pop:
-        genes: list[float] = []
-        for t in ind.triangles:
-            genes.extend([
-                t.p1[0], t.p1[1],
-                t.p2[0], t.p2[1],
-                t.p3[0], t.p3[1],
-                float(t.color[0]), float(t.color[1]), float(t.color[2]), float(t.color[3]),
-                t.z_index,
-            ])
-        genomes.append(genes)
-
-    arr = np.array(genomes, dtype=float)
-
-    # Normalize each feature (column) to [0, 1] across the population
+    # Pairwise distances on normalized genomes, a block of rows at a time
+    rows = max(1, _BLOCK_BYTES // (n * arr.shape[1] * arr.itemsize))
+    total = 0.0
+    for start in range(0, n - 1, rows):
+        block = arr[start : start + rows]
+        dists = np.linalg.norm(block[:, None, :] - arr[None, :, :], axis=2)
+        # Keep the pairs (i, j) with i < j
+        upper = np.arange(n)[None, :] > np.arange(start, start + len(block))[:, None]
+        total += dists[upper].sum()
+    return float(total / (n * (n - 1) / 2))
+
+
+def _normalized(pop: Sequence[Individual] | PopulationArray) -> np.ndarray:
+    """Genomes as rows, each feature (column) min-max normalized to [0, 1] across the population."""
+    n = len(pop)
+    genes = pop.genes if isinstance(pop, PopulationArray) else np.stack([ind.genes for ind in pop])
+    arr = genes.reshape(n, -1).astype(float)
     col_min = arr.min(axis=0)
     col_range = np.ptp(arr, axis=0)  # max - min
     # Avoid division by zero for constant columns
     safe_range = np.where(col_range > 0, col_range, 1.0)
-    arr_norm = (arr - col_min) / safe_range
-    # Pairwise distances on normalized genomes
-    diff = arr_norm[:, None, :] - arr_norm[None, :, :]
-    dists = np.linalg.norm(diff, axis=2)
-    iu = np.triu_indices(n, k=1)
-    if iu[0].size == 0:
-        return 0.0
-    return float(dists[iu].mean())
\ No newline at end of file
+    return (arr - col_min) / safe_range
@@ -1,8 +1,11 @@
 from __future__ import annotations
 
 import json
+import math
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Mapping
+from typing import Any, Dict, Iterator, List, Mapping
 import datetime as _dt
 from dataclasses import dataclass, field
 
@@ -14,6 +17,144 @@ class GAMetrics:
     min_fitnesses: list[float] = field(default_factory=list)
     std_fitnesses: list[float] = field(default_factory=list)
     population_diversities: list[float] = field(default_factory=list)
+    diversity_method: str = "exact"  # statistic behind population_diversities (see population_diversity)
+    fitness_cache_hits: int = 0
+    fitness_cache_misses: int = 0
+    ipc_bytes: list[int] = field(default_factory=list)  # bytes sent to and from fitness workers per generation
+    eval_compute_times: list[float] = field(default_factory=list)  # seconds scoring in workers per generation
+    eval_dispatch_times: list[float] = field(default_factory=list)  # seconds of task dispatch overhead per generation
+    resolution_scales: list[float] = field(default_factory=list)  # evaluation scale per generation (see resolution_schedule)
+    surrogate_rank_correlations: list[float] = field(default_factory=list)  # Spearman surrogate vs full-resolution, per generation
+    phase_wall_times: dict[str, list[float]] = field(default_factory=dict)  # wall seconds per phase per generation
+    phase_cpu_times: dict[str, list[float]] = field(default_factory=dict)  # main-process CPU seconds per phase per generation
+    islands: list[dict] = field(default_factory=list)  # each island's own metrics, in island mode (see ga.islands)
+
+    def generation_record(self, gen: int) -> Dict[str, Any]:
+        """The per-generation values of generation ``gen`` (0 is the initial population) as one
+        JSON-ready mapping; NaN becomes None.
+        """
+        record: Dict[str, Any] = {
+            "generation": gen,
+            "time": time.time(),
+            "max_fitness": self.max_fitnesses[gen],
+            "min_fitness": self.min_fitnesses[gen],
+            "mean_fitness": self.mean_fitnesses[gen],
+            "std_fitness": self.std_fitnesses[gen],
+            "population_diversity": _finite(self.population_diversities[gen]),
+            "diversity_method": self.diversity_method,
+            "ipc_bytes": self.ipc_bytes[gen],
+            "eval_compute_time": self.eval_compute_times[gen],
+            "eval_dispatch_time": self.eval_dispatch_times[gen],
+            "resolution_scale": self.resolution_scales[gen],
+            "phase_wall_times": {phase: times[gen] for phase, times in self.phase_wall_times.items()},
+            "phase_cpu_times": {phase: times[gen] for phase, times in self.phase_cpu_times.items()},
+        }
+        if len(self.surrogate_rank_correlations) == len(self.mean_fitnesses):
+            record["surrogate_rank_correlation"] = _finite(self.surrogate_rank_correlations[gen])
+        return record
+
+
+def _finite(value: float) -> float | None:
+    return None if math.isnan(value) else value
+
+
+def _json_ready(value: Any) -> Any:
+    """``value`` with every non-finite float, nested in dicts and lists, replaced by None."""
+    if isinstance(value, float):
+        return value if math.isfinite(value) else None
+    if isinstance(value, Mapping):
+        return {key: _json_ready(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_json_ready(item) for item in value]
+    return value
+
+
+class MetricsLogWriter:
+    """Appends generation records to an NDJSON file (one JSON object per line) while a run goes on.
+
+    Records are buffered and written in batches on a background thread, once ``flush_every``
+    are pending or ``flush_seconds`` have passed since the last batch, so a crash loses at
+    most one batch. The engine also flushes and waits whenever it saves a checkpoint, so the
+    checkpointed generation is always on disk. Use as a context manager: leaving writes what
+    is left and waits.
+    A resumed run appends to the same file and repeats the generations after its
+    checkpoint; the latest record of each generation wins (see ``read_metrics_log``).
+    """
+
+    def __init__(self, path: str | Path, flush_every: int = 10, flush_seconds: float = 5.0) -> None:
+        self.path = Path(path)
+        self.flush_every = flush_every
+        self.flush_seconds = flush_seconds
+        self._pending: List[Dict[str, Any]] = []
+        self._flushed_at = time.monotonic()
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="metrics-log")
+        self._last: Future | None = None
+
+    def append(self, record: Mapping[str, Any]) -> None:
+        self._pending.append(dict(record))
+        if len(self._pending) >= self.flush_every or time.monotonic() - self._flushed_at >= self.flush_seconds:
+            self.flush()
+
+    def flush(self, wait: bool = False) -> None:
+        """Hand the pending records to the writer thread; with ``wait``, until they are written."""
+        if self._last is not None and self._last.done():
+            self._last.result()  # surface a failed write early
+        if self._pending:
+            self._last = self._executor.submit(self._write, self._pending)
+            self._pending = []
+        self._flushed_at = time.monotonic()
+        if wait and self._last is not None:
+            self._last.result()
+
+    def _write(self, records: List[Dict[str, Any]]) -> None:
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.writelines(json.dumps(_json_ready(record), allow_nan=False) + "\n" for record in records)
+
+    def close(self) -> None:
+        self.flush()
+        self._executor.shutdown(wait=True)
+        if self._last is not None:
+            self._last.result()
+
+    def __enter__(self) -> MetricsLogWriter:
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def read_metrics_log(path: str | Path) -> Iterator[Dict[str, Any]]:
+    """Yield the records of an NDJSON metrics log, one line at a time.
+
+    A partially written last line (a live or crashed run) is skipped. Records are
+    yielded as written: after a resume the log repeats generations, and a record whose
+    generation is not after the previous one's supersedes the records from that
+    generation on. Readers that want one record per generation apply that rule
+    themselves, as ``_log_columns`` does.
+    """
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError:
+                continue
+
+
+def _log_columns(path: str | Path, keys: List[str]) -> Dict[str, List[float]]:
+    """Per-generation columns ``keys`` of the metrics log at ``path``, indexed by generation.
+
+    None is read as NaN, superseded records are dropped, and generations missing from the
+    log (a batch lost in a crash before the run was resumed) are NaN.
+    """
+    columns: Dict[str, List[float]] = {key: [] for key in keys}
+    for record in read_metrics_log(path):
+        gen = record["generation"]
+        for key, column in columns.items():
+            del column[gen:]  # superseded by a resumed run
+            column.extend([float("nan")] * (gen - len(column)))
+            value = record.get(key)
+            column.append(float("nan") if value is None else value)
+    return columns
 
 
 def write_metrics(
@@ -22,7 +163,7 @@ def write_metrics(
         elapsed_time: float,
         extra: Mapping[str, Any] | None = None,
 ) -> None:
-    """Write a metrics.json file with configuration and run info."""
+    """Write a metrics.json file with configuration and run info; NaN is written as null."""
     metrics: dict[str, Any] = {
         "parameters": cfg,
         "elapsed_time": f"{elapsed_time:.2f}",
@@ -31,20 +172,30 @@ def write_metrics(
     if extra:
         metrics.update(extra)
 
-    (output_dir / "metrics.json").write_text(json.dumps(metrics, indent=2))
+    (output_dir / "metrics.json").write_text(json.dumps(_json_ready(metrics), indent=2, allow_nan=False))
 
-def plot_metrics(metrics: GAMetrics, output_dir: Path) -> None:
-    """Plot fitness metrics over generations and save to output_dir."""
+def plot_metrics(metrics: GAMetrics | str | Path, output_dir: Path) -> None:
+    """Plot fitness metrics over generations and save to output_dir.
+
+    ``metrics`` is either a finished run's ``GAMetrics`` or the path of a metrics log
+    (see ``MetricsLogWriter``), which may belong to a live or crashed run; only the
+    fitness columns are read from it.
+    """
     import matplotlib.pyplot as plt
 
-    generations = range(len(metrics.mean_fitnesses))
+    if isinstance(metrics, GAMetrics):
+        mean, best, worst, std = metrics.mean_fitnesses, metrics.max_fitnesses, metrics.min_fitnesses, metrics.std_fitnesses
+    else:
+        columns = _log_columns(metrics, ["mean_fitness", "max_fitness", "min_fitness", "std_fitness"])
+        mean, best, worst, std = columns.values()
+    generations = range(len(mean))
 
     plt.figure(figsize=(10, 6))
-    plt.plot(generations, metrics.mean_fitnesses, label='Mean Fitness', linewidth =2.5)
-    plt.plot(generations, metrics.max_fitnesses, label='Max Fitness', linewidth =2.5)
-    plt.plot(generations, metrics.min_fitnesses, label='Min Fitness', linewidth =2.5)
-    lower = [m - s for m, s in zip(metrics.mean_fitnesses, metrics.std_fitnesses)]
-    upper = [m + s for m, s in zip(metrics.mean_fitnesses, metrics.std_fitnesses)]
+    plt.plot(generations, mean, label='Mean Fitness', linewidth =2.5)
+    plt.plot(generations, best, label='Max Fitness', linewidth =2.5)
+    plt.plot(generations, worst, label='Min Fitness', linewidth =2.5)
+    lower = [m - s for m, s in zip(mean, std)]
+    upper = [m + s for m, s in zip(mean, std)]
     plt.fill_between(generations, lower, upper, color='gray', alpha=0.6, label='Std Dev')
     plt.xlabel('Generation')
     plt.ylabel('Fitness')
@@ -52,4 +203,18 @@ def plot_metrics(metrics: GAMetrics, output_dir: Path) -> None:
     plt.legend()
     plt.grid(True)
     plt.savefig(output_dir / 'fitness_plot.png')
-    plt.close()
\ No newline at end of file
+    plt.close()
+
+
+def main() -> None:
+    import argparse
+
+    ap = argparse.ArgumentParser(description="Plot the fitness of a run, possibly still going, from its metrics log")
+    ap.add_argument("log", type=Path, help="metrics.ndjson in the run's output directory")
+    ap.add_argument("--out", type=Path, default=None, help="directory for fitness_plot.png (default: the log's)")
+    args = ap.parse_args()
+    plot_metrics(args.log, args.out or args.log.parent)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import cProfile
+import pstats
+import time
+from pathlib import Path
+from typing import Dict
+
+from src.utils.metrics import GAMetrics
+
+# Phases of a generation, in loop order. Together they cover the whole run: evaluation
+# includes rendering, scoring and dispatch (split further by eval_compute_times and
+# eval_dispatch_times); bookkeeping is early stopping, metrics and logging. Time spent
+# snapshotting a checkpoint is reported with the generation after it.
+PHASES = (
+    "selection", "crossover", "mutation", "replacement", "evaluation",
+    "migration", "diversity", "bookkeeping", "checkpoint",
+)
+
+
+class PhaseTimer:
+    """Splits a run into consecutive phases, timing each in wall-clock and CPU seconds.
+
+    ``lap(phase)`` charges the time since the previous lap (or ``start``) to ``phase``; a
+    phase may be charged several times. ``record`` closes a generation: it appends the
+    totals to the metrics and starts the next generation's, while the clock runs on.
+    CPU time is this process's, so work done by evaluator worker processes only shows
+    up as wall time.
+    """
+
+    def __init__(self) -> None:
+        self.wall: Dict[str, float] = {}
+        self.cpu: Dict[str, float] = {}
+        self._wall = self._cpu = 0.0
+
+    def start(self) -> None:
+        self.wall.clear()
+        self.cpu.clear()
+        self._wall, self._cpu = time.perf_counter(), time.process_time()
+
+    def lap(self, phase: str) -> None:
+        wall, cpu = time.perf_counter(), time.process_time()
+        self.wall[phase] = self.wall.get(phase, 0.0) + wall - self._wall
+        self.cpu[phase] = self.cpu.get(phase, 0.0) + cpu - self._cpu
+        self._wall, self._cpu = wall, cpu
+
+    def record(self, metrics: GAMetrics) -> None:
+        """Append this generation's time per phase (0 for phases not run) to ``metrics`` and reset it."""
+        for phase in PHASES:
+            metrics.phase_wall_times.setdefault(phase, []).append(self.wall.get(phase, 0.0))
+            metrics.phase_cpu_times.setdefault(phase, []).append(self.cpu.get(phase, 0.0))
+        self.wall.clear()
+        self.cpu.clear()
+
+
+def phase_summary(metrics: GAMetrics) -> str:
+    """One line with the total wall time per phase and its share of the run."""
+    totals = {phase: sum(times) for phase, times in metrics.phase_wall_times.items()}
+    overall = sum(totals.values()) or 1.0
+    return "Time per phase: " + ", ".join(
+        f"{phase} {seconds:.3f}s ({seconds / overall:.0%})" for phase, seconds in totals.items()
+    )
+
+
+def dump_profile(profiler: cProfile.Profile, path: str | Path, limit: int = 25) -> None:
+    """Save ``profiler``'s stats to ``path`` (load with ``pstats``/snakeviz) and print the top entries."""
+    profiler.dump_stats(str(path))
+    print(f"Profile written to {path}")
+    pstats.Stats(profiler).sort_stats(pstats.SortKey.CUMULATIVE).print_stats(limit)
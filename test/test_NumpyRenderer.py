@@ -0,0 +1,99 @@
+import random
+import numpy as np
+import pytest
+
+from src.engine.NumpyRenderer import NumpyRenderer
+from src.engine.PillowRenderer import PillowRenderer
+from src.models.triangle import Triangle
+
+
+def _random_triangles(rng: random.Random, n: int):
+    return [
+        Triangle(
+            p1=(rng.random(), rng.random()),
+            p2=(rng.random(), rng.random()),
+            p3=(rng.random(), rng.random()),
+            color=tuple(rng.randint(0, 255) for _ in range(4)),
+            z_index=rng.random(),
+        )
+        for _ in range(n)
+    ]
+
+
+def test_opaque_triangle_fills_interior_exactly():
+    renderer = NumpyRenderer(width=10, height=10)
+    img = renderer.render([Triangle((0, 0), (1, 0), (0, 1), (10, 20, 30, 255))])
+
+    assert img.shape == (10, 10, 4) and img.dtype == np.uint8
+    assert tuple(img[0, 0]) == (10, 20, 30, 255)   # inside
+    assert tuple(img[9, 9]) == (255, 255, 255, 255)  # outside keeps the background
+
+
+def test_semi_transparent_blend_matches_pillow_over_white():
+    tri = Triangle((0, 0), (1, 0), (0, 1), (0, 0, 255, 128))
+    expected = PillowRenderer(width=10, height=10).render([tri])
+    rendered = NumpyRenderer(width=10, height=10).render([tri])
+
+    assert np.abs(rendered[1, 1].astype(int) - expected[1, 1]).max() <= 1
+
+
+def test_matches_pillow_except_along_edges():
+    rng = random.Random(0)
+    triangles = _random_triangles(rng, 30)
+    expected = PillowRenderer(width=300, height=200).render(triangles).astype(np.float32)
+    rendered = NumpyRenderer(width=300, height=200).render(triangles).astype(np.float32)
+
+    differing = (np.abs(rendered - expected).max(axis=2) > 2).mean()
+    # Pillow also fills pixels its edges touch; NumPy samples pixel centers
+    assert differing < 0.1, f"{differing:.2%} of pixels differ"
+
+
+def test_float32_output_agrees_with_uint8_output():
+    rng = random.Random(1)
+    triangles = _random_triangles(rng, 10)
+    as_uint8 = NumpyRenderer(width=32, height=24).render(triangles)
+    as_float = NumpyRenderer(width=32, height=24, dtype="float32").render(triangles)
+
+    assert as_float.dtype == np.float32
+    assert np.abs(as_float - as_uint8).max() <= 0.5 + 1e-3
+
+
+def test_unknown_dtype_is_rejected():
+    with pytest.raises(ValueError):
+        NumpyRenderer(width=4, height=4, dtype="float16")
+
+
+def test_render_batch_stacks_individual_renders():
+    rng = random.Random(2)
+    population = [_random_triangles(rng, 5) for _ in range(3)]
+    renderer = NumpyRenderer(width=20, height=12)
+
+    batch = renderer.render_batch(population)
+    assert batch.shape == (3, 12, 20, 4)
+    for img, triangles in zip(batch, population):
+        assert np.array_equal(img, renderer.render(triangles))
+
+
+def test_render_region_matches_crop_of_full_render():
+    rng = random.Random(3)
+    triangles = _random_triangles(rng, 20)
+    renderer = NumpyRenderer(width=97, height=61)
+
+    region = renderer.render_region(triangles, (13, 7, 60, 50))
+    assert np.array_equal(region, renderer.render(triangles)[7:50, 13:60])
+
+
+def test_rgb_mode_matches_rgba_render_over_white():
+    triangles = _random_triangles(random.Random(6), 30)
+    for background in ((255, 255, 255, 255), (10, 200, 30, 128)):
+        reference = NumpyRenderer(width=53, height=41, background=background).render(triangles)
+        renderer = NumpyRenderer(width=53, height=41, background=background, mode="rgb")
+        rendered = renderer.render(triangles)
+
+        assert rendered.shape == (41, 53, 3)
+        alpha = reference[..., 3:4] / 255.0
+        # The RGBA render quantizes un-premultiplied colors under partial alpha, hence the slack
+        assert np.abs(rendered - (reference[..., :3] * alpha + 255 * (1 - alpha))).max() <= 2
+        if background[3] == 255:
+            assert np.array_equal(rendered, reference[..., :3])
+        assert np.array_equal(renderer.render_region(triangles, (5, 3, 40, 30)), rendered[3:30, 5:40])
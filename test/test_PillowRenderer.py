@@ -29,3 +29,82 @@ def test_render_argentina_flag():
     # For a dummy example, just check if error is below a high threshold
     error = mse(rendered, expected)
     assert error < 4000, f"Rendered image too different from reference (MSE={error})"
+
+
+def test_bbox_compositing_matches_full_overlay():
+    import random
+    rng = random.Random(0)
+
+    def rand_tri():
+        return Triangle(
+            p1=(rng.random(), rng.random()),
+            p2=(rng.random(), rng.random()),
+            p3=(rng.random(), rng.random()),
+            color=tuple(rng.randint(0, 255) for _ in range(4)),
+            z_index=rng.random(),
+        )
+
+    for _ in range(10):
+        triangles = [rand_tri() for _ in range(30)]
+        reference = PillowRenderer(width=97, height=61, compositing="overlay").render(triangles)
+        rendered = PillowRenderer(width=97, height=61, compositing="bbox").render(triangles)
+
+        assert rendered.shape == reference.shape
+        differing = np.any(rendered != reference, axis=2).mean()
+        # Only isolated edge pixels may differ due to Pillow's scanline rounding
+        assert differing < 1e-3, f"{differing:.4%} of pixels differ"
+
+
+def test_unknown_compositing_mode_is_rejected():
+    with pytest.raises(ValueError):
+        PillowRenderer(width=4, height=4, compositing="bogus")
+
+
+@pytest.mark.parametrize("mode", ["rgba", "rgb"])
+def test_render_region_matches_crop_of_full_render(mode):
+    import random
+    rng = random.Random(3)
+    triangles = [
+        Triangle(
+            p1=(rng.random(), rng.random()),
+            p2=(rng.random(), rng.random()),
+            p3=(rng.random(), rng.random()),
+            color=tuple(rng.randint(0, 255) for _ in range(4)),
+            z_index=rng.random(),
+        )
+        for _ in range(20)
+    ]
+    renderer = PillowRenderer(width=97, height=61, mode=mode)
+
+    full = renderer.render(triangles)
+    for x0, y0, x1, y1 in ((13, 7, 60, 50), (0, 0, 20, 15), (70, 40, 97, 61)):
+        assert np.array_equal(renderer.render_region(triangles, (x0, y0, x1, y1)), full[y0:y1, x0:x1])
+
+
+def test_rgb_mode_matches_overlay_render_over_white():
+    import random
+    rng = random.Random(5)
+    triangles = [
+        Triangle(
+            p1=(rng.random(), rng.random()),
+            p2=(rng.random(), rng.random()),
+            p3=(rng.random(), rng.random()),
+            color=tuple(rng.randint(0, 255) for _ in range(4)),
+            z_index=rng.random(),
+        )
+        for _ in range(30)
+    ]
+    for background in ((255, 255, 255, 255), (10, 200, 30, 128)):
+        reference = PillowRenderer(width=97, height=61, background=background, compositing="overlay").render(triangles)
+        rendered = PillowRenderer(width=97, height=61, background=background, mode="rgb").render(triangles)
+
+        assert rendered.shape == (61, 97, 3)
+        alpha = reference[..., 3:4] / 255.0
+        over_white = reference[..., :3] * alpha + 255 * (1 - alpha)
+        # The RGBA render quantizes un-premultiplied colors under partial alpha, hence the slack
+        assert np.abs(rendered - over_white).max() <= 2
+        if background[3] == 255:
+            assert np.array_equal(rendered, reference[..., :3])
+
+    with pytest.raises(ValueError):
+        PillowRenderer(width=4, height=4, mode="bogus")
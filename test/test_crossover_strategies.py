@@ -2,6 +2,9 @@ import os
 import sys
 import random
 
+import numpy as np
+import pytest
+
 from src.strategies.crossover.UniformCrossover import UniformCrossover
 from src.strategies.crossover.AnnularCrossover import AnnularCrossover
 
@@ -82,4 +85,66 @@ def test_two_point_crossover_exchanges_middle_segment_and_preserves_parents():
     # Child 2: p2[0] + p1[1:2] + p2[2:]
     assert c2.triangles == [t5, t1, t7, t8, t9]
     assert p1.triangles == original_p1
-    assert p2.triangles == original_p2
\ No newline at end of file
+    assert p2.triangles == original_p2
+
+
+def _parent_arrays(num_pairs: int, n: int):
+    # Gene value encodes (parent, pair, position), so every child allele can be traced back
+    pos = np.arange(n, dtype=np.float32)[None, :, None]
+    pair = np.arange(num_pairs, dtype=np.float32)[:, None, None] * 1000
+    shape = (num_pairs, n, 11)
+    return np.broadcast_to(pair + pos, shape).copy(), np.broadcast_to(pair + pos + 100, shape).copy()
+
+
+@pytest.mark.parametrize(
+    "xover",
+    [OnePointCrossover(), TwoPointCrossover(), UniformCrossover(), AnnularCrossover()],
+    ids=lambda x: type(x).__name__,
+)
+def test_crossover_batch_keeps_positions_and_complements_children(xover):
+    p1, p2 = _parent_arrays(64, 7)
+    c1, c2 = xover.crossover_batch(p1, p2, np.random.default_rng(0))
+    assert c1.shape == p1.shape and c1.dtype == np.float32
+    from_p1 = c1 == p1
+    # Each position comes whole from one parent, and the second child takes the other one
+    assert np.all(from_p1 | (c1 == p2))
+    assert np.all(from_p1.all(axis=2) | (~from_p1).all(axis=2))
+    assert np.array_equal(c2, np.where(from_p1, p2, p1))
+    assert from_p1.any() and (~from_p1).any()
+
+
+def test_point_crossover_batch_uses_contiguous_segments():
+    p1, p2 = _parent_arrays(200, 6)
+    c1, _ = OnePointCrossover().crossover_batch(p1, p2, np.random.default_rng(1))
+    from_p1 = (c1 == p1)[..., 0]
+    # A prefix of at least one and at most n - 1 triangles comes from parent1
+    assert np.all(np.diff(from_p1.astype(int), axis=1) <= 0)
+    assert from_p1[:, 0].all() and not from_p1[:, -1].any()
+
+    c1, _ = TwoPointCrossover().crossover_batch(p1, p2, np.random.default_rng(2))
+    from_p2 = (c1 == p2)[..., 0]
+    assert from_p2.sum(axis=1).min() >= 1
+    assert not from_p2[:, 0].any()
+    assert np.all(np.abs(np.diff(from_p2.astype(int), axis=1)).sum(axis=1) <= 2)
+
+
+class _FixedRandom(random.Random):
+    def __init__(self, start: int, length: int) -> None:
+        super().__init__()
+        self._values = [start, length]
+
+    def randint(self, a: int, b: int) -> int:
+        return self._values.pop(0)
+
+
+def test_annular_crossover_batch_mask_matches_scalar_for_every_ring():
+    n = 5
+    t1 = [_make_triangle(i) for i in range(n)]
+    t2 = [_make_triangle(i) for i in range(10, 10 + n)]
+    ind1, ind2 = Individual(t1), Individual(t2)
+    for start in range(n):
+        for length in range(1, n + 1):
+            c1, c2 = AnnularCrossover(rng=_FixedRandom(start, length)).crossover(ind1, ind2)
+            mask = [start <= j < min(start + length, n) for j in range(n)]
+            assert c1.triangles == [a if m else b for a, b, m in zip(t1, t2, mask)]
+            assert c2.triangles == [b if m else a for a, b, m in zip(t1, t2, mask)]
@@ -0,0 +1,49 @@
+import itertools
+
+import numpy as np
+import pytest
+
+from src.models.population import PopulationArray
+from src.utils.diversity import population_diversity
+
+
+def _population(n: int, seed: int = 0) -> PopulationArray:
+    return PopulationArray.from_genes(np.random.default_rng(seed).random((n, 5, 11), dtype=np.float32))
+
+
+def _pairwise(pop: PopulationArray) -> np.ndarray:
+    """Brute-force distances between all unique pairs of min-max normalized genomes."""
+    arr = pop.genes.reshape(len(pop), -1).astype(float)
+    arr = (arr - arr.min(axis=0)) / np.ptp(arr, axis=0)
+    return np.array([np.linalg.norm(a - b) for a, b in itertools.combinations(arr, 2)])
+
+
+def test_exact_and_variance_match_brute_force_pairwise_distances():
+    pop = _population(30)
+    dists = _pairwise(pop)
+
+    assert population_diversity(pop) == pytest.approx(dists.mean())
+    # Mean squared pairwise distance from per-gene variances
+    assert population_diversity(pop, "variance") == pytest.approx(np.sqrt((dists ** 2).mean()))
+    assert population_diversity(pop.members, "variance") == population_diversity(pop, "variance")
+
+
+def test_exact_in_row_blocks_matches_single_block(monkeypatch):
+    pop = _population(40)
+    expected = population_diversity(pop)
+    monkeypatch.setattr("src.utils.diversity._BLOCK_BYTES", 1)
+
+    assert population_diversity(pop) == pytest.approx(expected)
+
+
+def test_sampled_estimates_exact_mean():
+    pop = _population(200)
+
+    estimate = population_diversity(pop, "sampled", samples=4000, rng=np.random.default_rng(1))
+    assert estimate == pytest.approx(population_diversity(pop), rel=0.02)
+
+
+def test_small_populations_and_unknown_method():
+    assert population_diversity(_population(1), "variance") == 0.0
+    with pytest.raises(ValueError):
+        population_diversity(_population(4), "pairwise")
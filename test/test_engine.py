@@ -0,0 +1,367 @@
+import random
+
+import numpy as np
+import pytest
+
+from src.engine.PillowRenderer import PillowRenderer
+from src.engine.engine import GAEngine
+from src.engine.resolution import ResolutionStage, scale_fitness
+from src.models.individual import Individual
+from src.models.population import PopulationArray
+from src.models.triangle import Triangle
+from src.strategies.crossover.OnePointCrossover import OnePointCrossover
+from src.strategies.fitness.PixelMSEFitness import PixelMSEFitness
+from src.strategies.mutation.MultiGenLimitedMutation import MultiGenLimitedMutation
+from src.strategies.selection.TournamentSelection import TournamentSelection
+
+
+def _population(n: int, num_triangles: int, seed: int = 0):
+    rng = random.Random(seed)
+    return [
+        Individual([
+            Triangle(
+                p1=(rng.random(), rng.random()),
+                p2=(rng.random(), rng.random()),
+                p3=(rng.random(), rng.random()),
+                color=tuple(rng.randint(0, 255) for _ in range(4)),
+                z_index=rng.random(),
+            )
+            for _ in range(num_triangles)
+        ])
+        for _ in range(n)
+    ]
+
+
+def _engine(**kwargs) -> GAEngine:
+    renderer = PillowRenderer(width=16, height=12)
+    target = renderer.render(_population(1, 6, seed=99)[0].triangles)
+    return GAEngine(
+        fitness=PixelMSEFitness(renderer=renderer, target=target),
+        crossover=OnePointCrossover(),
+        **{"selection": TournamentSelection(), "mutation": MultiGenLimitedMutation(), "pop_size": 8, "generations": 4, "elitism": 2, "rng": random.Random(7), "max_workers": 2, **kwargs},
+    )
+
+
+def test_fitness_cache_serves_repeated_genomes_without_changing_results():
+    _, uncached = _engine().run(_population(8, 6))
+    best, cached = _engine(fitness_cache_size=64).run(_population(8, 6))
+
+    assert np.allclose(cached.min_fitnesses, uncached.min_fitnesses)
+    # Elites and survivors are carried over unchanged, so later generations hit the cache
+    assert cached.fitness_cache_hits > 0
+    assert cached.fitness_cache_hits + cached.fitness_cache_misses == 8 * 5
+    assert uncached.fitness_cache_hits == 0
+
+
+def test_genome_key_depends_on_values_not_identity():
+    ind = _population(1, 3)[0]
+    copy = Individual([Triangle.clone(t) for t in ind.triangles])
+    other = _population(1, 3, seed=1)[0]
+
+    assert Individual.genome_key(ind) == Individual.genome_key(copy)
+    assert Individual.genome_key(ind) != Individual.genome_key(other)
+
+
+def test_resolution_schedule_scores_coarse_stages_then_full_resolution():
+    schedule = [ResolutionStage(0.5, 2), ResolutionStage(0.25, 1)]
+    engine = _engine(resolution_schedule=schedule, fitness_cache_size=64)
+    best, metrics = engine.run(_population(8, 6))
+
+    # Initial population and generations 1-2 at 1/2 scale, generation 3 at 1/4, generation 4 at full
+    assert metrics.resolution_scales == [0.5, 0.5, 0.5, 0.25, 1.0]
+    assert len(metrics.min_fitnesses) == 5
+    assert np.isclose(metrics.min_fitnesses[-1], engine.fitness.evaluate(best))
+
+
+def test_scale_fitness_builds_a_smaller_renderer_and_box_filtered_target():
+    fitness = _engine().fitness
+    half = scale_fitness(fitness, 0.5)
+
+    assert (half.renderer.width, half.renderer.height) == (8, 6)
+    assert half.target.shape == (6, 8, 4)
+    assert np.allclose(half.target[0, 0], fitness.target[:2, :2].reshape(-1, 4).mean(axis=0), atol=1)
+    assert scale_fitness(fitness, 1.0) is fitness
+
+
+def test_surrogate_fitness_verifies_top_k_at_full_resolution():
+    engine = _engine()
+    engine.fitness.surrogate_scale = 0.5
+    engine.fitness.surrogate_top_k = 3
+    best, metrics = engine.run(_population(8, 6))
+
+    surrogate = engine.fitness.surrogate()
+    assert (surrogate.renderer.width, surrogate.renderer.height) == (8, 6)
+    assert surrogate.surrogate() is None
+    # One correlation per recorded generation, and the reported best is a true full-resolution score
+    assert len(metrics.surrogate_rank_correlations) == len(metrics.min_fitnesses) == 5
+    assert all(-1.0 <= c <= 1.0 for c in metrics.surrogate_rank_correlations)
+    assert np.isclose(metrics.min_fitnesses[-1], engine.fitness.evaluate(best))
+
+
+def test_island_model_runs_islands_and_merges_their_metrics():
+    from src.engine.islands import IslandModel
+
+    engine = _engine(executor="serial")
+    model = IslandModel(count=3, migration_interval=2, migration_size=1, topology="random")
+    best, metrics = model.run(engine, [_population(8, 6, seed=s) for s in range(3)])
+
+    assert isinstance(best, Individual)
+    assert len(metrics.islands) == 3
+    assert len(metrics.mean_fitnesses) == engine.generations + 1
+    for gen, low in enumerate(metrics.min_fitnesses):
+        assert low == min(island["min_fitnesses"][gen] for island in metrics.islands)
+    assert best.genes.shape == (6, 11)
+
+
+def test_migration_replaces_the_worst_individuals_with_the_neighbours_best():
+    import queue
+    from src.engine.islands import IslandModel, Migration
+
+    model = IslandModel(count=2, migration_interval=1, migration_size=2)
+    inboxes = [queue.Queue(), queue.Queue()]
+    engine = _engine(executor="serial", migration=Migration(0, model, inboxes, topology_seed=0))
+    pop = _population(8, 6)
+    migrants = np.stack([ind.genes for ind in _population(2, 6, seed=5)])
+    inboxes[0].put((1, 1, migrants))
+    fitness = np.arange(8, dtype=np.float64)  # minimizing: index 0 is the best
+
+    with engine._build_evaluator(engine.fitness) as evaluator:
+        new_pop, new_fitness, _ = engine._migrate(
+            0, PopulationArray.from_individuals(pop), fitness, np.ones(8, dtype=bool), evaluator
+        )
+
+    sent = inboxes[1].get_nowait()
+    assert sent[:2] == (0, 1) and np.array_equal(sent[2], np.stack([pop[0].genes, pop[1].genes]))
+    assert np.array_equal(new_pop.genes[6:], migrants)
+    assert np.array_equal(new_pop.genes[:6], np.stack([ind.genes for ind in pop[:6]]))
+    assert np.allclose(new_fitness[6:], [engine.fitness.evaluate(Individual(genes=g)) for g in migrants])
+
+
+def test_resume_from_checkpoint_continues_bit_exactly(tmp_path):
+    from src.utils.checkpoint import load_checkpoint
+
+    population = _population(8, 6)
+    expected_best, expected = _engine(executor="serial", generations=6, fitness_cache_size=16).run(population)
+
+    path = tmp_path / "checkpoint.npz"
+    _engine(
+        executor="serial", generations=3, fitness_cache_size=16, checkpoint_every=3, checkpoint_path=str(path)
+    ).run(population)
+    checkpoint = load_checkpoint(path)
+    assert checkpoint.generation == 2 and checkpoint.genes.shape == (8, 6, 11)
+    best, metrics = _engine(executor="serial", generations=6, fitness_cache_size=16).resume(checkpoint)
+
+    assert np.array_equal(best.genes, expected_best.genes)
+    assert metrics.min_fitnesses == expected.min_fitnesses
+    assert metrics.mean_fitnesses == expected.mean_fitnesses
+    assert metrics.fitness_cache_hits == expected.fitness_cache_hits
+
+
+def test_run_records_wall_and_cpu_time_per_phase_and_generation():
+    from src.utils.profiling import PHASES
+
+    _, metrics = _engine(executor="serial").run(_population(8, 6))
+
+    assert set(metrics.phase_wall_times) == set(PHASES) == set(metrics.phase_cpu_times)
+    for phase in PHASES:
+        assert len(metrics.phase_wall_times[phase]) == len(metrics.mean_fitnesses)
+        assert min(metrics.phase_wall_times[phase]) >= 0.0
+    assert sum(metrics.phase_wall_times["evaluation"]) > 0.0
+    assert metrics.phase_wall_times["selection"][0] == 0.0  # the initial population is only scored
+
+
+def test_diversity_is_computed_every_n_generations_without_changing_the_run():
+    _, every = _engine(executor="serial", generations=5).run(_population(8, 6))
+    _, sparse = _engine(executor="serial", generations=5, diversity="sampled", diversity_every=2).run(_population(8, 6))
+
+    assert sparse.min_fitnesses == every.min_fitnesses
+    assert len(sparse.population_diversities) == 6
+    assert np.isnan(sparse.population_diversities[1::2]).all()
+    assert not np.isnan(sparse.population_diversities[::2]).any()
+    assert (every.diversity_method, sparse.diversity_method) == ("exact", "sampled")
+    assert sparse.generation_record(0)["diversity_method"] == "sampled"
+
+
+def test_metrics_log_streams_every_generation_and_survives_a_resume(tmp_path):
+    from src.utils.checkpoint import load_checkpoint
+    from src.utils.metrics import _log_columns, plot_metrics, read_metrics_log
+
+    log, checkpoint = tmp_path / "metrics.ndjson", tmp_path / "checkpoint.npz"
+    _, expected = _engine(executor="serial", generations=6).run(_population(8, 6))
+    # A run that checkpoints after its third generation but dies after logging the fourth
+    _engine(
+        executor="serial", generations=4, checkpoint_every=3, checkpoint_path=str(checkpoint),
+        metrics_log_path=str(log), metrics_log_flush_every=2,
+    ).run(_population(8, 6))
+    assert [r["generation"] for r in read_metrics_log(log)] == [0, 1, 2, 3, 4]
+    _, metrics = _engine(executor="serial", generations=6, metrics_log_path=str(log)).resume(load_checkpoint(checkpoint))
+
+    assert [r["generation"] for r in read_metrics_log(log)] == [0, 1, 2, 3, 4, 4, 5, 6]
+    columns = _log_columns(log, ["min_fitness", "population_diversity"])
+    assert columns["min_fitness"] == metrics.min_fitnesses == expected.min_fitnesses
+    assert columns["population_diversity"] == metrics.population_diversities
+    plot_metrics(log, tmp_path)
+    assert (tmp_path / "fitness_plot.png").exists()
+
+
+def test_callbacks_see_each_generation_and_drive_the_mutation_schedule(capsys):
+    from src.engine.callbacks import Callback, default_callbacks
+    from src.strategies.mutation.NonUniform import NonUniform
+
+    class Recorder(Callback):
+        def __init__(self):
+            self.events, self.progress = [], []
+
+        def on_generation_start(self, engine, gen, pop, fitness):
+            self.events.append(("start", gen))
+
+        def on_evaluated(self, engine, gen, pop, fitness, verified):
+            self.events.append(("evaluated", gen))
+
+        def on_improvement(self, engine, gen, pop, fitness, best):
+            assert fitness[best] == fitness.min()
+            self.events.append(("improvement", gen))
+
+        def on_generation_end(self, engine, gen, pop, fitness, metrics):
+            assert len(metrics.mean_fitnesses) == gen + 1 and fitness.mean() == metrics.mean_fitnesses[-1]
+            self.progress.append(engine.mutation.progress)
+            self.events.append(("end", gen))
+
+    recorder = Recorder()
+    _engine(executor="serial", mutation=NonUniform(), callbacks=[*default_callbacks(), recorder]).run(_population(8, 6))
+
+    steps = [e for e in recorder.events if e[0] != "improvement"]
+    assert steps == [("evaluated", 0), ("end", 0)] + [
+        (event, gen) for gen in range(1, 5) for event in ("start", "evaluated", "end")
+    ]
+    assert {gen for event, gen in recorder.events if event == "improvement"} <= {1, 2, 3, 4}
+    assert recorder.progress == [0.0, 0.0, 0.25, 0.5, 0.75]
+    assert capsys.readouterr().out.count("Generation ") == 4
+
+    _engine(executor="serial", callbacks=[]).run(_population(8, 6))
+    assert capsys.readouterr().out == ""
+
+
+@pytest.mark.parametrize("executor", ["serial", "thread"])
+def test_steady_state_reports_virtual_generations_and_keeps_the_best(executor):
+    best, metrics = _engine(executor=executor, steady_state=True, generations=5).run(_population(8, 6))
+
+    assert len(metrics.min_fitnesses) == len(metrics.phase_wall_times["evaluation"]) == 6
+    # Children only ever replace the worst individual
+    assert all(b <= a for a, b in zip(metrics.min_fitnesses, metrics.min_fitnesses[1:]))
+    assert metrics.min_fitnesses[-1] < metrics.min_fitnesses[0]
+    assert best.genes.shape == (6, 11)
+
+
+def test_steady_state_resumes_from_a_checkpoint_with_children_in_flight(tmp_path):
+    from src.utils.checkpoint import load_checkpoint
+
+    path = tmp_path / "checkpoint.npz"
+    _, expected = _engine(executor="serial", steady_state=True, generations=5).run(_population(8, 6))
+    _engine(
+        executor="serial", steady_state=True, generations=3, checkpoint_every=3, checkpoint_path=str(path),
+    ).run(_population(8, 6))
+    checkpoint = load_checkpoint(path)
+    _, metrics = _engine(executor="serial", steady_state=True, generations=5).resume(checkpoint)
+
+    assert metrics.min_fitnesses == expected.min_fitnesses
+    assert metrics.mean_fitnesses == expected.mean_fitnesses
+
+    # With two workers, one child is still being scored when a generation ends
+    _engine(
+        executor="thread", steady_state=True, generations=3, checkpoint_every=3, checkpoint_path=str(path),
+    ).run(_population(8, 6))
+    checkpoint = load_checkpoint(path)
+    _, metrics = _engine(executor="thread", steady_state=True, generations=5).resume(checkpoint)
+
+    assert checkpoint.state["pending"].shape == (1, 6, 11)
+    assert len(metrics.min_fitnesses) == 6
+
+
+def test_steady_state_selects_parents_once_per_virtual_generation():
+    from src.strategies.selection.BoltzmannSelection import BoltzmannSelection
+
+    engine = _engine(executor="serial", steady_state=True, generations=5, selection=BoltzmannSelection())
+    engine.run(_population(8, 6))
+
+    assert engine.selection.generation_count == 5
+
+
+def test_incremental_fitness_starts_no_worker_pool():
+    from src.engine.evaluation import SerialEvaluator
+
+    engine = _engine(executor="process", max_workers=4)
+    engine.fitness.incremental = True
+    with pytest.warns(RuntimeWarning, match="main process"):
+        evaluator = engine._build_evaluator(engine.fitness)
+    with evaluator:
+        assert isinstance(evaluator, SerialEvaluator)
+    with pytest.warns(RuntimeWarning):
+        _, metrics = engine.run(_population(8, 6))
+    assert len(metrics.min_fitnesses) == 5
+
+
+def test_island_model_refuses_to_checkpoint():
+    from src.engine.islands import IslandModel
+
+    with pytest.raises(ValueError, match="not checkpointed"):
+        IslandModel(count=2).run(_engine(checkpoint_every=2), [_population(8, 6), _population(8, 6)])
+
+
+def test_metrics_log_reaches_the_checkpoint_when_a_crash_loses_the_last_batch(tmp_path, monkeypatch):
+    from src.utils.checkpoint import load_checkpoint
+    from src.utils.metrics import MetricsLogWriter, _log_columns, read_metrics_log
+
+    log, checkpoint = tmp_path / "metrics.ndjson", tmp_path / "checkpoint.npz"
+    _, expected = _engine(executor="serial", generations=6).run(_population(8, 6))
+    with monkeypatch.context() as m:
+        # The process dies with its unflushed batch
+        m.setattr(MetricsLogWriter, "close", lambda self: self._executor.shutdown(wait=True))
+        _engine(
+            executor="serial", generations=5, checkpoint_every=3, checkpoint_path=str(checkpoint),
+            metrics_log_path=str(log), metrics_log_flush_every=100,
+        ).run(_population(8, 6))
+    assert [r["generation"] for r in read_metrics_log(log)] == [0, 1, 2, 3]
+    _engine(executor="serial", generations=6, metrics_log_path=str(log)).resume(load_checkpoint(checkpoint))
+
+    assert _log_columns(log, ["min_fitness"])["min_fitness"] == expected.min_fitnesses
+
+
+def test_log_columns_index_records_by_generation(tmp_path):
+    import json
+    from src.utils.metrics import _log_columns
+
+    log = tmp_path / "metrics.ndjson"
+    log.write_text("".join(json.dumps({"generation": g, "min_fitness": float(g)}) + "\n" for g in (0, 1, 2, 5, 6, 1, 2)))
+
+    column = _log_columns(log, ["min_fitness"])["min_fitness"]
+    assert column == [0.0, 1.0, 2.0]
+    log.write_text("".join(json.dumps({"generation": g, "min_fitness": float(g)}) + "\n" for g in (0, 1, 4)))
+    column = _log_columns(log, ["min_fitness"])["min_fitness"]
+    assert column[:2] == [0.0, 1.0] and np.isnan(column[2:4]).all() and column[4] == 4.0
+
+
+def test_metrics_json_writes_nan_as_null(tmp_path):
+    import json
+    from src.utils.metrics import write_metrics
+
+    _, metrics = _engine(executor="serial", diversity_every=2).run(_population(8, 6))
+    metrics.surrogate_rank_correlations = [float("nan")] * len(metrics.min_fitnesses)
+    write_metrics({"seed": 1}, tmp_path, 1.0, metrics.__dict__)
+
+    def reject(token):
+        raise ValueError(f"not JSON: {token}")
+
+    saved = json.loads((tmp_path / "metrics.json").read_text(), parse_constant=reject)
+    assert saved["population_diversities"][1] is None and saved["population_diversities"][0] > 0
+    assert saved["surrogate_rank_correlations"] == [None] * len(metrics.min_fitnesses)
+
+
+@pytest.mark.parametrize("maximize", [False, True])
+def test_worst_index_is_the_last_of_the_ranking(maximize):
+    engine = _engine(maximize=maximize)
+    rng = np.random.default_rng(0)
+    for _ in range(20):
+        fitness = rng.permutation(50).astype(np.float64)
+        verified = rng.random(50) < (0.8 if _ % 2 else 1.0)
+        assert engine._worst_index(fitness, verified) == engine._ranking(fitness.tolist(), verified)[-1]
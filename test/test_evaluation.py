@@ -0,0 +1,234 @@
+import random
+import socket
+from multiprocessing.shared_memory import SharedMemory
+
+import numpy as np
+import pytest
+
+from src.engine.PillowRenderer import PillowRenderer
+from src.engine.evaluation import ProcessEvaluator, build_evaluator
+from src.models.individual import Individual
+from src.models.triangle import Triangle
+from src.strategies.fitness.PixelMSEFitness import PixelMSEFitness
+
+
+def _population(n: int, num_triangles: int, seed: int = 0):
+    rng = random.Random(seed)
+    return [
+        Individual([
+            Triangle(
+                p1=(rng.random(), rng.random()),
+                p2=(rng.random(), rng.random()),
+                p3=(rng.random(), rng.random()),
+                color=tuple(rng.randint(0, 255) for _ in range(4)),
+                z_index=rng.random(),
+            )
+            for _ in range(num_triangles)
+        ])
+        for _ in range(n)
+    ]
+
+
+def test_process_evaluator_matches_in_process_scores_and_ships_only_genes():
+    renderer = PillowRenderer(width=64, height=48)
+    target = renderer.render(_population(1, 6, seed=99)[0].triangles)
+    fitness = PixelMSEFitness(renderer=renderer, target=target)
+    population = _population(9, 5)
+
+    with ProcessEvaluator(fitness, max_workers=2) as evaluator:
+        scores = evaluator.evaluate(population)
+        shm_names = [shm.name for shm in evaluator._blocks]
+
+    assert np.allclose(scores, fitness.evaluate_batch(population))
+    # Tasks carry gene arrays and scores, never the target image
+    stats = evaluator.take_stats()
+    genes_bytes = sum(ind.genes.nbytes for ind in population)
+    assert genes_bytes < stats.ipc_bytes < target.nbytes
+    assert stats.compute_time > 0
+    # Shared memory is released with the pool
+    assert shm_names
+    for name in shm_names:
+        with pytest.raises(FileNotFoundError):
+            SharedMemory(name=name)
+
+
+def test_process_evaluator_chunk_length_follows_config_and_measurements():
+    renderer = PillowRenderer(width=16, height=12)
+    fitness = PixelMSEFitness(renderer=renderer, target=renderer.render([]))
+    population = _population(10, 3)
+
+    with ProcessEvaluator(fitness, max_workers=2, chunksize=3) as evaluator:
+        assert evaluator._chunk_length(10) == 3
+        assert np.allclose(evaluator.evaluate(population), fitness.evaluate_batch(population))
+
+    with ProcessEvaluator(fitness, max_workers=4) as evaluator:
+        # Before any measurement: one chunk per worker
+        assert evaluator._chunk_length(100) == 25
+        # Cheap tasks relative to overhead: stay at one chunk per worker
+        evaluator._time_per_individual, evaluator._time_per_task = 1e-4, 1e-2
+        assert evaluator._chunk_length(100) == 25
+        # Expensive individuals: smaller chunks keep overhead near AUTO_OVERHEAD
+        evaluator._time_per_individual, evaluator._time_per_task = 1e-1, 2e-2
+        assert evaluator._chunk_length(100) == 4
+
+    with pytest.raises(ValueError):
+        ProcessEvaluator(fitness, chunksize=0)
+
+
+@pytest.mark.parametrize("name", ["process", "thread", "serial"])
+def test_build_evaluator_backends_agree(name):
+    renderer = PillowRenderer(width=32, height=24)
+    target = renderer.render(_population(1, 6, seed=99)[0].triangles)
+    fitness = PixelMSEFitness(renderer=renderer, target=target)
+    population = _population(7, 4)
+
+    with build_evaluator(name, {"fitness": fitness, "max_workers": 2, "chunksize": 2}) as evaluator:
+        scores = evaluator.evaluate(population)
+        stats = evaluator.take_stats()
+
+    assert np.allclose(scores, fitness.evaluate_batch(population))
+    assert stats.compute_time > 0
+    # Only the process backend moves data between processes
+    assert (stats.ipc_bytes > 0) == (name == "process")
+
+
+@pytest.mark.parametrize("name", ["process", "thread", "serial"])
+def test_submitted_gene_arrays_are_scored_asynchronously(name):
+    renderer = PillowRenderer(width=32, height=24)
+    target = renderer.render(_population(1, 6, seed=99)[0].triangles)
+    fitness = PixelMSEFitness(renderer=renderer, target=target)
+    population = _population(5, 4)
+
+    with build_evaluator(name, {"fitness": fitness, "max_workers": 2}) as evaluator:
+        futures = [evaluator.submit(ind.genes[None]) for ind in population]
+        scores = [float(evaluator.collect(f)[0]) for f in futures]
+        stats = evaluator.take_stats()
+
+    assert np.allclose(scores, fitness.evaluate_batch(population))
+    assert stats.compute_time > 0
+    assert (stats.ipc_bytes > 0) == (name == "process")
+
+
+def _serve(ports):
+    from src.engine.remote import serve
+    server = serve("127.0.0.1", 0)
+    ports.put(server.server_address[1])
+    server.serve_forever()
+
+
+def test_remote_evaluator_survives_a_lost_server():
+    import multiprocessing as mp
+    from src.engine.remote import RemoteEvaluator
+
+    renderer = PillowRenderer(width=64, height=48)
+    target = renderer.render(_population(1, 6, seed=99)[0].triangles)
+    fitness = PixelMSEFitness(renderer=renderer, target=target)
+    population = _population(12, 5)
+
+    ports = mp.Queue()
+    servers = [mp.Process(target=_serve, args=(ports,), daemon=True) for _ in range(2)]
+    for p in servers:
+        p.start()
+    try:
+        workers = [f"127.0.0.1:{ports.get(timeout=30)}" for _ in servers]
+        with RemoteEvaluator(fitness, chunksize=2, workers=workers, timeout=10.0, retries=1) as evaluator:
+            assert np.allclose(evaluator.evaluate(population), fitness.evaluate_batch(population))
+            # The target crosses the wire once per server, at handshake; then only genes and scores
+            assert evaluator.take_stats().ipc_bytes > 2 * target.nbytes
+            evaluator.evaluate(population)
+            genes_bytes = sum(ind.genes.nbytes for ind in population)
+            assert genes_bytes < evaluator.take_stats().ipc_bytes < target.nbytes
+
+            # Asynchronous submissions use the same connections, one chunk per server at a time
+            futures = [evaluator.submit(ind.genes[None]) for ind in population]
+            assert np.allclose([evaluator.collect(f)[0] for f in futures], fitness.evaluate_batch(population))
+
+            servers[0].kill()
+            servers[0].join()
+            assert np.allclose(evaluator.evaluate(population), fitness.evaluate_batch(population))
+            assert sum(w.sock is not None for w in evaluator._workers) == 1
+    finally:
+        for p in servers:
+            p.kill()
+
+
+def test_remote_evaluator_reports_bad_replies_and_unreachable_servers(monkeypatch):
+    import struct
+    import threading
+    from src.engine import remote
+
+    renderer = PillowRenderer(width=16, height=12)
+    target = renderer.render(_population(1, 6, seed=99)[0].triangles)
+    fitness = PixelMSEFitness(renderer=renderer, target=target)
+
+    with remote.serve() as server:
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        address = f"127.0.0.1:{server.server_address[1]}"
+
+        opened = []
+        connect = remote._Worker.connect
+        monkeypatch.setattr(remote._Worker, "connect", lambda self, hello: (opened.append(self), connect(self, hello))[1])
+        with socket.socket() as unused:
+            unused.bind(("127.0.0.1", 0))
+            dead = f"127.0.0.1:{unused.getsockname()[1]}"
+        with pytest.raises(ConnectionError):
+            remote.RemoteEvaluator(fitness, workers=[address, dead], timeout=2.0, retries=0)
+        assert opened and all(w.sock is None for w in opened)
+
+        def malformed(self, genes):
+            raise struct.error("unpack requires a buffer of 8 bytes")
+
+        with remote.RemoteEvaluator(fitness, chunksize=1, workers=[address], timeout=2.0) as evaluator:
+            monkeypatch.setattr(remote._Worker, "evaluate", malformed)
+            with pytest.raises(struct.error):
+                evaluator.evaluate(_population(3, 2))
+        server.shutdown()
+
+
+def test_remote_handshake_is_json_and_builds_only_registered_classes():
+    import json
+    import pickle
+    from src.engine import remote
+    from src.engine.NumpyRenderer import NumpyRenderer
+
+    population = _population(4, 5)
+    for renderer in (PillowRenderer(width=16, height=12, background=(0, 0, 0, 255)), NumpyRenderer(width=16, height=12)):
+        fitness = PixelMSEFitness(renderer=renderer, target=renderer.render(_population(1, 6, seed=99)[0].genes))
+        payload = bytearray(b"".join(remote._hello_payload(fitness)))
+        rebuilt = remote._load_hello(payload)
+        assert rebuilt.renderer == renderer
+        assert np.array_equal(rebuilt.evaluate_batch(population), fitness.evaluate_batch(population))
+
+    meta = pickle.dumps(fitness)
+    with pytest.raises(UnicodeDecodeError):
+        remote._load_hello(bytearray(remote._META.pack(len(meta)) + meta))
+    meta = json.dumps({"fitness": {"type": "os.system", "params": {}}, "arrays": []}).encode()
+    with pytest.raises(ValueError, match="Unknown"):
+        remote._load_hello(bytearray(remote._META.pack(len(meta)) + meta))
+
+
+def test_remote_evaluator_gives_up_on_a_server_that_rejects_the_handshake(monkeypatch):
+    import threading
+    from src.engine import remote
+
+    renderer = PillowRenderer(width=16, height=12)
+    fitness = PixelMSEFitness(renderer=renderer, target=renderer.render(_population(1, 6, seed=99)[0].triangles))
+    hellos = []
+    load_hello = remote._load_hello
+
+    def reject_after_first(payload):
+        hellos.append(payload)
+        if len(hellos) > 1:
+            raise ValueError("no more clients")
+        return load_hello(payload)
+
+    monkeypatch.setattr(remote, "_load_hello", reject_after_first)
+    with remote.serve() as server:
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        address = f"127.0.0.1:{server.server_address[1]}"
+        with remote.RemoteEvaluator(fitness, chunksize=1, workers=[address], timeout=2.0) as evaluator:
+            evaluator._workers[0].sock.close()  # the next chunk loses its connection and re-handshakes
+            with pytest.raises(ConnectionError, match="were lost"):
+                evaluator.submit(_population(1, 2)[0].genes[None]).result(timeout=10)
+        server.shutdown()
+    assert len(hellos) == 2
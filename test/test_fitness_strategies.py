@@ -1,4 +1,5 @@
 import numpy as np
+import pytest
 from src.engine.PillowRenderer import PillowRenderer
 from src.strategies.fitness.PixelMSEFitness import PixelMSEFitness
 from src.models.triangle import Triangle
@@ -44,3 +45,157 @@ def test_pixel_mse_positive_on_difference():
     # The score should be greater than the alpha regularization term
     expected_alpha_reg = fit.alpha_reg_lambda * np.mean([t.color[3] / 255.0 for t in changed])
     assert score > expected_alpha_reg
+
+
+def _random_individuals(n: int, num_triangles: int, seed: int = 0):
+    import random
+    rng = random.Random(seed)
+    return [
+        Individual([
+            Triangle(
+                p1=(rng.random(), rng.random()),
+                p2=(rng.random(), rng.random()),
+                p3=(rng.random(), rng.random()),
+                color=tuple(rng.randint(0, 255) for _ in range(4)),
+                z_index=rng.random(),
+            )
+            for _ in range(num_triangles)
+        ])
+        for _ in range(n)
+    ]
+
+
+def test_pixel_mse_evaluate_batch_matches_evaluate():
+    renderer = PillowRenderer(width=24, height=16)
+    population = _random_individuals(5, 8)
+    target = renderer.render(_random_individuals(1, 8, seed=1)[0].triangles)
+    fit = PixelMSEFitness(renderer=renderer, target=target)
+
+    batch = fit.evaluate_batch(population)
+    assert batch.shape == (5,)
+    assert np.allclose(batch, [fit.evaluate(ind) for ind in population], rtol=1e-5)
+
+
+def test_ssim_evaluate_batch_matches_evaluate():
+    from src.strategies.fitness.SSIMFitness import SSIMFitness
+
+    renderer = PillowRenderer(width=24, height=16)
+    population = _random_individuals(4, 8)
+    target = renderer.render(_random_individuals(1, 8, seed=1)[0].triangles)
+    fit = SSIMFitness(renderer=renderer, target=target)
+
+    assert np.allclose(fit.evaluate_batch(population), [fit.evaluate(ind) for ind in population])
+
+
+@pytest.mark.parametrize("backend, mode", [("numpy", "rgba"), ("pillow", "rgba"), ("pillow", "rgb")])
+def test_incremental_pixel_mse_matches_full_evaluation(backend, mode):
+    import random
+    from src.engine.NumpyRenderer import NumpyRenderer
+    from src.engine.PillowRenderer import PillowRenderer
+    from src.strategies.mutation.MultiGenLimitedMutation import MultiGenLimitedMutation
+
+    calls = []
+    base = NumpyRenderer if backend == "numpy" else PillowRenderer
+
+    class SpyRenderer(base):
+        def render_region(self, triangles, box):
+            calls.append(box)
+            return super().render_region(triangles, box)
+
+    renderer = SpyRenderer(width=48, height=32, mode=mode)
+    parent = _random_individuals(1, 20)[0]
+    target = renderer.render(_random_individuals(1, 20, seed=1)[0].triangles)
+    full = PixelMSEFitness(renderer=base(width=48, height=32, mode=mode), target=target)
+    inc = PixelMSEFitness(renderer=renderer, target=target, incremental=True, incremental_max_area=1.0)
+    inc.evaluate(parent)
+    calls.clear()
+
+    mutator = MultiGenLimitedMutation(min_genes=1, max_genes=2, point_sigma=0.02, rng=random.Random(0))
+    # A chain of mutants, each scored from its parent's cached render, must not drift
+    for _ in range(30):
+        child = Individual.derive(mutator.mutate(parent), parent)
+        assert np.isclose(inc.evaluate(child), full.evaluate(child), rtol=1e-5)
+        parent = child
+
+    assert len(calls) == 30
+
+
+def test_derive_records_parent_and_changed_indices():
+    parent = _random_individuals(1, 4)[0]
+    changed = list(parent.triangles)
+    changed[2] = Triangle(p1=(0.0, 0.0), p2=(1.0, 0.0), p3=(0.0, 1.0), color=(1, 2, 3, 4))
+    child = Individual.derive(Individual(changed), parent)
+
+    assert child.parent_uid == parent.uid
+    assert child.changed == frozenset({2})
+    assert child.uid != parent.uid
+
+
+def test_ssim_matches_skimage_for_both_windows():
+    from skimage.metrics import structural_similarity
+    from src.strategies.fitness.SSIMFitness import SSIMFitness
+
+    renderer = PillowRenderer(width=40, height=30)
+    population = _random_individuals(3, 8)
+    target = renderer.render(_random_individuals(1, 8, seed=1)[0].triangles)
+    for window in ("uniform", "gaussian"):
+        fit = SSIMFitness(renderer=renderer, target=target, window=window)
+        for ind in population:
+            img = renderer.render(ind.genes)
+            alpha = img[..., 3:4].astype(np.float32) / 255.0
+            blended = np.rint(img[..., :3].astype(np.float32) * alpha + 255 * (1 - alpha)).astype(np.uint8)
+            expected = structural_similarity(
+                blended, target[..., :3], channel_axis=2, gaussian_weights=window == "gaussian"
+            )
+            assert abs(fit.evaluate(ind) - expected) < 1e-5
+
+
+def test_ssim_rejects_unknown_window():
+    import pytest
+    from src.strategies.fitness.SSIMFitness import SSIMFitness
+
+    renderer = PillowRenderer(width=24, height=16)
+    with pytest.raises(ValueError):
+        SSIMFitness(renderer=renderer, target=renderer.render([]), window="box")
+
+
+def test_pixel_mse_reuses_per_thread_scratch_buffers():
+    import threading
+
+    renderer = PillowRenderer(width=24, height=16)
+    population = _random_individuals(3, 8)
+    target = renderer.render(_random_individuals(1, 8, seed=1)[0].triangles)
+    fit = PixelMSEFitness(renderer=renderer, target=target)
+
+    img = renderer.render(population[0].genes)
+    alpha = img[..., 3:4].astype(np.float64) / 255.0
+    blended = img[..., :3] * alpha + 255 * (1 - alpha)
+    expected = np.mean((blended - target[..., :3]) ** 2) + np.mean(population[0].genes[:, 9] / 255.0)
+    assert np.isclose(fit.evaluate(population[0]), expected, rtol=1e-5)
+
+    buf = fit._scratch.buf
+    fit.evaluate_batch(population)
+    assert fit._scratch.buf is buf
+
+    other = []
+    thread = threading.Thread(target=lambda: (fit.evaluate(population[1]), other.append(fit._scratch.buf)))
+    thread.start()
+    thread.join()
+    assert other[0] is not buf
+
+
+def test_rgb_mode_renders_score_like_rgba_renders():
+    from src.strategies.fitness.SSIMFitness import SSIMFitness
+
+    rgba = PillowRenderer(width=24, height=16, compositing="overlay")
+    rgb = PillowRenderer(width=24, height=16, mode="rgb")
+    population = _random_individuals(4, 8)
+    target = rgba.render(_random_individuals(1, 8, seed=1)[0].triangles)
+    for fit, reference in (
+            (PixelMSEFitness(renderer=rgb, target=target), PixelMSEFitness(renderer=rgba, target=target)),
+            (PixelMSEFitness(renderer=rgb, target=target, incremental=True), PixelMSEFitness(renderer=rgba, target=target)),
+            (SSIMFitness(renderer=rgb, target=target), SSIMFitness(renderer=rgba, target=target)),
+    ):
+        expected = reference.evaluate_batch(population)
+        assert np.allclose(fit.evaluate_batch(population), expected, rtol=1e-6)
+        assert np.allclose([fit.evaluate(ind) for ind in population], expected, rtol=1e-6)
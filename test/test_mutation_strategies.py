@@ -2,10 +2,16 @@ import os
 import sys
 import random
 
+import numpy as np
+import pytest
+
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 from src.models.triangle import Triangle
 from src.models.individual import Individual
+from src.strategies.mutation.GenMutation import GenMutation
 from src.strategies.mutation.MultiGenLimitedMutation import MultiGenLimitedMutation
+from src.strategies.mutation.NonUniform import NonUniform
+from src.strategies.mutation.UniformMutation import UniformMutation
 
 
 def _make_triangle(idx: int) -> Triangle:
@@ -75,4 +81,66 @@ def test_multigen_mutation_handles_edge_cases():
     mutated_single = MultiGenLimitedMutation(min_genes=1, max_genes=1).mutate(single)
     assert len(mutated_single.triangles) == 1
     # Should be mutated (different from original)
-    assert mutated_single.triangles[0] != single.triangles[0]
\ No newline at end of file
+    assert mutated_single.triangles[0] != single.triangles[0]
+
+
+def _random_parent(n: int, seed: int) -> Individual:
+    rng = random.Random(seed)
+    return Individual([
+        Triangle(
+            (rng.random(), rng.random()), (rng.random(), rng.random()), (rng.random(), rng.random()),
+            (rng.randint(0, 255), rng.randint(0, 255), rng.randint(0, 255), rng.randint(0, 255)),
+            rng.random(),
+        )
+        for _ in range(n)
+    ])
+
+
+@pytest.mark.parametrize(
+    "make_mutator",
+    [
+        lambda rng: GenMutation(rng=rng),
+        lambda rng: UniformMutation(point_rate=0.3, color_rate=0.3, swap_rate=0.0, rng=rng),
+        lambda rng: MultiGenLimitedMutation(min_genes=2, max_genes=4, rng=rng),
+        lambda rng: NonUniform(progress=0.3, rng=rng),
+    ],
+)
+def test_mutate_batch_matches_scalar_distribution(make_mutator):
+    """Per-allele change rate and mean absolute change agree between ``mutate`` and ``mutate_batch``."""
+    parent = _random_parent(12, seed=3)
+    samples = 2000
+    scalar_mutator = make_mutator(random.Random(0))
+    scalar = np.stack([scalar_mutator.mutate(parent).genes for _ in range(samples)])
+    genomes = np.repeat(parent.genes[None], samples, axis=0)
+    batch = make_mutator(random.Random(0)).mutate_batch(genomes, np.random.default_rng(0))
+
+    assert batch.shape == genomes.shape and batch.dtype == np.float32
+    assert np.array_equal(genomes[0], parent.genes)  # input untouched
+    assert batch[..., :6].min() >= 0.0 and batch[..., :6].max() <= 1.0
+    assert np.array_equal(batch[..., 6:10], np.clip(np.rint(batch[..., 6:10]), 0, 255))
+
+    scalar_delta = np.abs(scalar - parent.genes).reshape(samples, -1)
+    batch_delta = np.abs(batch - parent.genes).reshape(samples, -1)
+    np.testing.assert_allclose((batch_delta > 0).mean(axis=0), (scalar_delta > 0).mean(axis=0), atol=0.05)
+    scale = np.tile([1.0] * 6 + [255.0] * 4 + [1.0], 12)
+    np.testing.assert_allclose(batch_delta.mean(axis=0) / scale, scalar_delta.mean(axis=0) / scale, atol=0.01)
+
+
+def test_uniform_mutate_batch_swaps_triangles():
+    parent = _random_parent(6, seed=5)
+    genomes = np.repeat(parent.genes[None], 50, axis=0)
+    mutator = UniformMutation(point_rate=0.0, color_rate=0.0, swap_rate=1.0)
+    batch = mutator.mutate_batch(genomes, np.random.default_rng(1))
+    # Only whole triangles move: each genome is a permutation of the parent's rows
+    for genome in batch:
+        assert sorted(map(tuple, genome.tolist())) == sorted(map(tuple, parent.genes.tolist()))
+    assert any(not np.array_equal(genome, parent.genes) for genome in batch)
+
+
+def test_multigen_mutate_batch_respects_min_max_genes():
+    parent = _random_parent(10, seed=9)
+    genomes = np.repeat(parent.genes[None], 200, axis=0)
+    batch = MultiGenLimitedMutation(min_genes=2, max_genes=3).mutate_batch(genomes, np.random.default_rng(2))
+    changed = (batch != parent.genes).any(axis=2).sum(axis=1)
+    assert changed.min() >= 2 and changed.max() <= 3
+    assert MultiGenLimitedMutation().mutate_batch(np.empty((4, 0, 11), np.float32), np.random.default_rng()).shape == (4, 0, 11)
@@ -0,0 +1,63 @@
+import pickle
+import random
+
+import numpy as np
+
+from src.models.individual import Individual
+from src.models.population import PopulationArray
+from src.models.triangle import GENE_SIZE, Triangle
+
+
+def _individual(rng: random.Random, n: int) -> Individual:
+    return Individual([
+        Triangle(
+            p1=(rng.random(), rng.random()),
+            p2=(rng.random(), rng.random()),
+            p3=(rng.random(), rng.random()),
+            color=tuple(rng.randint(0, 255) for _ in range(4)),
+            z_index=rng.random(),
+        )
+        for _ in range(n)
+    ])
+
+
+def test_from_individuals_packs_rows_and_members_view_them():
+    rng = random.Random(0)
+    population = [_individual(rng, 5) for _ in range(4)]
+    uids = [ind.uid for ind in population]
+
+    pop = PopulationArray.from_individuals(population)
+
+    assert pop.genes.shape == (4, 5, GENE_SIZE)
+    assert pop.genes.dtype == np.float32 and pop.genes.flags.c_contiguous
+    assert [ind.uid for ind in pop] == uids
+    for i, ind in enumerate(pop):
+        assert np.shares_memory(ind.genes, pop.genes)
+        assert np.array_equal(ind.genes, pop.genes[i])
+
+
+def test_triangles_adapter_round_trips_gene_rows():
+    tri = Triangle(p1=(0.25, 0.5), p2=(1.0, 0.0), p3=(0.0, 0.75), color=(10, 20, 30, 40), z_index=0.5)
+    ind = Individual(genes=np.array([Triangle.to_gene(tri)], dtype=np.float32))
+
+    assert ind.triangles == [tri]
+    assert isinstance(ind.triangles[0].color[0], int)
+
+
+def test_from_genes_creates_fresh_individuals():
+    genes = np.zeros((3, 2, GENE_SIZE), dtype=np.float32)
+    pop = PopulationArray.from_genes(genes)
+
+    assert len(pop) == 3 and pop.num_triangles == 2
+    assert len({ind.uid for ind in pop}) == 3
+
+
+def test_pickle_ships_only_genes_and_lineage():
+    rng = random.Random(1)
+    parent = _individual(rng, 3)
+    child = Individual.derive(_individual(rng, 3), parent)
+    child.triangles  # materialize the adapter cache
+
+    restored = pickle.loads(pickle.dumps(child))
+    assert restored == child
+    assert (restored.uid, restored.parent_uid, restored.changed) == (child.uid, child.parent_uid, child.changed)
@@ -0,0 +1,45 @@
+from pathlib import Path
+
+import pytest
+import yaml
+
+from src.engine.renderers import _RENDERERS, build_renderer_from_config
+
+CONFIGS = sorted((Path(__file__).parent.parent / "configs").glob("*.yaml"))
+
+
+@pytest.mark.parametrize("config", CONFIGS, ids=lambda p: p.name)
+@pytest.mark.parametrize("backend", sorted(_RENDERERS))
+def test_every_backend_builds_from_the_shipped_configs(config, backend):
+    entry = {**yaml.safe_load(config.read_text())["renderer"], "backend": backend}
+
+    renderer = build_renderer_from_config(entry, 16, 12)
+
+    assert isinstance(renderer, _RENDERERS[backend])
+    assert renderer.render([]).shape[:2] == (12, 16)
+
+
+def test_unknown_backend():
+    with pytest.raises(ValueError):
+        build_renderer_from_config({"backend": "cairo"}, 16, 12)
+
+
+@pytest.mark.parametrize("mode", ["rgba", "rgb"])
+def test_write_output_saves_float32_renders(tmp_path, mode):
+    import numpy as np
+    from PIL import Image
+
+    from src.engine.NumpyRenderer import NumpyRenderer
+    from src.main import write_output
+    from src.models.individual import Individual
+    from src.utils.metrics import GAMetrics
+
+    renderer = NumpyRenderer(width=16, height=12, dtype="float32", mode=mode)
+    best = Individual(genes=np.array([[0.1, 0.1, 0.9, 0.2, 0.5, 0.9, 200, 30, 30, 128, 0.5]], dtype=np.float32))
+    metrics = GAMetrics(min_fitnesses=[1.0], max_fitnesses=[1.0])
+
+    write_output({"ga": {"maximize": False}}, best, metrics, 0.1, tmp_path, renderer)
+
+    saved = np.asarray(Image.open(tmp_path / "best.png"))
+    assert saved.dtype == np.uint8
+    assert np.abs(saved.astype(float) - renderer.render(best.genes)).max() <= 0.5
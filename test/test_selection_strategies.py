@@ -0,0 +1,70 @@
+import os
+import sys
+import random
+
+import numpy as np
+import pytest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from src.strategies.selection.BoltzmannSelection import BoltzmannSelection
+from src.strategies.selection.EliteSelection import EliteSelection
+from src.strategies.selection.ProbTournamentSelection import ProbTournamentSelection
+from src.strategies.selection.RankingSelection import RankingSelection
+from src.strategies.selection.RouletteSelection import RouletteSelection
+from src.strategies.selection.TournamentSelection import TournamentSelection
+from src.strategies.selection.UniversalSelection import UniversalSelection
+
+FITNESS = [1.0, 0.0, 3.0, 6.0]
+
+
+def _frequencies(indices, n):
+    return np.bincount(indices, minlength=n) / len(indices)
+
+
+def test_roulette_selection_is_proportional_to_fitness():
+    selected = RouletteSelection(rng=random.Random(0)).select(FITNESS, 20000)
+    np.testing.assert_allclose(_frequencies(selected, 4), np.array(FITNESS) / 10, atol=0.01)
+
+
+def test_universal_selection_has_exact_expected_counts():
+    selected = UniversalSelection(rng=random.Random(1)).select(FITNESS, 10)
+    assert np.bincount(selected, minlength=4).tolist() == [1, 0, 3, 6]
+    assert UniversalSelection().select(FITNESS, 0) == []
+
+
+def test_elite_selection_takes_best_first():
+    assert EliteSelection().select([2.0, 5.0, 2.0, 9.0], 3) == [3, 1, 0]
+
+
+def test_tournament_selection_matches_order_statistics():
+    # With distinct contestants, index i wins a tournament of 2 with probability (2i) / (n (n - 1))
+    n = 5
+    selected = TournamentSelection(tournament_size=2, rng=random.Random(2)).select(list(range(n)), 20000)
+    np.testing.assert_allclose(_frequencies(selected, n), [2 * i / (n * (n - 1)) for i in range(n)], atol=0.01)
+    assert TournamentSelection(tournament_size=n).select(list(range(n)), 5) == [n - 1] * 5
+    with pytest.raises(ValueError):
+        TournamentSelection(tournament_size=n + 1).select(list(range(n)), 1)
+
+
+def test_prob_tournament_selection_picks_best_with_threshold():
+    selected = ProbTournamentSelection(threshold=0.75, rng=random.Random(3)).select([0.0, 1.0], 20000)
+    assert abs(np.mean(selected) - 0.75) < 0.01
+
+
+@pytest.mark.parametrize(
+    "make_selection",
+    [
+        lambda rng: RouletteSelection(rng=rng),
+        lambda rng: UniversalSelection(rng=rng),
+        lambda rng: TournamentSelection(rng=rng),
+        lambda rng: ProbTournamentSelection(rng=rng),
+        lambda rng: RankingSelection(rng=rng),
+        lambda rng: BoltzmannSelection(rng=rng),
+    ],
+)
+def test_selection_is_reproducible_from_rng(make_selection):
+    fitness = [float(f) for f in range(1, 21)]
+    first = make_selection(random.Random(5)).select(fitness, 50)
+    second = make_selection(random.Random(5)).select(fitness, 50)
+    assert first == second
+    assert len(first) == 50 and all(isinstance(i, int) and 0 <= i < 20 for i in first)